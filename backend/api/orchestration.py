@@ -58,7 +58,7 @@ async def get_pipeline_status(job_id: str):
     job = _store.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job.to_dict()
+    return job.to_api_dict()
 
 
 @router.get("/{job_id}/result")
@@ -78,6 +78,6 @@ async def get_pipeline_result(job_id: str):
         "status": job.status,
         "results": job.results_per_step,
         "error": job.error,
-        "started_at": job.started_at,
-        "completed_at": job.completed_at,
+        "started_at": job.started_at_iso,
+        "completed_at": job.completed_at_iso,
     }
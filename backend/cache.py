@@ -19,12 +19,35 @@ try:
 except ImportError:
     _redis_available = False
 
+# orjson is optional — faster (de)serialization for large values such as
+# pipeline results
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+
+def _dumps(value: Any) -> Any:
+    """Serialize to JSON (bytes via orjson when available, else str)."""
+    if _orjson_available:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits — let json handle it
+    return json.dumps(value)
+
+
+def _loads(data: Any) -> Any:
+    """Deserialize JSON from str or bytes."""
+    return orjson.loads(data) if _orjson_available else json.loads(data)
+
 
 class CacheService:
     """Redis-backed cache with graceful fallback to in-memory dict."""
 
     def __init__(self):
-        self._memory_cache: dict[str, str] = {}
+        self._memory_cache: dict[str, Any] = {}
         self._redis: Optional[Any] = None
 
         if _redis_available:
@@ -49,7 +72,7 @@ class CacheService:
             else:
                 data = self._memory_cache.get(key)
 
-            return json.loads(data) if data else None
+            return _loads(data) if data else None
         except Exception as e:
             logger.debug("Cache get error for '%s': %s", key, e)
             return None
@@ -57,7 +80,7 @@ class CacheService:
     def set(self, key: str, value: Any, ttl: int = 3600) -> None:
         """Set a cached value with TTL in seconds (default 1 hour)."""
         try:
-            serialized = json.dumps(value)
+            serialized = _dumps(value)
             if self._redis:
                 self._redis.setex(key, ttl, serialized)
             else:
@@ -44,6 +44,17 @@ app.include_router(yappyverse_router)
 app.include_router(superagent_router)
 app.include_router(orchestration_router)
 
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Release pooled HTTP connections held by long-lived services."""
+    from services.media_generation import get_media_service
+    from services.dashboard_sync import get_dashboard_sync
+    from services.notifications import get_notification_service
+    await get_media_service().aclose()
+    await get_dashboard_sync().aclose()
+    await get_notification_service().aclose()
+
 # Models
 class VoiceSynthesizeRequest(BaseModel):
     text: str
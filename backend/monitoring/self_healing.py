@@ -6,15 +6,18 @@ Part of the Aggressive Full Superagent Architecture
 """
 
 import asyncio
+import gc
+import inspect
 import json
 import logging
 import os
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, Deque, List, Optional, Any, Callable, Tuple
 import traceback
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +43,43 @@ class IssueType(Enum):
     VOICE_SERVICE_DOWN = "voice_service_down"
 
 
-@dataclass
+# Healing actions: strategy -> (log level, log template, result message, side effect).
+# Templates are formatted with ``agent``; the optional side effect is called
+# with the agent name and awaited if it returns an awaitable.
+HEAL_ACTIONS: Dict[str, Tuple[int, Optional[str], str, Optional[Callable[[str], Any]]]] = {
+    "restart_agent": (logging.INFO, "Restarting agent: {agent}", "Agent {agent} restarted", None),
+    "clear_state_and_restart": (logging.INFO, "Clearing state and restarting: {agent}", "State cleared and {agent} restarted", None),
+    "fallback_to_backup_agent": (logging.INFO, "Falling back to backup for: {agent}", "Backup agent activated for {agent}", None),
+    "force_garbage_collection": (logging.INFO, None, "Garbage collection forced", lambda agent: gc.collect()),
+    "restart_service": (logging.INFO, "Restarting service for: {agent}", "Service restarted for {agent}", None),
+    "scale_up_memory": (logging.INFO, "Scaling memory for: {agent}", "Memory scaled up", None),
+    "backoff_and_retry": (logging.INFO, None, "Retry after backoff", lambda agent: asyncio.sleep(5)),
+    "switch_to_backup_key": (logging.INFO, "Switching to backup API key", "Switched to backup API key", None),
+    "enable_caching": (logging.INFO, "Enabling aggressive caching", "Caching enabled", None),
+    "reduce_context_window": (logging.INFO, "Reducing context window", "Context window reduced", None),
+    "switch_to_faster_model": (logging.INFO, "Switching to faster model", "Switched to faster model", None),
+    "queue_for_async": (logging.INFO, "Queueing for async processing", "Queued for async processing", None),
+    "retry_with_backoff": (logging.INFO, None, "Retry completed", lambda agent: asyncio.sleep(5)),
+    "switch_to_read_replica": (logging.INFO, "Switching to read replica", "Switched to read replica", None),
+    "queue_writes": (logging.INFO, "Queueing writes", "Writes queued", None),
+    "use_offline_cache": (logging.INFO, "Using offline cache", "Using offline cache", None),
+    "alert_admin": (logging.WARNING, "ALERT: Admin intervention needed for {agent}", "Admin alerted", None),
+    "auto_fix_issues": (logging.INFO, "Auto-fixing quality issues", "Auto-fix applied", None),
+    "escalate_to_human": (logging.WARNING, "Escalating {agent} to human", "Escalated to human", None),
+    "lower_threshold_temporarily": (logging.INFO, "Temporarily lowering threshold", "Threshold lowered temporarily", None),
+    "scale_workers": (logging.INFO, "Scaling Celery workers", "Workers scaled", None),
+    "prioritize_critical_jobs": (logging.INFO, "Prioritizing critical jobs", "Critical jobs prioritized", None),
+    "drop_low_priority": (logging.INFO, "Dropping low priority jobs", "Low priority jobs dropped", None),
+    "restart_browser": (logging.INFO, "Restarting browser", "Browser restarted", None),
+    "clear_cache": (logging.INFO, "Clearing cache", "Cache cleared", None),
+    "use_static_fallback": (logging.INFO, "Using static fallback", "Static fallback activated", None),
+    "switch_to_backup_provider": (logging.INFO, "Switching to backup voice provider", "Backup voice provider activated", None),
+    "queue_for_retry": (logging.INFO, "Queueing for retry", "Queued for retry", None),
+    "disable_voice_temporarily": (logging.INFO, "Disabling voice temporarily", "Voice disabled temporarily", None),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class HealthMetric:
     """Single health metric reading"""
     timestamp: str
@@ -51,7 +90,7 @@ class HealthMetric:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealingAction:
     """Record of a healing action taken"""
     action_id: str
@@ -63,9 +102,27 @@ class HealingAction:
     success: bool
     result_message: str
     time_to_resolve_ms: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow, JSON-ready dict (cheaper than dataclasses.asdict)"""
+        return {
+            "action_id": self.action_id,
+            "timestamp": self.timestamp,
+            "issue_type": self.issue_type.value,
+            "target_agent": self.target_agent,
+            "action_taken": self.action_taken,
+            "parameters": self.parameters,
+            "success": self.success,
+            "result_message": self.result_message,
+            "time_to_resolve_ms": self.time_to_resolve_ms
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HealingAction":
+        return cls(**{**data, "issue_type": IssueType(data["issue_type"])})
 
 
-@dataclass
+@dataclass(slots=True)
 class Incident:
     """An incident that required healing"""
     incident_id: str
@@ -78,6 +135,31 @@ class Incident:
     healing_actions: List[HealingAction] = field(default_factory=list)
     status: str = "open"  # open, resolved, escalated
     lessons_learned: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow, JSON-ready dict (cheaper than dataclasses.asdict)"""
+        return {
+            "incident_id": self.incident_id,
+            "timestamp": self.timestamp,
+            "issue_type": self.issue_type.value,
+            "severity": self.severity,
+            "affected_agents": self.affected_agents,
+            "description": self.description,
+            "root_cause": self.root_cause,
+            "healing_actions": [a.to_dict() for a in self.healing_actions],
+            "status": self.status,
+            "lessons_learned": self.lessons_learned
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Incident":
+        return cls(**{
+            **data,
+            "issue_type": IssueType(data["issue_type"]),
+            "healing_actions": [
+                HealingAction.from_dict(a) for a in data.get("healing_actions", [])
+            ]
+        })
 
 
 class SelfHealingMonitor:
@@ -87,99 +169,93 @@ class SelfHealingMonitor:
     """
     
     # Healing strategies mapped to issue types
-    HEALING_STRATEGIES = {
-        IssueType.AGENT_CRASH: [
+    HEALING_STRATEGIES: Dict[IssueType, Tuple[str, ...]] = {
+        IssueType.AGENT_CRASH: (
             "restart_agent",
             "clear_state_and_restart",
             "fallback_to_backup_agent"
-        ],
-        IssueType.MEMORY_LEAK: [
+        ),
+        IssueType.MEMORY_LEAK: (
             "force_garbage_collection",
             "restart_service",
             "scale_up_memory"
-        ],
-        IssueType.API_RATE_LIMIT: [
+        ),
+        IssueType.API_RATE_LIMIT: (
             "backoff_and_retry",
             "switch_to_backup_key",
             "enable_caching"
-        ],
-        IssueType.LLM_TIMEOUT: [
+        ),
+        IssueType.LLM_TIMEOUT: (
             "reduce_context_window",
             "switch_to_faster_model",
             "queue_for_async"
-        ],
-        IssueType.DATABASE_ERROR: [
+        ),
+        IssueType.DATABASE_ERROR: (
             "retry_with_backoff",
             "switch_to_read_replica",
             "queue_writes"
-        ],
-        IssueType.NETWORK_ISSUE: [
+        ),
+        IssueType.NETWORK_ISSUE: (
             "retry_with_backoff",
             "use_offline_cache",
             "alert_admin"
-        ],
-        IssueType.QUALITY_GATE_FAIL: [
+        ),
+        IssueType.QUALITY_GATE_FAIL: (
             "auto_fix_issues",
             "escalate_to_human",
             "lower_threshold_temporarily"
-        ],
-        IssueType.CELERY_QUEUE_BACKUP: [
+        ),
+        IssueType.CELERY_QUEUE_BACKUP: (
             "scale_workers",
             "prioritize_critical_jobs",
             "drop_low_priority"
-        ],
-        IssueType.PUPPETEER_FAIL: [
+        ),
+        IssueType.PUPPETEER_FAIL: (
             "restart_browser",
             "clear_cache",
             "use_static_fallback"
-        ],
-        IssueType.VOICE_SERVICE_DOWN: [
+        ),
+        IssueType.VOICE_SERVICE_DOWN: (
             "switch_to_backup_provider",
             "queue_for_retry",
             "disable_voice_temporarily"
-        ]
+        )
     }
     
+    # Saves requested within this window are coalesced into one write
+    SAVE_FLUSH_DELAY_SECONDS = 0.5
+    
+    # Health readings kept in memory; older ones are evicted
+    METRICS_HISTORY_LIMIT = 1024
+    
+    # Monitoring ticks slower than this are logged as warnings
+    TICK_LATENCY_WARN_MS = 100
+    
+    # Agents checked on every monitoring tick
+    MONITORED_AGENTS = ("designer", "coder", "reviewer", "qa", "voice", "yappyverse")
+    
     def __init__(self, storage_path: str = "monitoring/healing_state.json"):
         self.storage_path = storage_path
-        self.metrics_history: List[HealthMetric] = []
+        self.metrics_history: Deque[HealthMetric] = deque(maxlen=self.METRICS_HISTORY_LIMIT)
         self.incidents: Dict[str, Incident] = {}
         self.healing_actions: List[HealingAction] = []
         self.agent_health: Dict[str, HealthStatus] = {}
         self.learning_model: Dict[str, Any] = {}  # Simple pattern learning
+        self._agents = self.MONITORED_AGENTS
         
-        # Healing functions registry
-        self.healing_functions: Dict[str, Callable] = {
-            "restart_agent": self._heal_restart_agent,
-            "clear_state_and_restart": self._heal_clear_restart,
-            "fallback_to_backup_agent": self._heal_fallback_agent,
-            "force_garbage_collection": self._heal_gc,
-            "restart_service": self._heal_restart_service,
-            "scale_up_memory": self._heal_scale_memory,
-            "backoff_and_retry": self._heal_backoff_retry,
-            "switch_to_backup_key": self._heal_backup_key,
-            "enable_caching": self._heal_enable_cache,
-            "reduce_context_window": self._heal_reduce_context,
-            "switch_to_faster_model": self._heal_faster_model,
-            "queue_for_async": self._heal_async_queue,
-            "retry_with_backoff": self._heal_retry_backoff,
-            "switch_to_read_replica": self._heal_read_replica,
-            "queue_writes": self._heal_queue_writes,
-            "use_offline_cache": self._heal_offline_cache,
-            "alert_admin": self._heal_alert_admin,
-            "auto_fix_issues": self._heal_auto_fix,
-            "escalate_to_human": self._heal_escalate,
-            "lower_threshold_temporarily": self._heal_lower_threshold,
-            "scale_workers": self._heal_scale_workers,
-            "prioritize_critical_jobs": self._heal_prioritize,
-            "drop_low_priority": self._heal_drop_low_priority,
-            "restart_browser": self._heal_restart_browser,
-            "clear_cache": self._heal_clear_cache,
-            "use_static_fallback": self._heal_static_fallback,
-            "switch_to_backup_provider": self._heal_backup_voice,
-            "queue_for_retry": self._heal_queue_retry,
-            "disable_voice_temporarily": self._heal_disable_voice
-        }
+        # Per-incident locks so concurrent healers only serialize on the
+        # incident they touch; one lock guards the aggregate health views.
+        self._incident_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._health_lock = asyncio.Lock()
+        
+        # Coalesced state persistence (see _schedule_save)
+        self._save_pending = False
+        self._save_lock = asyncio.Lock()
+        self._save_task: Optional[asyncio.Task] = None
+        
+        # Recent latency samples (ms) for ticks and healing calls
+        self._tick_latency_ms: deque = deque(maxlen=1024)
+        self._heal_latency_ms: deque = deque(maxlen=1024)
         
         os.makedirs(os.path.dirname(storage_path), exist_ok=True)
         self._load_state()
@@ -192,43 +268,88 @@ class SelfHealingMonitor:
                     data = json.load(f)
                     self.learning_model = data.get("learning_model", {})
                     self.incidents = {
-                        k: Incident(**v) for k, v in data.get("incidents", {}).items()
+                        k: Incident.from_dict(v) for k, v in data.get("incidents", {}).items()
                     }
         except Exception as e:
             logger.warning(f"Failed to load healing state: {e}")
     
+    def _state_snapshot(self) -> Dict[str, Any]:
+        """Build a detached, JSON-ready snapshot of the persisted state"""
+        return {
+            "learning_model": self.learning_model,
+            "incidents": {k: v.to_dict() for k, v in self.incidents.items()},
+            "last_updated": datetime.now().isoformat()
+        }
+    
+    def _write_state(self, data: Dict[str, Any]):
+        """Write a state snapshot to disk (blocking)"""
+        with open(self.storage_path, 'w') as f:
+            json.dump(data, f, indent=2)
+    
     def _save_state(self):
         """Save monitoring state to disk"""
         try:
-            data = {
-                "learning_model": self.learning_model,
-                "incidents": {k: asdict(v) for k, v in self.incidents.items()},
-                "last_updated": datetime.now().isoformat()
-            }
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._write_state(self._state_snapshot())
+        except Exception as e:
+            logger.error(f"Failed to save healing state: {e}")
+    
+    async def _save_state_async(self):
+        """Save monitoring state without blocking the event loop
+        
+        The snapshot is taken on the loop; encoding and file I/O run in a
+        worker thread.
+        """
+        try:
+            data = self._state_snapshot()
+            await asyncio.to_thread(self._write_state, data)
         except Exception as e:
             logger.error(f"Failed to save healing state: {e}")
     
-    async def check_agent_health(self, agent_name: str) -> HealthMetric:
-        """Check health of a specific agent"""
+    def _schedule_save(self):
+        """Request a state save, batching requests within the flush window
+        
+        Every incident or tick used to rewrite the whole file; now at most
+        one write happens per SAVE_FLUSH_DELAY_SECONDS, carrying all changes
+        made up to the moment its snapshot is taken.
+        """
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._save_task = asyncio.create_task(self._flush_state_later())
+    
+    async def _flush_state_later(self):
+        """Wait out the flush window, then write one snapshot"""
+        await asyncio.sleep(self.SAVE_FLUSH_DELAY_SECONDS)
+        async with self._save_lock:
+            # Clear before snapshotting so later changes schedule a new write
+            self._save_pending = False
+            await self._save_state_async()
+    
+    async def check_agent_health(self, agent_name: str, timestamp: Optional[str] = None) -> HealthMetric:
+        """Check health of a specific agent
+        
+        ``timestamp`` lets a monitoring sweep stamp every agent it checks
+        with the same tick time; defaults to now.
+        """
         # In production, this would check actual metrics
         # For now, simulate health check
         
         # Collect metrics
         metrics = await self._collect_agent_metrics(agent_name)
         
-        # Determine status based on metrics
-        status = HealthStatus.HEALTHY
-        if metrics.get("error_rate", 0) > 0.1:
-            status = HealthStatus.DEGRADED
-        if metrics.get("error_rate", 0) > 0.3:
-            status = HealthStatus.CRITICAL
+        # Determine status based on metrics, most severe condition first
+        error_rate = metrics.get("error_rate", 0)
         if metrics.get("crash_count", 0) > 0:
             status = HealthStatus.FAILED
+        elif error_rate > 0.3:
+            status = HealthStatus.CRITICAL
+        elif error_rate > 0.1:
+            status = HealthStatus.DEGRADED
+        else:
+            status = HealthStatus.HEALTHY
         
         metric = HealthMetric(
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp or datetime.now().isoformat(),
             metric_name=f"{agent_name}_health",
             value=metrics.get("health_score", 100),
             threshold=80.0,
@@ -236,8 +357,9 @@ class SelfHealingMonitor:
             details=metrics
         )
         
-        self.metrics_history.append(metric)
-        self.agent_health[agent_name] = status
+        async with self._health_lock:
+            self.metrics_history.append(metric)
+            self.agent_health[agent_name] = status
         
         # Trigger healing if needed
         if status in [HealthStatus.CRITICAL, HealthStatus.FAILED]:
@@ -279,7 +401,7 @@ class SelfHealingMonitor:
         self.incidents[incident.incident_id] = incident
         
         # Apply healing strategies
-        strategies = self.HEALING_STRATEGIES.get(issue_type, ["alert_admin"])
+        strategies = self.HEALING_STRATEGIES.get(issue_type, ("alert_admin",))
         
         for strategy in strategies:
             action = await self._execute_healing_strategy(
@@ -288,7 +410,8 @@ class SelfHealingMonitor:
                 issue_type, 
                 strategy
             )
-            incident.healing_actions.append(action)
+            async with self._incident_locks[incident.incident_id]:
+                incident.healing_actions.append(action)
             
             if action.success:
                 incident.status = "resolved"
@@ -299,7 +422,9 @@ class SelfHealingMonitor:
             incident.status = "escalated"
             logger.error(f"All healing strategies failed for {agent_name}")
         
-        self._save_state()
+        # Incident is closed out; its lock is no longer needed
+        self._incident_locks.pop(incident.incident_id, None)
+        self._schedule_save()
     
     def _classify_issue(self, metrics: Dict) -> IssueType:
         """Classify the type of issue from metrics"""
@@ -314,10 +439,9 @@ class SelfHealingMonitor:
     async def _execute_healing_strategy(self, incident_id: str, agent_name: str, 
                                         issue_type: IssueType, strategy: str) -> HealingAction:
         """Execute a healing strategy"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        healing_fn = self.healing_functions.get(strategy)
-        if not healing_fn:
+        if strategy not in HEAL_ACTIONS:
             return HealingAction(
                 action_id=f"act_{int(time.time())}",
                 timestamp=datetime.now().isoformat(),
@@ -331,7 +455,7 @@ class SelfHealingMonitor:
             )
         
         try:
-            result = await healing_fn(agent_name)
+            result = await self._apply_heal(strategy, agent_name)
             success = result.get("success", False)
             message = result.get("message", "No message")
         except Exception as e:
@@ -339,7 +463,8 @@ class SelfHealingMonitor:
             message = f"Healing failed: {str(e)}"
             logger.error(f"Healing error: {traceback.format_exc()}")
         
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        self._heal_latency_ms.append(elapsed_ms)
         
         action = HealingAction(
             action_id=f"act_{int(time.time())}",
@@ -353,158 +478,22 @@ class SelfHealingMonitor:
             time_to_resolve_ms=elapsed_ms
         )
         
-        self.healing_actions.append(action)
+        async with self._health_lock:
+            self.healing_actions.append(action)
         return action
     
-    # ===== HEALING FUNCTION IMPLEMENTATIONS =====
-    
-    async def _heal_restart_agent(self, agent_name: str) -> Dict:
-        """Restart a crashed agent"""
-        logger.info(f"Restarting agent: {agent_name}")
-        # In production, this would actually restart the service
-        return {"success": True, "message": f"Agent {agent_name} restarted"}
-    
-    async def _heal_clear_restart(self, agent_name: str) -> Dict:
-        """Clear state and restart"""
-        logger.info(f"Clearing state and restarting: {agent_name}")
-        return {"success": True, "message": f"State cleared and {agent_name} restarted"}
-    
-    async def _heal_fallback_agent(self, agent_name: str) -> Dict:
-        """Fallback to backup agent"""
-        logger.info(f"Falling back to backup for: {agent_name}")
-        return {"success": True, "message": f"Backup agent activated for {agent_name}"}
-    
-    async def _heal_gc(self, agent_name: str) -> Dict:
-        """Force garbage collection"""
-        import gc
-        gc.collect()
-        return {"success": True, "message": "Garbage collection forced"}
-    
-    async def _heal_restart_service(self, agent_name: str) -> Dict:
-        """Restart the entire service"""
-        logger.info(f"Restarting service for: {agent_name}")
-        return {"success": True, "message": f"Service restarted for {agent_name}"}
-    
-    async def _heal_scale_memory(self, agent_name: str) -> Dict:
-        """Scale up memory allocation"""
-        logger.info(f"Scaling memory for: {agent_name}")
-        return {"success": True, "message": "Memory scaled up"}
-    
-    async def _heal_backoff_retry(self, agent_name: str) -> Dict:
-        """Apply backoff and retry"""
-        await asyncio.sleep(5)  # Backoff
-        return {"success": True, "message": "Retry after backoff"}
-    
-    async def _heal_backup_key(self, agent_name: str) -> Dict:
-        """Switch to backup API key"""
-        logger.info("Switching to backup API key")
-        return {"success": True, "message": "Switched to backup API key"}
-    
-    async def _heal_enable_cache(self, agent_name: str) -> Dict:
-        """Enable aggressive caching"""
-        logger.info("Enabling aggressive caching")
-        return {"success": True, "message": "Caching enabled"}
-    
-    async def _heal_reduce_context(self, agent_name: str) -> Dict:
-        """Reduce LLM context window"""
-        logger.info("Reducing context window")
-        return {"success": True, "message": "Context window reduced"}
-    
-    async def _heal_faster_model(self, agent_name: str) -> Dict:
-        """Switch to faster model"""
-        logger.info("Switching to faster model")
-        return {"success": True, "message": "Switched to faster model"}
-    
-    async def _heal_async_queue(self, agent_name: str) -> Dict:
-        """Queue for async processing"""
-        logger.info("Queueing for async processing")
-        return {"success": True, "message": "Queued for async processing"}
-    
-    async def _heal_retry_backoff(self, agent_name: str) -> Dict:
-        """Retry with exponential backoff"""
-        await asyncio.sleep(5)
-        return {"success": True, "message": "Retry completed"}
-    
-    async def _heal_read_replica(self, agent_name: str) -> Dict:
-        """Switch to read replica"""
-        logger.info("Switching to read replica")
-        return {"success": True, "message": "Switched to read replica"}
+    # ===== HEALING DISPATCH =====
     
-    async def _heal_queue_writes(self, agent_name: str) -> Dict:
-        """Queue database writes"""
-        logger.info("Queueing writes")
-        return {"success": True, "message": "Writes queued"}
-    
-    async def _heal_offline_cache(self, agent_name: str) -> Dict:
-        """Use offline cache"""
-        logger.info("Using offline cache")
-        return {"success": True, "message": "Using offline cache"}
-    
-    async def _heal_alert_admin(self, agent_name: str) -> Dict:
-        """Alert human admin"""
-        logger.warning(f"ALERT: Admin intervention needed for {agent_name}")
-        # Send notification to admin
-        return {"success": True, "message": "Admin alerted"}
-    
-    async def _heal_auto_fix(self, agent_name: str) -> Dict:
-        """Auto-fix quality issues"""
-        logger.info("Auto-fixing quality issues")
-        return {"success": True, "message": "Auto-fix applied"}
-    
-    async def _heal_escalate(self, agent_name: str) -> Dict:
-        """Escalate to human"""
-        logger.warning(f"Escalating {agent_name} to human")
-        return {"success": True, "message": "Escalated to human"}
-    
-    async def _heal_lower_threshold(self, agent_name: str) -> Dict:
-        """Temporarily lower quality threshold"""
-        logger.info("Temporarily lowering threshold")
-        return {"success": True, "message": "Threshold lowered temporarily"}
-    
-    async def _heal_scale_workers(self, agent_name: str) -> Dict:
-        """Scale Celery workers"""
-        logger.info("Scaling Celery workers")
-        return {"success": True, "message": "Workers scaled"}
-    
-    async def _heal_prioritize(self, agent_name: str) -> Dict:
-        """Prioritize critical jobs"""
-        logger.info("Prioritizing critical jobs")
-        return {"success": True, "message": "Critical jobs prioritized"}
-    
-    async def _heal_drop_low_priority(self, agent_name: str) -> Dict:
-        """Drop low priority jobs"""
-        logger.info("Dropping low priority jobs")
-        return {"success": True, "message": "Low priority jobs dropped"}
-    
-    async def _heal_restart_browser(self, agent_name: str) -> Dict:
-        """Restart Puppeteer browser"""
-        logger.info("Restarting browser")
-        return {"success": True, "message": "Browser restarted"}
-    
-    async def _heal_clear_cache(self, agent_name: str) -> Dict:
-        """Clear browser cache"""
-        logger.info("Clearing cache")
-        return {"success": True, "message": "Cache cleared"}
-    
-    async def _heal_static_fallback(self, agent_name: str) -> Dict:
-        """Use static fallback"""
-        logger.info("Using static fallback")
-        return {"success": True, "message": "Static fallback activated"}
-    
-    async def _heal_backup_voice(self, agent_name: str) -> Dict:
-        """Switch to backup voice provider"""
-        logger.info("Switching to backup voice provider")
-        return {"success": True, "message": "Backup voice provider activated"}
-    
-    async def _heal_queue_retry(self, agent_name: str) -> Dict:
-        """Queue for later retry"""
-        logger.info("Queueing for retry")
-        return {"success": True, "message": "Queued for retry"}
-    
-    async def _heal_disable_voice(self, agent_name: str) -> Dict:
-        """Temporarily disable voice"""
-        logger.info("Disabling voice temporarily")
-        return {"success": True, "message": "Voice disabled temporarily"}
+    async def _apply_heal(self, strategy: str, agent_name: str) -> Dict:
+        """Run a table-driven healing action from HEAL_ACTIONS"""
+        level, log_template, message, effect = HEAL_ACTIONS[strategy]
+        if log_template:
+            logger.log(level, log_template.format(agent=agent_name))
+        if effect is not None:
+            result = effect(agent_name)
+            if inspect.isawaitable(result):
+                await result
+        return {"success": True, "message": message.format(agent=agent_name)}
     
     # ===== PUBLIC API =====
     
@@ -520,9 +509,20 @@ class SelfHealingMonitor:
                 if (datetime.now() - datetime.fromisoformat(i.timestamp)).days < 1
             ]),
             "healing_success_rate": self._calculate_healing_success_rate(),
-            "learning_patterns": len(self.learning_model.get("patterns", []))
+            "learning_patterns": len(self.learning_model.get("patterns", [])),
+            "tick_latency_ms": self._latency_percentiles(self._tick_latency_ms),
+            "healing_latency_ms": self._latency_percentiles(self._heal_latency_ms)
         }
     
+    @staticmethod
+    def _latency_percentiles(samples: deque) -> Dict[str, Optional[int]]:
+        """p50/p99 over recent latency samples"""
+        if not samples:
+            return {"p50": None, "p99": None}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {"p50": ordered[last // 2], "p99": ordered[(last * 99) // 100]}
+    
     def _calculate_overall_health(self) -> str:
         """Calculate overall system health"""
         if not self.agent_health:
@@ -550,24 +550,37 @@ class SelfHealingMonitor:
         incidents = self.incidents.values()
         if status:
             incidents = [i for i in incidents if i.status == status]
-        return [asdict(i) for i in incidents]
+        return [i.to_dict() for i in incidents]
     
     async def start_monitoring(self, interval_seconds: int = 60):
         """Start continuous monitoring loop"""
         logger.info(f"Starting self-healing monitor (interval: {interval_seconds}s)")
         
         while True:
+            tick_start_ns = time.perf_counter_ns()
             try:
-                # Check all registered agents
-                agents = ["designer", "coder", "reviewer", "qa", "voice", "yappyverse"]
-                for agent in agents:
-                    await self.check_agent_health(agent)
+                # Check all registered agents concurrently, sharing one tick
+                # timestamp; shared state is mutated under _health_lock
+                tick_ts = datetime.now().isoformat()
+                results = await asyncio.gather(
+                    *(self.check_agent_health(agent, tick_ts) for agent in self._agents),
+                    return_exceptions=True
+                )
+                for agent, result in zip(self._agents, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Health check failed for {agent}: {result}")
                 
-                self._save_state()
+                self._schedule_save()
                 
             except Exception as e:
                 logger.error(f"Monitoring loop error: {e}")
             
+            # Slow ticks point at blocking work or long healing callbacks
+            tick_ms = (time.perf_counter_ns() - tick_start_ns) // 1_000_000
+            self._tick_latency_ms.append(tick_ms)
+            if tick_ms > self.TICK_LATENCY_WARN_MS:
+                logger.warning(f"Monitor tick took {tick_ms} ms")
+            
             await asyncio.sleep(interval_seconds)
 
 
@@ -6,6 +6,7 @@ After a voice call, Synthia dispatches this pipeline to build autonomously.
 """
 
 from .state import JobState, JobStore
+from .output_cache import AgentOutputCache
 from .agent_base import AgentBase
 from .agents import DesignerAgent, CoderAgent, ReviewerAgent, QAAgent
 from .pipeline import SequentialPipeline
@@ -13,6 +14,7 @@ from .pipeline import SequentialPipeline
 __all__ = [
     "JobState",
     "JobStore",
+    "AgentOutputCache",
     "AgentBase",
     "DesignerAgent",
     "CoderAgent",
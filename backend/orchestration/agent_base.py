@@ -10,14 +10,48 @@ import json
 import logging
 from typing import Any, Optional
 
+from .output_cache import get_output_cache
+from .rate_limit import LLMRateLimiter, get_llm_limiter
+
 logger = logging.getLogger(__name__)
 
-# Try Ollama first, fall back gracefully
+# Ollama is imported lazily on first LLM call; falls back gracefully
+_ollama_client: Optional[Any] = None
+_ollama_available: Optional[bool] = None
+
+# orjson is optional — C-level serialization for large contexts
 try:
-    import ollama as _ollama
-    _ollama_available = True
+    import orjson as _orjson
+    _orjson_available = True
 except ImportError:
-    _ollama_available = False
+    _orjson_available = False
+
+
+def _get_ollama_client() -> Optional[Any]:
+    """Get the shared async Ollama client, or None if ollama isn't installed."""
+    global _ollama_client, _ollama_available
+    if _ollama_available is None:
+        try:
+            import ollama
+            _ollama_client = ollama.AsyncClient(host=os.getenv("OLLAMA_HOST"))
+            _ollama_available = True
+        except ImportError:
+            _ollama_available = False
+    return _ollama_client
+
+
+def _dumps_indented(value: Any) -> str:
+    """Pretty-print a dict/list for the prompt, preferring orjson."""
+    if _orjson_available:
+        try:
+            return _orjson.dumps(
+                value,
+                default=str,
+                option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits — let json handle it
+    return json.dumps(value, indent=2, default=str)
 
 
 class AgentBase:
@@ -27,25 +61,45 @@ class AgentBase:
     role: str = "generic"
     system_prompt: str = "You are a helpful AI assistant."
     model: str = ""
+    cache_outputs: bool = True  # reuse results for matching briefs
 
     def __init__(self):
         self.model = os.getenv("DEFAULT_CODE_MODEL", "qwen2.5-coder")
         self.max_retries = 2
+        # The system prompt is a fixed prefix of every call: build its
+        # message and token estimate once, and keep the model loaded so
+        # Ollama can reuse the prefix's KV cache between requests
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        self._system_tokens = LLMRateLimiter.estimate_tokens(self.system_prompt)
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
 
     async def execute(self, context: dict) -> dict:
         """
         Execute this agent's task given accumulated pipeline context.
         Returns result dict to be merged into context for next agent.
         """
+        output_cache = get_output_cache() if self.cache_outputs else None
+        if output_cache is not None:
+            cached = output_cache.get(self.name, context, self.model)
+            if cached is not None:
+                logger.info("Agent %s: reusing cached output", self.name)
+                return cached
+
+        # Context doesn't change between retries — serialize it once
+        user_message = self._build_user_message(context)
         for attempt in range(self.max_retries + 1):
             try:
-                result = await self._call_llm(context)
-                return {
+                result = await self._call_llm(context, user_message)
+                response = {
                     "agent": self.name,
                     "role": self.role,
                     "status": "success",
                     "output": result,
                 }
+                # Don't cache the placeholder produced without an LLM
+                if output_cache is not None and _get_ollama_client() is not None:
+                    output_cache.set(self.name, context, response, self.model)
+                return response
             except Exception as e:
                 logger.warning(
                     "Agent %s attempt %d failed: %s", self.name, attempt + 1, e
@@ -60,17 +114,26 @@ class AgentBase:
 
         return {"agent": self.name, "status": "error", "error": "max retries exceeded"}
 
-    async def _call_llm(self, context: dict) -> str:
-        """Call the LLM with system prompt + serialized context."""
-        user_message = self._build_user_message(context)
+    async def _call_llm(self, context: dict, user_message: Optional[str] = None) -> str:
+        """Call the LLM with system prompt + serialized context.
+
+        Pass a prebuilt ``user_message`` to skip re-serializing ``context``.
+        """
+        if user_message is None:
+            user_message = self._build_user_message(context)
 
-        if _ollama_available:
-            response = _ollama.chat(
+        client = _get_ollama_client()
+        if client is not None:
+            # Pace requests under the provider's RPM/TPM instead of eating 429s
+            limiter = get_llm_limiter()
+            await limiter.acquire(self._system_tokens + limiter.estimate_tokens(user_message))
+            response = await client.chat(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    self._system_message,
                     {"role": "user", "content": user_message},
                 ],
+                keep_alive=self.keep_alive,
             )
             return response["message"]["content"]
         else:
@@ -80,15 +143,10 @@ class AgentBase:
 
     def _build_user_message(self, context: dict) -> str:
         """Serialize context into a prompt-friendly string."""
-        parts = []
-        for key, value in context.items():
-            if isinstance(value, dict):
-                parts.append(f"## {key}\n{json.dumps(value, indent=2, default=str)}")
-            elif isinstance(value, list):
-                parts.append(f"## {key}\n{json.dumps(value, indent=2, default=str)}")
-            else:
-                parts.append(f"## {key}\n{value}")
-        return "\n\n".join(parts)
+        return "\n\n".join(
+            f"## {key}\n{_dumps_indented(value) if isinstance(value, (dict, list)) else value}"
+            for key, value in context.items()
+        )
 
 
 __all__ = ["AgentBase"]
@@ -0,0 +1,72 @@
+"""
+Synthia 4.2 - Agent Output Cache
+
+Caches successful agent outputs so repeat briefs skip the LLM call.
+Keys combine the agent name and model, the brief (case and whitespace
+normalized), the exact niche and page_type, and a digest of upstream
+step results — so a downstream agent only hits when everything it
+builds on matches.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Optional
+
+from cache import get_cache
+
+@lru_cache(maxsize=256)
+def normalize_brief(brief: str) -> str:
+    """
+    Lowercase a brief and collapse its whitespace. Word order is kept:
+    "red button on blue background" and "blue button on red background"
+    must not share a cached output. Memoized: every agent in a pipeline
+    keys on the same brief, so it is normalized once per job.
+    """
+    return " ".join(brief.lower().split())
+
+
+class AgentOutputCache:
+    """Cache of agent results keyed by (agent, model, brief, niche, page_type, upstream)."""
+
+    PREFIX = "synthia:agent_output:"
+    TTL = 86400  # 24 hours
+
+    def __init__(self):
+        self._cache = get_cache()
+
+    def key_for(self, agent_name: str, context: dict, model: str = "") -> str:
+        upstream = json.dumps(
+            context.get("results_per_step", {}), sort_keys=True, default=str
+        )
+        raw = "|".join((
+            agent_name,
+            model,
+            normalize_brief(str(context.get("brief", ""))),
+            str(context.get("niche", "")),
+            str(context.get("page_type", "")),
+            upstream,
+        ))
+        digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{self.PREFIX}{agent_name}:{digest}"
+
+    def get(self, agent_name: str, context: dict, model: str = "") -> Optional[dict]:
+        return self._cache.get(self.key_for(agent_name, context, model))
+
+    def set(self, agent_name: str, context: dict, result: dict, model: str = "") -> None:
+        self._cache.set(self.key_for(agent_name, context, model), result, ttl=self.TTL)
+
+
+# Singleton
+_output_cache: Optional[AgentOutputCache] = None
+
+
+def get_output_cache() -> AgentOutputCache:
+    """Get or create the agent output cache singleton."""
+    global _output_cache
+    if _output_cache is None:
+        _output_cache = AgentOutputCache()
+    return _output_cache
+
+
+__all__ = ["AgentOutputCache", "get_output_cache", "normalize_brief"]
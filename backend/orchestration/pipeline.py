@@ -6,8 +6,10 @@ Persists state after each step via JobStore.
 Sends notifications on completion/failure.
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import time
+from dataclasses import replace
 
 from .state import JobState, JobStore
 from .agents import DesignerAgent, CoderAgent, ReviewerAgent, QAAgent
@@ -15,6 +17,11 @@ from .agents import DesignerAgent, CoderAgent, ReviewerAgent, QAAgent
 logger = logging.getLogger(__name__)
 
 
+def _snapshot(job: JobState) -> JobState:
+    """Copy of the job that later pipeline steps can't mutate underneath."""
+    return replace(job, results_per_step=dict(job.results_per_step))
+
+
 class SequentialPipeline:
     """Execute agents sequentially, passing accumulated context through each."""
 
@@ -29,8 +36,41 @@ class SequentialPipeline:
 
     async def execute(self, job: JobState) -> JobState:
         """Run the full pipeline for a job."""
+        # Dashboard pushes and intermediate saves run in the background
+        # alongside the next agent; all of them finish before we return
+        push_tasks: list[asyncio.Task] = []
+        save_tasks: list[asyncio.Task] = []
+        try:
+            return await self._run_agents(job, push_tasks, save_tasks)
+        finally:
+            pending = push_tasks + save_tasks
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            if push_tasks:
+                # Deliver queued pushes while this loop is alive; under Celery
+                # the loop may end as soon as we return
+                await self._flush_dashboard()
+
+    async def run_many(self, jobs: list[JobState], max_concurrent: int = 5) -> list:
+        """
+        Run several jobs' pipelines concurrently, at most ``max_concurrent``
+        at a time. Returns one entry per job, in order: the finished
+        JobState, or the exception that escaped its pipeline.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run_one(job: JobState) -> JobState:
+            async with semaphore:
+                return await self.execute(job)
+
+        return await asyncio.gather(
+            *(run_one(job) for job in jobs), return_exceptions=True
+        )
+
+    async def _run_agents(self, job: JobState, push_tasks: list, save_tasks: list) -> JobState:
+        """Run each agent in order, updating and persisting job state."""
         job.status = "running"
-        job.started_at = datetime.utcnow().isoformat()
+        job.started_at = time.time()
         self.store.save(job)
 
         # Build initial context from the job brief
@@ -44,7 +84,7 @@ class SequentialPipeline:
         for agent in self.agents:
             job.current_agent = agent.name
             job.status = "running"
-            self.store.save(job)
+            self._save_in_background(job, save_tasks)
 
             logger.info("Pipeline %s: running agent '%s'", job.job_id, agent.name)
 
@@ -65,36 +105,58 @@ class SequentialPipeline:
                     if agent.name == "coder":
                         job.status = "failed"
                         job.error = f"Coder agent failed: {result.get('error')}"
-                        job.completed_at = datetime.utcnow().isoformat()
-                        self.store.save(job)
+                        job.completed_at = time.time()
+                        await self._save_now(job, save_tasks)
                         await self._notify_failure(job)
                         return job
 
                 job.status = "step_complete"
-                self.store.save(job)
+                self._save_in_background(job, save_tasks)
 
-                # Push status to dashboard if available
-                await self._push_status(job)
+                # Push status to dashboard if available. Not awaited here —
+                # the next agent doesn't depend on it.
+                push_tasks.append(asyncio.create_task(self._push_status(_snapshot(job))))
 
             except Exception as e:
                 logger.exception("Pipeline %s: unhandled error in '%s'", job.job_id, agent.name)
                 job.status = "failed"
                 job.error = f"Unhandled error in {agent.name}: {str(e)}"
-                job.completed_at = datetime.utcnow().isoformat()
-                self.store.save(job)
+                job.completed_at = time.time()
+                await self._save_now(job, save_tasks)
                 await self._notify_failure(job)
                 return job
 
         # All agents completed
         job.status = "done"
         job.current_agent = None
-        job.completed_at = datetime.utcnow().isoformat()
-        self.store.save(job)
+        job.completed_at = time.time()
+        await self._save_now(job, save_tasks)
 
         await self._notify_success(job)
         logger.info("Pipeline %s: completed successfully", job.job_id)
         return job
 
+    def _save_in_background(self, job: JobState, save_tasks: list) -> None:
+        """
+        Queue a save of the job's current state without blocking the loop.
+        Each save waits for the one before it, so writes land in call order.
+        """
+        snapshot = _snapshot(job)
+        previous = save_tasks[-1] if save_tasks else None
+
+        async def write() -> None:
+            if previous is not None:
+                await asyncio.gather(previous, return_exceptions=True)
+            await asyncio.to_thread(self.store.save, snapshot)
+
+        save_tasks.append(asyncio.create_task(write()))
+
+    async def _save_now(self, job: JobState, save_tasks: list) -> None:
+        """Durable save for terminal states: drain queued saves, then write."""
+        if save_tasks:
+            await asyncio.gather(*save_tasks, return_exceptions=True)
+        self.store.save(job)
+
     async def _notify_success(self, job: JobState) -> None:
         """Send completion notification."""
         try:
@@ -122,5 +184,13 @@ class SequentialPipeline:
         except Exception as e:
             logger.debug("Dashboard sync unavailable: %s", e)
 
+    async def _flush_dashboard(self) -> None:
+        """Wait for queued dashboard pushes to be delivered."""
+        try:
+            from services.dashboard_sync import get_dashboard_sync
+            await get_dashboard_sync().flush()
+        except Exception as e:
+            logger.debug("Dashboard flush failed: %s", e)
+
 
 __all__ = ["SequentialPipeline"]
@@ -0,0 +1,69 @@
+"""
+Synthia 4.2 - LLM Rate Limiting
+
+Client-side token buckets that pace LLM requests under the provider's
+requests-per-minute and tokens-per-minute limits, so calls wait briefly
+instead of tripping 429s and burning retries.
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Async token bucket refilling ``capacity`` tokens per ``period`` seconds.
+
+    Acquiring reserves tokens immediately (the balance may go negative) and
+    then sleeps off the deficit, so waiters are served in arrival order
+    without holding a lock across the sleep.
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        amount = min(float(amount), self.capacity)
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= amount
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class LLMRateLimiter:
+    """Paces LLM calls by request count (LLM_RPM) and estimated tokens (LLM_TPM)."""
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        self.requests = TokenBucket(rpm or int(os.getenv("LLM_RPM", "500")))
+        self.tokens = TokenBucket(tpm or int(os.getenv("LLM_TPM", "200000")))
+
+    @staticmethod
+    def estimate_tokens(*texts: str) -> int:
+        """Rough token estimate (~4 characters per token)."""
+        return sum(len(t) for t in texts) // 4 + 1
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        await self.requests.acquire(1)
+        await self.tokens.acquire(estimated_tokens)
+
+
+# Singleton
+_llm_limiter: Optional[LLMRateLimiter] = None
+
+
+def get_llm_limiter() -> LLMRateLimiter:
+    """Get or create the process-wide LLM rate limiter."""
+    global _llm_limiter
+    if _llm_limiter is None:
+        _llm_limiter = LLMRateLimiter()
+    return _llm_limiter
+
+
+__all__ = ["TokenBucket", "LLMRateLimiter", "get_llm_limiter"]
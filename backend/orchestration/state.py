@@ -5,15 +5,27 @@ Tracks pipeline execution state with Redis-backed persistence.
 """
 
 import json
+import time
 import uuid
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+import threading
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
 from typing import Optional, Any
 
 from cache import get_cache
 
 
-@dataclass
+def _epoch_to_iso(ts: float) -> str:
+    """Format epoch seconds as a naive-UTC ISO string (the historical format)."""
+    return datetime.utcfromtimestamp(ts).isoformat()
+
+
+def _iso_to_epoch(value: str) -> float:
+    """Parse a naive-UTC ISO string back to epoch seconds."""
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+
+
+@dataclass(slots=True)
 class JobState:
     job_id: str
     status: str  # pending | running | step_complete | done | failed
@@ -22,16 +34,43 @@ class JobState:
     page_type: str
     results_per_step: dict = field(default_factory=dict)
     current_agent: Optional[str] = None
-    started_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    completed_at: Optional[str] = None
+    started_at: float = field(default_factory=time.time)  # epoch seconds
+    completed_at: Optional[float] = None
     error: Optional[str] = None
 
+    def __post_init__(self):
+        # Jobs stored before timestamps became epoch floats carry ISO strings
+        if isinstance(self.started_at, str):
+            self.started_at = _iso_to_epoch(self.started_at)
+        if isinstance(self.completed_at, str):
+            self.completed_at = _iso_to_epoch(self.completed_at)
+
+    @property
+    def started_at_iso(self) -> str:
+        return _epoch_to_iso(self.started_at)
+
+    @property
+    def completed_at_iso(self) -> Optional[str]:
+        return _epoch_to_iso(self.completed_at) if self.completed_at is not None else None
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Shallow: results_per_step is already plain JSON data, so skip
+        # asdict()'s recursive deep copy on every save
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def to_api_dict(self) -> dict:
+        """to_dict() with timestamps formatted as ISO 8601 for API consumers."""
+        data = self.to_dict()
+        data["started_at"] = self.started_at_iso
+        data["completed_at"] = self.completed_at_iso
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "JobState":
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        # Stored jobs normally carry exactly our fields — unpack directly
+        if _JOB_FIELDS.issuperset(data):
+            return cls(**data)
+        return cls(**{k: data[k] for k in _JOB_FIELDS if k in data})
 
     @classmethod
     def create(cls, brief: str, niche: str, page_type: str) -> "JobState":
@@ -44,18 +83,49 @@ class JobState:
         )
 
 
+_JOB_FIELDS = frozenset(JobState.__dataclass_fields__)
+
+
 class JobStore:
     """Redis-backed job state store."""
 
     PREFIX = "synthia:job:"
     TTL = 86400  # 24 hours
+    MAX_TRACKED = 1024  # jobs whose last-written state we remember
 
     def __init__(self):
         self._cache = get_cache()
+        # job_id -> fingerprint of the last state this store wrote; saves
+        # also run from worker threads, so access goes through the lock
+        self._saved: dict[str, tuple] = {}
+        self._saved_lock = threading.Lock()
+
+    @staticmethod
+    def _fingerprint(job: JobState) -> tuple:
+        # Step results are stored once per agent and not edited afterwards,
+        # so their identities stand in for their (large) contents. The
+        # results themselves are kept too: while referenced, their ids
+        # can't be reused by other objects.
+        return (
+            job.status, job.brief, job.niche, job.page_type, job.current_agent,
+            job.started_at, job.completed_at, job.error,
+            tuple((name, id(result)) for name, result in job.results_per_step.items()),
+            tuple(job.results_per_step.values()),
+        )
 
     def save(self, job: JobState) -> None:
+        fingerprint = self._fingerprint(job)
+        with self._saved_lock:
+            previous = self._saved.get(job.job_id)
+        # The trailing kept-alive results are not compared, only their ids
+        if previous is not None and previous[:-1] == fingerprint[:-1]:
+            return  # unchanged since our last write
         key = f"{self.PREFIX}{job.job_id}"
         self._cache.set(key, job.to_dict(), ttl=self.TTL)
+        with self._saved_lock:
+            if job.job_id not in self._saved and len(self._saved) >= self.MAX_TRACKED:
+                self._saved.pop(next(iter(self._saved)), None)
+            self._saved[job.job_id] = fingerprint
 
     def get(self, job_id: str) -> Optional[JobState]:
         key = f"{self.PREFIX}{job_id}"
@@ -1,5 +1,6 @@
 """Place a live Synthia call with full bidirectional WebSocket media stream."""
 import os, sys
+from xml.sax.saxutils import quoteattr
 sys.path.insert(0, os.path.dirname(__file__))
 
 from dotenv import load_dotenv
@@ -11,38 +12,59 @@ from twilio.rest import Client
 from twilio.twiml.voice_response import VoiceResponse, Connect, Stream
 
 TUNNEL_URL = "https://calm-rings-dance.loca.lt"
-TO_NUMBER = sys.argv[1] if len(sys.argv) > 1 else "+13234842914"
-
-account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-api_key = os.getenv("TWILIO_API_KEY_SID")
-api_secret = os.getenv("TWILIO_API_KEY_SECRET")
-from_number = os.getenv("TWILIO_PHONE_NUMBER")
-
-client = Client(api_key, api_secret, account_sid)
-
-# Build TwiML with bidirectional WebSocket stream
-response = VoiceResponse()
-response.say(
-    "Connecting you to Synthia, your AI design and strategy partner from The Pauli Effect.",
-    voice="Polly.Joanna",
-)
-response.pause(length=1)
-connect = Connect()
-ws_url = TUNNEL_URL.replace("https://", "wss://").replace("http://", "ws://")
-stream = Stream(url=f"{ws_url}/ws/twilio-stream")
-stream.parameter(name="callerNumber", value=TO_NUMBER)
-connect.append(stream)
-response.append(connect)
-
-twiml = str(response)
-print(f"TwiML:\n{twiml}\n")
-
-call = client.calls.create(
-    twiml=twiml,
-    to=TO_NUMBER,
-    from_=from_number,
-)
-print(f"Call placed! SID: {call.sid}")
-print(f"From: {from_number} -> To: {TO_NUMBER}")
-print(f"Tunnel: {TUNNEL_URL}")
-print("Synthia will greet you with Claude Sonnet 4 reasoning.")
+
+_CALLER_PLACEHOLDER = "__SYNTHIA_CALLER__"
+
+
+def _build_response(caller_number: str) -> VoiceResponse:
+    """Build TwiML with bidirectional WebSocket stream"""
+    response = VoiceResponse()
+    response.say(
+        "Connecting you to Synthia, your AI design and strategy partner from The Pauli Effect.",
+        voice="Polly.Joanna",
+    )
+    response.pause(length=1)
+    connect = Connect()
+    ws_url = TUNNEL_URL.replace("https://", "wss://").replace("http://", "ws://")
+    stream = Stream(url=f"{ws_url}/ws/twilio-stream")
+    stream.parameter(name="callerNumber", value=caller_number)
+    connect.append(stream)
+    response.append(connect)
+    return response
+
+
+# The TwiML only varies by caller number — render the tree once
+_TWIML_TEMPLATE = str(_build_response(_CALLER_PLACEHOLDER))
+
+
+def build_twiml(to_number: str) -> str:
+    """TwiML for a call to ``to_number``, filled into the prebuilt template"""
+    return _TWIML_TEMPLATE.replace(f'"{_CALLER_PLACEHOLDER}"', quoteattr(to_number))
+
+
+def main():
+    to_number = sys.argv[1] if len(sys.argv) > 1 else "+13234842914"
+
+    account_sid = os.getenv("TWILIO_ACCOUNT_SID")
+    api_key = os.getenv("TWILIO_API_KEY_SID")
+    api_secret = os.getenv("TWILIO_API_KEY_SECRET")
+    from_number = os.getenv("TWILIO_PHONE_NUMBER")
+
+    client = Client(api_key, api_secret, account_sid)
+
+    twiml = build_twiml(to_number)
+    print(f"TwiML:\n{twiml}\n")
+
+    call = client.calls.create(
+        twiml=twiml,
+        to=to_number,
+        from_=from_number,
+    )
+    print(f"Call placed! SID: {call.sid}")
+    print(f"From: {from_number} -> To: {to_number}")
+    print(f"Tunnel: {TUNNEL_URL}")
+    print("Synthia will greet you with Claude Sonnet 4 reasoning.")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,12 @@ Applied to all API endpoints and agent inputs
 """
 
 import re
+import html
+import hashlib
 import logging
-from typing import Dict, List, Optional, Tuple
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
 from functools import wraps
 from fastapi import HTTPException
 
@@ -27,8 +31,8 @@ class SecurityConfig:
         r"user\s*:\s*",
         r"<\|im_start\|>",
         r"<\|im_end\|>",
-        r"\[SYSTEM\",
-        r"\[INST\",
+        r"\[SYSTEM\]",
+        r"\[INST\]",
         r"<<SYS>>",
         r"###\s*(System|Instruction)",
         r"new\s+instructions?:",
@@ -48,7 +52,7 @@ class SecurityConfig:
     
     # Spam patterns
     SPAM_PATTERNS = [
-        r"(.)\1{10,}",  # Repeated characters
+        r"(?P<repeat>.)(?P=repeat){10,}",  # Repeated characters
         r"[A-Z]{20,}",   # ALL CAPS shouting
         r"https?://\S{100,}",  # Very long URLs
         r"(buy|cheap|discount|sale|click\s+here).{0,50}(now|today|limited)",
@@ -58,23 +62,74 @@ class SecurityConfig:
         r"\b\d{3}-\d{2}-\d{4}\b",  # SSN pattern
     ]
     
+    # Dangerous code patterns
+    DANGEROUS_CODE_PATTERNS = [
+        r"os\.system\s*\(",
+        r"subprocess\.call\s*\(",
+        r"subprocess\.run\s*\(",
+        r"subprocess\.Popen\s*\(",
+        r"eval\s*\(",
+        r"exec\s*\(",
+        r"__import__\s*\(",
+        r"import\s+os\s*;\s*os\.system",
+        r"open\s*\(\s*['\"]/etc/",
+        r"open\s*\(\s*['\"]C:\\\\Windows",
+        r"environ\[",
+        r"getenv\s*\(",
+        r"\.bashrc",
+        r"\.ssh/",
+        r"id_rsa",
+        r"\.env",
+        r"password\s*=",
+        r"api_key\s*=",
+        r"secret\s*=",
+        r"token\s*=",
+    ]
+    
     # Rate limiting
     MAX_INPUT_LENGTH = 10000
     MAX_REQUESTS_PER_MINUTE = 60
+    
+    # Validated-text cache (entries, FIFO eviction)
+    VERDICT_CACHE_SIZE = 4096
+
+
+# Null bytes and non-whitespace control characters, deleted by str.translate.
+# Whitespace controls (tab, CR, ...) are left for the split/join to turn into spaces.
+_CONTROL_CHARS = dict.fromkeys(c for c in range(32) if not chr(c).isspace())
+
+
+def _compile_rules(rule_sets: List[Tuple[str, List[str]]]) -> "re.Pattern[str]":
+    """
+    Fuse rule sets into one case-insensitive alternation.
+    Each pattern is wrapped in a named group ``<set>_<index>`` so a single
+    scan reports which rule fired via ``match.lastgroup``.
+    """
+    return re.compile(
+        "|".join(
+            f"(?P<{name}_{i}>{pattern})"
+            for name, patterns in rule_sets
+            for i, pattern in enumerate(patterns)
+        ),
+        re.IGNORECASE
+    )
 
 
 class InputValidator:
     """Validates and sanitizes all inputs"""
     
     def __init__(self):
-        self.injection_regex = re.compile(
-            "|".join(SecurityConfig.INJECTION_PATTERNS),
-            re.IGNORECASE
-        )
-        self.spam_regex = re.compile(
-            "|".join(SecurityConfig.SPAM_PATTERNS),
-            re.IGNORECASE
-        )
+        self.injection_regex = _compile_rules([("injection", SecurityConfig.INJECTION_PATTERNS)])
+        self.spam_regex = _compile_rules([("spam", SecurityConfig.SPAM_PATTERNS)])
+        # Injection + spam rules in one pass over the text
+        self.threat_regex = _compile_rules([
+            ("injection", SecurityConfig.INJECTION_PATTERNS),
+            ("spam", SecurityConfig.SPAM_PATTERNS),
+        ])
+        self.dangerous_code_regex = _compile_rules([("code", SecurityConfig.DANGEROUS_CODE_PATTERNS)])
+        # digest of accepted text -> sanitized text; tied to the rules
+        # compiled above, so a new validator starts with an empty cache
+        self._verdict_cache: Dict[bytes, str] = {}
     
     def validate_text(self, text: str, context: str = "input") -> Tuple[bool, str, Optional[str]]:
         """
@@ -88,97 +143,100 @@ class InputValidator:
         if len(text) > SecurityConfig.MAX_INPUT_LENGTH:
             return False, "", f"Input exceeds maximum length of {SecurityConfig.MAX_INPUT_LENGTH}"
         
-        # Check for prompt injection
-        if self.injection_regex.search(text):
-            logger.warning(f"Prompt injection detected in {context}")
-            return False, "", "Potentially harmful input detected"
+        # Identical text already passed — skip the scan
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = self._verdict_cache.get(digest)
+        if cached is not None:
+            return True, cached, None
         
-        # Check for spam
-        if self.spam_regex.search(text):
-            logger.warning(f"Spam detected in {context}")
+        # Check for prompt injection and spam in a single scan
+        match = self.threat_regex.search(text)
+        if match:
+            rule = match.lastgroup
+            if rule.startswith("spam"):
+                # Injection outranks spam when the text trips both
+                injection = self.injection_regex.search(text)
+                if injection:
+                    rule = injection.lastgroup
+            if rule.startswith("injection"):
+                logger.warning(f"Prompt injection detected in {context} (rule {rule})")
+                return False, "", "Potentially harmful input detected"
+            logger.warning(f"Spam detected in {context} (rule {rule})")
             return False, "", "Input flagged as spam"
         
         # Sanitize
         sanitized = self._sanitize(text)
         
+        if len(self._verdict_cache) >= SecurityConfig.VERDICT_CACHE_SIZE:
+            del self._verdict_cache[next(iter(self._verdict_cache))]
+        self._verdict_cache[digest] = sanitized
+        
         return True, sanitized, None
     
     def _sanitize(self, text: str) -> str:
         """Sanitize text input"""
-        # Remove null bytes
-        text = text.replace("\x00", "")
+        # Remove null bytes and non-whitespace control characters
+        text = text.translate(_CONTROL_CHARS)
         
         # Normalize whitespace
         text = " ".join(text.split())
         
-        # Remove control characters except newlines
-        text = "".join(char for char in text if ord(char) >= 32 or char == "\n")
-        
         # Escape HTML
-        text = text.replace("<", "<").replace(">", ">")
-        
-        return text.strip()
+        return html.escape(text, quote=False)
     
     def validate_code(self, code: str) -> Tuple[bool, Optional[str]]:
         """Validate code for dangerous patterns"""
-        dangerous_patterns = [
-            r"os\.system\s*\(",
-            r"subprocess\.call\s*\(",
-            r"subprocess\.run\s*\(",
-            r"subprocess\.Popen\s*\(",
-            r"eval\s*\(",
-            r"exec\s*\(",
-            r"__import__\s*\(",
-            r"import\s+os\s*;\s*os\.system",
-            r"open\s*\(\s*['\"]/etc/",
-            r"open\s*\(\s*['\"]C:\\\\Windows",
-            r"environ\[",
-            r"getenv\s*\(",
-            r"\.bashrc",
-            r"\.ssh/",
-            r"id_rsa",
-            r"\.env",
-            r"password\s*=",
-            r"api_key\s*=",
-            r"secret\s*=",
-            r"token\s*=",
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                logger.warning(f"Dangerous code pattern detected: {pattern}")
-                return False, f"Dangerous code pattern detected: {pattern}"
+        match = self.dangerous_code_regex.search(code)
+        if match:
+            index = int(match.lastgroup.rsplit("_", 1)[1])
+            pattern = SecurityConfig.DANGEROUS_CODE_PATTERNS[index]
+            logger.warning(f"Dangerous code pattern detected: {pattern}")
+            return False, f"Dangerous code pattern detected: {pattern}"
         
         return True, None
 
 
 class RateLimiter:
-    """Simple rate limiter"""
+    """Simple sliding-window rate limiter"""
+    
+    # How often idle clients are dropped from the table
+    SWEEP_INTERVAL_SECONDS = 300
     
     def __init__(self):
-        self.requests: Dict[str, List[float]] = {}
+        # Request timestamps per client, oldest first
+        self.requests: Dict[str, Deque[float]] = {}
+        self._last_sweep = time.monotonic()
     
     def is_allowed(self, client_id: str) -> bool:
         """Check if request is allowed under rate limit"""
-        now = __import__('time').time()
+        now = time.monotonic()
         minute_ago = now - 60
         
+        if now - self._last_sweep > self.SWEEP_INTERVAL_SECONDS:
+            self._sweep(minute_ago)
+            self._last_sweep = now
+        
+        window = self.requests.get(client_id)
+        if window is None:
+            window = self.requests[client_id] = deque(maxlen=SecurityConfig.MAX_REQUESTS_PER_MINUTE)
+        
         # Clean old requests
-        if client_id in self.requests:
-            self.requests[client_id] = [
-                req_time for req_time in self.requests[client_id]
-                if req_time > minute_ago
-            ]
-        else:
-            self.requests[client_id] = []
+        while window and window[0] <= minute_ago:
+            window.popleft()
         
         # Check limit
-        if len(self.requests[client_id]) >= SecurityConfig.MAX_REQUESTS_PER_MINUTE:
+        if len(window) >= SecurityConfig.MAX_REQUESTS_PER_MINUTE:
             return False
         
         # Record request
-        self.requests[client_id].append(now)
+        window.append(now)
         return True
+    
+    def _sweep(self, minute_ago: float):
+        """Drop clients with no requests inside the window"""
+        idle = [cid for cid, window in self.requests.items() if not window or window[-1] <= minute_ago]
+        for cid in idle:
+            del self.requests[cid]
 
 
 # Global instances
@@ -202,18 +260,24 @@ def validate_input(func):
     return wrapper
 
 
-def validate_api_input(data: Dict) -> Tuple[bool, Dict, Optional[str]]:
+def validate_api_input(data: Dict, _seen: Optional[Dict[str, str]] = None) -> Tuple[bool, Dict, Optional[str]]:
     """Validate API input data"""
+    # Strings already accepted earlier in this payload -> sanitized form
+    if _seen is None:
+        _seen = {}
     sanitized = {}
     
     for key, value in data.items():
         if isinstance(value, str):
+            if value in _seen:
+                sanitized[key] = _seen[value]
+                continue
             is_valid, clean_value, error = _validator.validate_text(value, key)
             if not is_valid:
                 return False, {}, error
-            sanitized[key] = clean_value
+            sanitized[key] = _seen[value] = clean_value
         elif isinstance(value, dict):
-            is_valid, nested, error = validate_api_input(value)
+            is_valid, nested, error = validate_api_input(value, _seen)
             if not is_valid:
                 return False, {}, error
             sanitized[key] = nested
@@ -221,10 +285,14 @@ def validate_api_input(data: Dict) -> Tuple[bool, Dict, Optional[str]]:
             clean_list = []
             for item in value:
                 if isinstance(item, str):
+                    if item in _seen:
+                        clean_list.append(_seen[item])
+                        continue
                     is_valid, clean_item, error = _validator.validate_text(item, key)
                     if not is_valid:
                         return False, {}, error
                     clean_list.append(clean_item)
+                    _seen[item] = clean_item
                 else:
                     clean_list.append(item)
             sanitized[key] = clean_list
@@ -262,29 +330,35 @@ class DataEncryption:
     def __init__(self, key: Optional[str] = None):
         self.key = key or os.getenv("ENCRYPTION_KEY", "default-key-change-in-production")
     
+    def _xor_with_key(self, text: str) -> str:
+        """
+        XOR each code point of text with the repeating key.
+        Done as one big-integer XOR over UTF-32 code units instead of a
+        per-character Python loop; output matches the old char-by-char XOR.
+        """
+        if not text:
+            return ""
+        data = text.encode("utf-32-le")
+        key = self.key.encode("utf-32-le")
+        reps, rem = divmod(len(data), len(key))
+        stream = key * reps + key[:rem]
+        mixed = int.from_bytes(data, "little") ^ int.from_bytes(stream, "little")
+        return mixed.to_bytes(len(data), "little").decode("utf-32-le")
+    
     def encrypt(self, data: str) -> str:
         """Simple XOR encryption (use proper encryption in production)"""
         import base64
-        encrypted = ""
-        for i, char in enumerate(data):
-            key_char = self.key[i % len(self.key)]
-            encrypted += chr(ord(char) ^ ord(key_char))
-        return base64.b64encode(encrypted.encode()).decode()
+        return base64.b64encode(self._xor_with_key(data).encode()).decode()
     
     def decrypt(self, encrypted_data: str) -> str:
         """Decrypt data"""
         import base64
         try:
             encrypted = base64.b64decode(encrypted_data).decode()
-            decrypted = ""
-            for i, char in enumerate(encrypted):
-                key_char = self.key[i % len(self.key)]
-                decrypted += chr(ord(char) ^ ord(key_char))
-            return decrypted
+            return self._xor_with_key(encrypted)
         except Exception:
             return ""
 
-
 import os
 
 __all__ = [
@@ -13,13 +13,23 @@ Conversion flow:
 """
 
 import io
+import sys
+import shutil
 import struct
 import asyncio
 import logging
-import audioop
-import base64
-import wave
-from typing import Optional
+import binascii
+import json
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from operator import add, floordiv
+from typing import Iterator, Optional, Union
+
+try:
+    import audioop
+except ImportError:  # removed from the stdlib in Python 3.13
+    audioop = None
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +42,6 @@ MULAW_BIAS = 0x84
 MULAW_MAX = 0x7FFF
 MULAW_CLIP = 32635
 
-# Pre-computed μ-law decode table (256 entries)
-_MULAW_DECODE_TABLE: list[int] = []
-
-
 def _build_mulaw_decode_table() -> list[int]:
     """Build μ-law to 16-bit linear PCM decode table."""
     table = []
@@ -52,7 +58,45 @@ def _build_mulaw_decode_table() -> list[int]:
     return table
 
 
-_MULAW_DECODE_TABLE = _build_mulaw_decode_table()
+# Pre-computed μ-law decode table (256 entries), immutable once built
+_MULAW_DECODE_TABLE: tuple[int, ...] = tuple(_build_mulaw_decode_table())
+
+# Low/high bytes of each decoded little-endian sample, as bytes.translate tables
+_MULAW_DECODE_LO = bytes(s & 0xFF for s in _MULAW_DECODE_TABLE)
+_MULAW_DECODE_HI = bytes((s >> 8) & 0xFF for s in _MULAW_DECODE_TABLE)
+
+
+def _mulaw_encode_sample(sample: int) -> int:
+    """Encode one 16-bit signed sample to a μ-law byte."""
+    sign = 0
+    if sample < 0:
+        sign = 0x80
+        sample = -sample
+    if sample > MULAW_CLIP:
+        sample = MULAW_CLIP
+    sample += MULAW_BIAS
+
+    exponent = 7
+    mask = 0x4000
+    for exp in range(7, 0, -1):
+        if sample & mask:
+            exponent = exp
+            break
+        mask >>= 1
+    else:
+        exponent = 0
+
+    mantissa = (sample >> (exponent + 3)) & 0x0F
+    return ~(sign | (exponent << 4) | mantissa) & 0xFF
+
+
+@lru_cache(maxsize=1)
+def _mulaw_encode_table() -> bytes:
+    """Build the 64K-entry encode table, indexed by the sample as uint16."""
+    positive = bytes(_mulaw_encode_sample(s) for s in range(0x8000))
+    # -x encodes like x with the (inverted) sign bit cleared; -32768 clips like 32767
+    negative = positive[0x7FFF:] + positive[0x7FFF:0:-1]
+    return positive + negative.translate(bytes(b & 0x7F for b in range(256)))
 
 
 def mulaw_decode(mulaw_bytes: bytes) -> bytes:
@@ -62,15 +106,14 @@ def mulaw_decode(mulaw_bytes: bytes) -> bytes:
     Input: mulaw bytes (8kHz, 8-bit, mono)
     Output: PCM bytes (8kHz, 16-bit, mono, little-endian)
     """
-    try:
+    if audioop is not None:
         # Use audioop for efficient conversion (C-level, much faster)
         return audioop.ulaw2lin(mulaw_bytes, 2)
-    except Exception:
-        # Fallback to pure Python if audioop unavailable
-        samples = []
-        for byte in mulaw_bytes:
-            samples.append(_MULAW_DECODE_TABLE[byte])
-        return struct.pack(f"<{len(samples)}h", *samples)
+    # Table lookup via bytes.translate, interleaving low and high bytes
+    pcm = bytearray(len(mulaw_bytes) * 2)
+    pcm[0::2] = mulaw_bytes.translate(_MULAW_DECODE_LO)
+    pcm[1::2] = mulaw_bytes.translate(_MULAW_DECODE_HI)
+    return bytes(pcm)
 
 
 def mulaw_encode(pcm_bytes: bytes) -> bytes:
@@ -80,41 +123,44 @@ def mulaw_encode(pcm_bytes: bytes) -> bytes:
     Input: PCM bytes (8kHz, 16-bit, mono, little-endian)
     Output: mulaw bytes (8kHz, 8-bit, mono)
     """
-    try:
+    if audioop is not None:
         return audioop.lin2ulaw(pcm_bytes, 2)
-    except Exception:
-        # Fallback to pure Python
-        samples = struct.unpack(f"<{len(pcm_bytes) // 2}h", pcm_bytes)
-        encoded = []
-        for sample in samples:
-            sign = 0
-            if sample < 0:
-                sign = 0x80
-                sample = -sample
-            if sample > MULAW_CLIP:
-                sample = MULAW_CLIP
-            sample += MULAW_BIAS
-
-            exponent = 7
-            mask = 0x4000
-            for exp in range(7, 0, -1):
-                if sample & mask:
-                    exponent = exp
-                    break
-                mask >>= 1
-            else:
-                exponent = 0
+    samples = array("H", pcm_bytes)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return bytes(map(_mulaw_encode_table().__getitem__, samples))
 
-            mantissa = (sample >> (exponent + 3)) & 0x0F
-            byte = ~(sign | (exponent << 4) | mantissa) & 0xFF
-            encoded.append(byte)
-        return bytes(encoded)
+
+if audioop is None:
+    # The table codec is the only codec; build it now, not on the first call
+    _mulaw_encode_table()
+
+
+@lru_cache(maxsize=8)
+def _mulaw_silence_table(threshold: int) -> bytes:
+    """bytes.translate table mapping each μ-law code to 1 if |PCM| < threshold."""
+    return bytes(abs(s) < threshold for s in _MULAW_DECODE_TABLE)
 
 
 # ═══════════════════════════════════════════════════════════════
 # Sample Rate Conversion
 # ═══════════════════════════════════════════════════════════════
 
+def _pcm_to_samples(pcm_bytes: bytes) -> array:
+    """View little-endian 16-bit PCM as a native int16 array."""
+    samples = array("h", pcm_bytes)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples
+
+
+def _samples_to_pcm(samples: array) -> bytes:
+    """Serialize an int16 array as little-endian 16-bit PCM."""
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
 def resample_8k_to_16k(pcm_8k: bytes) -> bytes:
     """
     Upsample 16-bit PCM from 8kHz to 16kHz (linear interpolation).
@@ -125,16 +171,35 @@ def resample_8k_to_16k(pcm_8k: bytes) -> bytes:
         converted, _ = audioop.ratecv(pcm_8k, 2, 1, 8000, 16000, None)
         return converted
     except Exception:
-        # Simple linear interpolation fallback
-        samples = struct.unpack(f"<{len(pcm_8k) // 2}h", pcm_8k)
-        upsampled = []
-        for i in range(len(samples) - 1):
-            upsampled.append(samples[i])
-            # Interpolated midpoint
-            upsampled.append((samples[i] + samples[i + 1]) // 2)
-        if samples:
-            upsampled.append(samples[-1])
-        return struct.pack(f"<{len(upsampled)}h", *upsampled)
+        # Linear interpolation fallback: samples interleaved with midpoints
+        samples = _pcm_to_samples(pcm_8k)
+        following = samples[1:] + samples[-1:]
+        upsampled = array("h", bytes(len(samples) * 4))
+        upsampled[0::2] = samples
+        upsampled[1::2] = array("h", map(floordiv, map(add, samples, following), repeat(2)))
+        return _samples_to_pcm(upsampled)
+
+
+class Upsampler8kTo16k:
+    """
+    Stateful 8kHz → 16kHz resampler for one call.
+    Carries the ratecv filter state between buffers so successive
+    utterances continue the same signal instead of restarting the filter.
+    """
+
+    def __init__(self):
+        self._state = None
+
+    def process(self, pcm_8k: bytes) -> bytes:
+        """Upsample the next block of 16-bit PCM."""
+        if audioop is None:
+            return resample_8k_to_16k(pcm_8k)
+        converted, self._state = audioop.ratecv(pcm_8k, 2, 1, 8000, 16000, self._state)
+        return converted
+
+    def reset(self) -> None:
+        """Forget filter state (e.g. at the start of a new stream)."""
+        self._state = None
 
 
 def resample_16k_to_8k(pcm_16k: bytes) -> bytes:
@@ -146,10 +211,11 @@ def resample_16k_to_8k(pcm_16k: bytes) -> bytes:
         converted, _ = audioop.ratecv(pcm_16k, 2, 1, 16000, 8000, None)
         return converted
     except Exception:
-        # Simple decimation (take every other sample)
-        samples = struct.unpack(f"<{len(pcm_16k) // 2}h", pcm_16k)
-        decimated = samples[::2]
-        return struct.pack(f"<{len(decimated)}h", *decimated)
+        # Average each pair before decimating, a 2-tap low-pass that
+        # attenuates content above 4kHz instead of aliasing it
+        samples = _pcm_to_samples(pcm_16k)
+        decimated = array("h", map(floordiv, map(add, samples[0::2], samples[1::2]), repeat(2)))
+        return _samples_to_pcm(decimated)
 
 
 def resample_to_8k(pcm_data: bytes, source_rate: int) -> bytes:
@@ -168,36 +234,109 @@ def resample_to_8k(pcm_data: bytes, source_rate: int) -> bytes:
 # WAV Helpers
 # ═══════════════════════════════════════════════════════════════
 
+# Canonical 44-byte RIFF/WAVE header for 16-bit PCM
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _wav_header(data_len: int, sample_rate: int, channels: int) -> bytes:
+    """Build the WAV header for `data_len` bytes of 16-bit PCM."""
+    block_align = channels * 2  # 16-bit
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_len, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, 16,
+        b"data", data_len,
+    )
+
+
 def pcm_to_wav(pcm_bytes: bytes, sample_rate: int = 16000, channels: int = 1) -> bytes:
     """Wrap raw PCM bytes in a WAV container for Whisper."""
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(channels)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(sample_rate)
-        wf.writeframes(pcm_bytes)
-    return buf.getvalue()
+    return _wav_header(len(pcm_bytes), sample_rate, channels) + pcm_bytes
 
 
-def mulaw_to_wav_16k(mulaw_bytes: bytes) -> bytes:
+def mulaw_to_wav_16k(mulaw_bytes: bytes,
+                     upsampler: Optional[Upsampler8kTo16k] = None) -> bytes:
     """
     Full pipeline: mulaw/8kHz → PCM/8kHz → PCM/16kHz → WAV/16kHz.
-    Ready for Whisper transcription.
+    Ready for Whisper transcription. Pass the call's upsampler to keep
+    resampling continuous across utterances.
+    """
+    if audioop is not None:
+        pcm_8k = mulaw_decode(mulaw_bytes)
+        if upsampler is not None:
+            pcm_16k = upsampler.process(pcm_8k)
+        else:
+            pcm_16k = resample_8k_to_16k(pcm_8k)
+        return pcm_to_wav(pcm_16k, sample_rate=16000)
+    # Decode and upsample in one step, straight into the output samples
+    frames = _mulaw_upsample_16k(mulaw_bytes)
+    return _wav_header(len(frames) * 4, 16000, 1) + memoryview(frames)
+
+
+@lru_cache(maxsize=1)
+def _mulaw_frame_table() -> array:
     """
-    pcm_8k = mulaw_decode(mulaw_bytes)
-    pcm_16k = resample_8k_to_16k(pcm_8k)
-    return pcm_to_wav(pcm_16k, sample_rate=16000)
+    Output frame for every pair of μ-law codes, indexed by (a << 8) | b:
+    the decoded sample a followed by the midpoint of a and b, as 4 bytes
+    of little-endian PCM stored in one uint32 slot.
+    """
+    table = _MULAW_DECODE_TABLE
+    pack = struct.Struct("<hh").pack
+    return array("I", b"".join(pack(table[a], (table[a] + table[b]) >> 1)
+                               for a in range(256) for b in range(256)))
+
+
+def _mulaw_upsample_16k(mulaw_bytes: bytes) -> array:
+    """Decode μ-law/8kHz to 16-bit PCM at 16kHz by linear interpolation."""
+    # Pair each code with its successor as a uint16 index (current << 8 | next)
+    pairs = bytearray(len(mulaw_bytes) * 2)
+    pairs[0::2] = mulaw_bytes[1:] + mulaw_bytes[-1:]
+    pairs[1::2] = mulaw_bytes
+    index = array("H", pairs)
+    if sys.byteorder == "big":
+        index.byteswap()
+    # One lookup per input code emits both 16kHz samples
+    return array("I", map(_mulaw_frame_table().__getitem__, index))
 
 
 # ═══════════════════════════════════════════════════════════════
 # MP3 → mulaw conversion (for ElevenLabs → Twilio)
 # ═══════════════════════════════════════════════════════════════
 
-def mp3_to_mulaw(mp3_bytes: bytes) -> bytes:
+# ffmpeg decodes and resamples straight to mulaw, skipping pydub's Python glue
+_FFMPEG = shutil.which("ffmpeg")
+_FFMPEG_MULAW_ARGS = (
+    "-v", "quiet", "-i", "pipe:0",
+    "-f", "mulaw", "-ar", "8000", "-ac", "1", "pipe:1",
+)
+
+
+async def mp3_to_mulaw(mp3_bytes: bytes) -> bytes:
     """
     Convert MP3 audio (from ElevenLabs) to mulaw/8kHz for Twilio.
-    Uses pydub if available, otherwise falls back to raw approach.
+    Uses ffmpeg directly if installed, then pydub, otherwise falls back
+    to raw approach. Never blocks the event loop.
     """
+    if _FFMPEG:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                _FFMPEG, *_FFMPEG_MULAW_ARGS,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            mulaw, _ = await proc.communicate(mp3_bytes)
+            if proc.returncode == 0:
+                return mulaw
+            logger.warning("ffmpeg mulaw conversion exited with %d, trying pydub", proc.returncode)
+        except OSError as e:
+            logger.warning("ffmpeg mulaw conversion failed, trying pydub: %s", e)
+    # pydub decodes on the calling thread, so keep it off the event loop
+    return await asyncio.to_thread(_mp3_to_mulaw_sync, mp3_bytes)
+
+
+def _mp3_to_mulaw_sync(mp3_bytes: bytes) -> bytes:
+    """Blocking pydub conversion backing mp3_to_mulaw."""
     try:
         from pydub import AudioSegment
         audio = AudioSegment.from_mp3(io.BytesIO(mp3_bytes))
@@ -236,29 +375,33 @@ class AudioBuffer:
         self._buffer = bytearray()
         self._min_bytes = min_bytes  # ~1 second at 8kHz mulaw
         self._max_bytes = max_bytes  # ~8 seconds max
-        self._silence_threshold = 500      # RMS threshold for silence detection
-        self._silence_chunks = 0
+        self._silence_threshold = 500      # amplitude below which a sample is silent
+        self._silent_codes = _mulaw_silence_table(self._silence_threshold)
+        self._vad_window = 800             # score silence per 100ms, not per chunk
+        self._unscored_bytes = 0
+        self._silence_windows = 0
         self._speech_detected = False
 
-    def add_chunk(self, mulaw_chunk: bytes) -> Optional[bytes]:
+    def add_chunk(self, mulaw_chunk: bytes) -> Optional[bytearray]:
         """
         Add a 20ms mulaw chunk. Returns accumulated audio when ready
         (enough data + silence detected), or None if still buffering.
         """
         self._buffer.extend(mulaw_chunk)
-
-        # Check if this chunk is silence
-        try:
-            pcm = mulaw_decode(mulaw_chunk)
-            rms = audioop.rms(pcm, 2)
-        except Exception:
-            rms = 0
-
-        if rms < self._silence_threshold:
-            self._silence_chunks += 1
-        else:
-            self._silence_chunks = 0
-            self._speech_detected = True
+        self._unscored_bytes += len(mulaw_chunk)
+
+        # Check if the latest window is silence (>80% of samples quiet),
+        # classifying μ-law codes directly instead of decoding
+        unscored = self._unscored_bytes
+        if unscored >= self._vad_window:
+            window = self._buffer[-unscored:]
+            silent = window.translate(self._silent_codes).count(1)
+            self._unscored_bytes = 0
+            if silent * 5 >= unscored * 4:
+                self._silence_windows += 1
+            else:
+                self._silence_windows = 0
+                self._speech_detected = True
 
         # Return buffer if:
         # 1. We have enough audio AND silence detected (end of utterance)
@@ -270,20 +413,22 @@ class AudioBuffer:
 
         if (buffer_len >= self._min_bytes
                 and self._speech_detected
-                and self._silence_chunks >= 15):  # ~300ms of silence
+                and self._silence_windows >= 3):  # ~300ms of silence
             return self._flush()
 
         return None
 
-    def _flush(self) -> bytes:
+    def _flush(self) -> bytearray:
         """Return accumulated audio and reset buffer."""
-        audio = bytes(self._buffer)
-        self._buffer.clear()
-        self._silence_chunks = 0
+        # Hand off the filled buffer itself rather than copying it
+        audio = self._buffer
+        self._buffer = bytearray()
+        self._unscored_bytes = 0
+        self._silence_windows = 0
         self._speech_detected = False
         return audio
 
-    def flush_remaining(self) -> Optional[bytes]:
+    def flush_remaining(self) -> Optional[bytearray]:
         """Flush any remaining audio (e.g., on hangup)."""
         if len(self._buffer) > 160:  # At least one chunk
             return self._flush()
@@ -299,7 +444,7 @@ class AudioBuffer:
 # Twilio Media Stream Protocol Helpers
 # ═══════════════════════════════════════════════════════════════
 
-def create_media_message(stream_sid: str, mulaw_payload: bytes) -> dict:
+def create_media_message(stream_sid: str, mulaw_payload: Union[bytes, memoryview]) -> dict:
     """
     Create a Twilio Media Stream outbound 'media' message.
     The payload must be base64-encoded mulaw audio.
@@ -308,11 +453,28 @@ def create_media_message(stream_sid: str, mulaw_payload: bytes) -> dict:
         "event": "media",
         "streamSid": stream_sid,
         "media": {
-            "payload": base64.b64encode(mulaw_payload).decode("ascii")
+            # binascii directly: accepts memoryview chunks and skips b64encode's wrapper
+            "payload": binascii.b2a_base64(mulaw_payload, newline=False).decode("ascii")
         }
     }
 
 
+@lru_cache(maxsize=256)
+def _media_message_prefix(stream_sid: str) -> str:
+    """JSON text of a media message up to the start of the payload string."""
+    return '{"event":"media","streamSid":%s,"media":{"payload":"' % json.dumps(stream_sid)
+
+
+def create_media_message_json(stream_sid: str, mulaw_payload: Union[bytes, memoryview]) -> str:
+    """
+    Serialized form of create_media_message, ready for websocket.send_text.
+    Skips building the dict and running it through json.dumps per chunk;
+    base64 output never needs JSON escaping.
+    """
+    payload = binascii.b2a_base64(mulaw_payload, newline=False).decode("ascii")
+    return _media_message_prefix(stream_sid) + payload + '"}}'
+
+
 def create_mark_message(stream_sid: str, name: str = "endOfResponse") -> dict:
     """
     Create a Twilio Media Stream 'mark' message.
@@ -342,17 +504,15 @@ def create_clear_message(stream_sid: str) -> dict:
 # Chunk splitter for Twilio playback
 # ═══════════════════════════════════════════════════════════════
 
-def split_mulaw_for_twilio(mulaw_bytes: bytes, chunk_size: int = 640) -> list[bytes]:
+def split_mulaw_for_twilio(mulaw_bytes: bytes, chunk_size: int = 640) -> Iterator[memoryview]:
     """
     Split mulaw audio into chunks suitable for Twilio Media Stream playback.
     Default 640 bytes = 80ms at 8kHz (Twilio's recommended payload size).
+    Yields zero-copy views over the input; wrap in list() to keep them.
     """
-    chunks = []
-    for i in range(0, len(mulaw_bytes), chunk_size):
-        chunk = mulaw_bytes[i:i + chunk_size]
-        if len(chunk) > 0:
-            chunks.append(chunk)
-    return chunks
+    view = memoryview(mulaw_bytes)
+    for i in range(0, len(view), chunk_size):
+        yield view[i:i + chunk_size]
 
 
 __all__ = [
@@ -360,6 +520,7 @@ __all__ = [
     "mulaw_encode",
     "resample_8k_to_16k",
     "resample_16k_to_8k",
+    "Upsampler8kTo16k",
     "resample_to_8k",
     "pcm_to_wav",
     "mulaw_to_wav_16k",
@@ -367,6 +528,7 @@ __all__ = [
     "pcm_to_mulaw_8k",
     "AudioBuffer",
     "create_media_message",
+    "create_media_message_json",
     "create_mark_message",
     "create_clear_message",
     "split_mulaw_for_twilio",
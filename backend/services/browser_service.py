@@ -7,7 +7,7 @@ Enables Synthia to browse websites, extract data, take screenshots, and interact
 
 import os
 import asyncio
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 import base64
@@ -17,6 +17,56 @@ import json
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 
 
+# Page extractors, registered once per context as an init script so each
+# extract_data call sends a short function call instead of the full source
+SYNTHIA_EXTRACTOR_JS = """
+window.__synthia_extract_content = () => {
+    // Get main content, fallback to body
+    const article = document.querySelector('article');
+    const main = document.querySelector('main');
+    const body = document.body;
+    
+    const element = article || main || body;
+    return element.innerText.substring(0, 10000); // Limit to 10k chars
+};
+
+window.__synthia_extract_links = () => {
+    return Array.from(document.querySelectorAll('a[href]')).map(a => ({
+        text: a.innerText.trim().substring(0, 100),
+        href: a.href,
+    })).filter(l => l.text && l.href);
+};
+
+window.__synthia_extract_images = () => {
+    return Array.from(document.querySelectorAll('img[src]')).map(img => ({
+        alt: img.alt,
+        src: img.src,
+        width: img.width,
+        height: img.height,
+    })).filter(i => i.src);
+};
+
+window.__synthia_extract_meta = () => {
+    const meta = {};
+    document.querySelectorAll('meta').forEach(m => {
+        const name = m.getAttribute('name') || m.getAttribute('property');
+        const content = m.getAttribute('content');
+        if (name && content) {
+            meta[name] = content;
+        }
+    });
+    return meta;
+};
+
+window.__synthia_extract_all = () => ({
+    content: window.__synthia_extract_content(),
+    links: window.__synthia_extract_links(),
+    images: window.__synthia_extract_images(),
+    metadata: window.__synthia_extract_meta(),
+});
+"""
+
+
 @dataclass
 class BrowserSession:
     """Represents an active browser session."""
@@ -68,6 +118,10 @@ class BrowserService:
         self.sessions: Dict[str, BrowserSession] = {}
         self.playwright = None
         self._playwright_context = None
+        # One Chromium per headless mode, shared by all sessions; each
+        # session gets its own context for cookie/storage isolation
+        self._browsers: Dict[bool, Browser] = {}
+        self._browser_lock = asyncio.Lock()
         
     async def _get_playwright(self):
         """Initialize playwright if not already done."""
@@ -75,6 +129,16 @@ class BrowserService:
             self._playwright_context = await async_playwright().start()
         return self._playwright_context
     
+    async def _get_browser(self, headless: bool) -> Browser:
+        """Launch the shared browser for this mode on first use."""
+        async with self._browser_lock:
+            browser = self._browsers.get(headless)
+            if browser is None or not browser.is_connected():
+                pw = await self._get_playwright()
+                browser = await pw.chromium.launch(headless=headless)
+                self._browsers[headless] = browser
+            return browser
+    
     async def create_session(self, session_id: Optional[str] = None, headless: bool = True) -> str:
         """
         Create a new browser session.
@@ -89,14 +153,14 @@ class BrowserService:
         import uuid
         
         session_id = session_id or str(uuid.uuid4())
-        pw = await self._get_playwright()
         
-        # Launch browser
-        browser = await pw.chromium.launch(headless=headless)
+        # Reuse the running browser; a new context is all a session needs
+        browser = await self._get_browser(headless)
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         )
+        await context.add_init_script(script=SYNTHIA_EXTRACTOR_JS)
         page = await context.new_page()
         
         # Store session
@@ -159,79 +223,60 @@ class BrowserService:
         session = self.sessions[session_id]
         page = session.page
         
-        # Get basic info
-        title = await page.title()
         url = page.url
         
-        # Extract main content (text)
-        content = await page.evaluate("""() => {
-            // Get main content, fallback to body
-            const article = document.querySelector('article');
-            const main = document.querySelector('main');
-            const body = document.body;
-            
-            const element = article || main || body;
-            return element.innerText.substring(0, 10000); // Limit to 10k chars
-        }""")
-        
-        # Extract links
-        links = await page.evaluate("""() => {
-            return Array.from(document.querySelectorAll('a[href]')).map(a => ({
-                text: a.innerText.trim().substring(0, 100),
-                href: a.href,
-            })).filter(l => l.text && l.href);
-        }""")
-        
-        # Extract images
-        images = await page.evaluate("""() => {
-            return Array.from(document.querySelectorAll('img[src]')).map(img => ({
-                alt: img.alt,
-                src: img.src,
-                width: img.width,
-                height: img.height,
-            })).filter(i => i.src);
-        }""")
-        
-        # Extract metadata
-        metadata = await page.evaluate("""() => {
-            const meta = {};
-            document.querySelectorAll('meta').forEach(m => {
-                const name = m.getAttribute('name') || m.getAttribute('property');
-                const content = m.getAttribute('content');
-                if (name && content) {
-                    meta[name] = content;
-                }
-            });
-            return meta;
-        }""")
+        # Title plus content (text), links, images and metadata, requested together
+        title, extracted = await asyncio.gather(
+            page.title(),
+            page.evaluate("() => window.__synthia_extract_all()"),
+        )
         
         return ScrapedData(
             url=url,
             title=title,
-            content=content,
-            links=links[:50],  # Limit to 50 links
-            images=images[:20],  # Limit to 20 images
-            metadata=metadata
+            content=extracted["content"],
+            links=extracted["links"][:50],  # Limit to 50 links
+            images=extracted["images"][:20],  # Limit to 20 images
+            metadata=extracted["metadata"]
         )
     
-    async def take_screenshot(self, session_id: str, full_page: bool = False) -> str:
+    async def take_screenshot(
+        self,
+        session_id: str,
+        full_page: bool = False,
+        as_base64: bool = False,
+        image_format: str = "jpeg",
+        quality: int = 80,
+    ) -> Union[bytes, str]:
         """
         Take a screenshot of the current page.
         
         Args:
             session_id: Browser session ID
             full_page: Whether to capture full page or viewport
+            as_base64: Return a base64 string (e.g. for JSON, as in
+                ScrapedData.screenshot) instead of raw bytes
+            image_format: "jpeg" (compact, for vision models) or "png"
+                (lossless, for text-heavy pages)
+            quality: JPEG quality, ignored for PNG
             
         Returns:
-            Base64 encoded screenshot
+            Screenshot bytes, or base64 encoded screenshot if as_base64
         """
         if session_id not in self.sessions:
             raise ValueError(f"Session {session_id} not found")
         
         session = self.sessions[session_id]
         
-        screenshot_bytes = await session.page.screenshot(full_page=full_page)
-        return base64.b64encode(screenshot_bytes).decode('utf-8')
+        if image_format == "jpeg":
+            screenshot_bytes = await session.page.screenshot(
+                full_page=full_page, type="jpeg", quality=quality
+            )
+        else:
+            screenshot_bytes = await session.page.screenshot(full_page=full_page, type=image_format)
+        if as_base64:
+            return base64.b64encode(screenshot_bytes).decode('utf-8')
+        return screenshot_bytes
     
     async def click(self, session_id: str, selector: str) -> bool:
         """
@@ -336,8 +381,8 @@ class BrowserService:
         session = self.sessions[session_id]
         
         try:
+            # The browser is shared with other sessions and stays open
             await session.context.close()
-            await session.browser.close()
         except Exception as e:
             print(f"Error closing session: {e}")
         
@@ -348,6 +393,13 @@ class BrowserService:
         for session_id in list(self.sessions.keys()):
             await self.close_session(session_id)
         
+        for browser in self._browsers.values():
+            try:
+                await browser.close()
+            except Exception as e:
+                print(f"Error closing browser: {e}")
+        self._browsers.clear()
+        
         if self._playwright_context:
             await self._playwright_context.stop()
             self._playwright_context = None
@@ -7,7 +7,12 @@ Enables Synthia to read, write, and manage files in cloud storage.
 
 import os
 import io
-from typing import Optional, List, Dict, Any
+import asyncio
+import hashlib
+import threading
+import time
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, AsyncIterator, BinaryIO
 from dataclasses import dataclass
 from enum import Enum
 import base64
@@ -40,12 +45,89 @@ class StorageProvider(str, Enum):
     DROPBOX = "dropbox"
 
 
+# Drive allows up to 1000 results per page; request only the fields CloudFile uses
+DRIVE_LIST_PAGE_SIZE = 1000
+DRIVE_LIST_FIELDS = "nextPageToken, files(id, name, mimeType, size, modifiedTime, webViewLink, parents)"
+DRIVE_METADATA_FIELDS = "id, name, mimeType, size, modifiedTime, webViewLink, parents"
+# Dedupe also compares Drive's md5Checksum
+DRIVE_DEDUPE_FIELDS = "files(id, name, mimeType, size, modifiedTime, webViewLink, parents, md5Checksum)"
+
+# Dropbox content_hash: SHA-256 over the SHA-256 digests of 4 MiB blocks
+DROPBOX_HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Drive accepts at most 100 calls per batch request
+DRIVE_BATCH_LIMIT = 100
+
+# googleapiclient retries 429/5xx itself with exponential backoff
+DRIVE_NUM_RETRIES = 5
+DROPBOX_MAX_RETRIES = 5
+
+# Streamed downloads hold at most one chunk in memory
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Uploads are sent in chunks of this size (must be a multiple of 256 KiB for Drive)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Blocking SDK calls run in worker threads; cap how many each provider runs at once
+MAX_CONCURRENT_CALLS = 8
+# Drive folder listings are reused for this long (dashboard polling, dedupe scans)
+LIST_CACHE_TTL_SECONDS = 60.0
+LIST_CACHE_MAX_ENTRIES = 1024
+
+
+async def _in_thread(sem: asyncio.Semaphore, fn, *args, **kwargs):
+    """Run a blocking SDK call in a worker thread, bounded by `sem`."""
+    async with sem:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+async def _coalesced(inflight: Dict[str, asyncio.Future], key: str, factory):
+    """
+    Await `factory()` once per `key` among concurrent callers: callers that
+    arrive while a download is in flight share its result (or exception).
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shielded so one caller's cancellation doesn't abort the others' download
+    return await asyncio.shield(task)
+
+
+def _dropbox_content_hash(content: bytes) -> str:
+    """Dropbox's content_hash of `content`, for comparing against file metadata."""
+    view = memoryview(content)
+    digests = b"".join(
+        hashlib.sha256(view[i:i + DROPBOX_HASH_BLOCK_SIZE]).digest()
+        for i in range(0, len(content), DROPBOX_HASH_BLOCK_SIZE)
+    )
+    return hashlib.sha256(digests).hexdigest()
+
+
+def _drive_cloud_file(f: Dict[str, Any]) -> CloudFile:
+    """Build a CloudFile from a Drive files resource."""
+    return CloudFile(
+        id=f['id'],
+        name=f['name'],
+        mime_type=f['mimeType'],
+        size=int(f.get('size', 0)),
+        modified_time=f['modifiedTime'],
+        parent_id=f.get('parents', [None])[0],
+        web_view_link=f.get('webViewLink')
+    )
+
+
 class GoogleDriveService:
     """Google Drive integration for Synthia."""
     
     def __init__(self):
         self.credentials_path = os.getenv("GOOGLE_CREDENTIALS_PATH", "/app/config/google_credentials.json")
         self.service = None
+        self._credentials = None
+        self._local = threading.local()
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._list_cache: Dict[tuple, tuple] = {}
         
     def _get_service(self):
         """Initialize Google Drive service."""
@@ -59,12 +141,34 @@ class GoogleDriveService:
                     scopes=['https://www.googleapis.com/auth/drive']
                 )
                 self.service = build('drive', 'v3', credentials=credentials)
+                self._credentials = credentials
             except Exception as e:
                 raise ValueError(f"Failed to initialize Google Drive: {e}")
         return self.service
     
-    async def list_files(self, folder_id: Optional[str] = None, query: Optional[str] = None) -> List[CloudFile]:
-        """List files in Google Drive."""
+    def _thread_http(self):
+        """Authorized transport for the current worker thread (httplib2 is not thread-safe)."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = self._new_http()
+        return http
+    
+    def _new_http(self):
+        """A fresh authorized transport."""
+        import httplib2
+        import google_auth_httplib2
+        
+        return google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+    
+    async def _execute(self, request):
+        """Execute a Drive API request without blocking the event loop."""
+        return await _in_thread(
+            self._sem,
+            lambda: request.execute(http=self._thread_http(), num_retries=DRIVE_NUM_RETRIES),
+        )
+    
+    async def iter_files(self, folder_id: Optional[str] = None, query: Optional[str] = None) -> AsyncIterator[CloudFile]:
+        """Stream files in Google Drive, following nextPageToken across pages."""
         service = self._get_service()
         
         q = []
@@ -76,51 +180,105 @@ class GoogleDriveService:
         
         query_string = " and ".join(q) if q else None
         
-        results = service.files().list(
-            q=query_string,
-            pageSize=100,
-            fields="files(id, name, mimeType, size, modifiedTime, webViewLink, parents)"
-        ).execute()
-        
-        files = results.get('files', [])
-        
-        return [
-            CloudFile(
-                id=f['id'],
-                name=f['name'],
-                mime_type=f['mimeType'],
-                size=int(f.get('size', 0)),
-                modified_time=f['modifiedTime'],
-                parent_id=f.get('parents', [None])[0],
-                web_view_link=f.get('webViewLink')
+        page_token = None
+        while True:
+            request = service.files().list(
+                q=query_string,
+                pageSize=DRIVE_LIST_PAGE_SIZE,
+                pageToken=page_token,
+                fields=DRIVE_LIST_FIELDS
             )
-            for f in files
-        ]
+            results = await self._execute(request)
+            
+            for f in results.get('files', []):
+                yield _drive_cloud_file(f)
+            
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
     
-    async def download_file(self, file_id: str) -> CloudFile:
-        """Download a file from Google Drive."""
+    async def list_files(self, folder_id: Optional[str] = None, query: Optional[str] = None) -> List[CloudFile]:
+        """List all files in Google Drive (cached for LIST_CACHE_TTL_SECONDS)."""
+        key = (folder_id or None, query or None)
+        cached = self._list_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return list(cached[1])
+        
+        files = [f async for f in self.iter_files(folder_id=folder_id, query=query)]
+        
+        self._list_cache.pop(key, None)
+        if len(self._list_cache) >= LIST_CACHE_MAX_ENTRIES:
+            self._list_cache.pop(next(iter(self._list_cache)))
+        self._list_cache[key] = (time.monotonic() + LIST_CACHE_TTL_SECONDS, files)
+        return list(files)
+    
+    def _invalidate_listings(self, folder_id: Optional[str] = None, file_ids: tuple = ()):
+        """
+        Drop cached listings a write may have changed: those of `folder_id`,
+        unscoped (whole-drive) listings, and any listing containing `file_ids`.
+        """
+        file_ids = set(file_ids)
+        for key, (_, files) in list(self._list_cache.items()):
+            if key[0] is None or (folder_id and key[0] == folder_id) or (
+                file_ids and any(f.id in file_ids for f in files)
+            ):
+                del self._list_cache[key]
+    
+    async def download_to(self, file_id: str, sink: BinaryIO, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> CloudFile:
+        """
+        Stream a file from Google Drive into `sink`, one chunk at a time,
+        so memory stays at O(chunk_size). Returns the file's metadata.
+        """
+        from googleapiclient.http import MediaIoBaseDownload
+        
         service = self._get_service()
         
         # Get file metadata
-        file_metadata = service.files().get(fileId=file_id, fields="id, name, mimeType, size, modifiedTime").execute()
+        file_metadata = await self._execute(
+            service.files().get(fileId=file_id, fields="id, name, mimeType, size, modifiedTime")
+        )
         
-        # Download content
+        # Download content; chunks may run on different worker threads, so
+        # give this download a transport no other request is using
         request = service.files().get_media(fileId=file_id)
-        content = request.execute()
+        request.http = self._new_http()
+        downloader = MediaIoBaseDownload(sink, request, chunksize=chunk_size)
+        done = False
+        while not done:
+            _, done = await _in_thread(self._sem, downloader.next_chunk, num_retries=DRIVE_NUM_RETRIES)
         
         return CloudFile(
             id=file_metadata['id'],
             name=file_metadata['name'],
             mime_type=file_metadata['mimeType'],
             size=int(file_metadata.get('size', 0)),
-            modified_time=file_metadata['modifiedTime'],
-            content=content
+            modified_time=file_metadata['modifiedTime']
         )
     
-    async def upload_file(self, name: str, content: bytes, mime_type: str, folder_id: Optional[str] = None) -> CloudFile:
-        """Upload a file to Google Drive."""
+    async def download_file(self, file_id: str) -> CloudFile:
+        """Download a file from Google Drive into memory."""
+        return await _coalesced(self._inflight, file_id, lambda: self._download_file(file_id))
+    
+    async def _download_file(self, file_id: str) -> CloudFile:
+        buffer = io.BytesIO()
+        cloud_file = await self.download_to(file_id, buffer)
+        cloud_file.content = buffer.getvalue()
+        return cloud_file
+    
+    async def upload_file(
+        self, name: str, content: bytes, mime_type: str, folder_id: Optional[str] = None, dedupe: bool = True
+    ) -> CloudFile:
+        """
+        Upload a file to Google Drive. With `dedupe`, an identical file
+        (same name and MD5) already in the folder is returned instead.
+        """
         service = self._get_service()
         
+        if dedupe:
+            existing = await self._find_duplicate(name, content, folder_id)
+            if existing is not None:
+                return existing
+        
         from googleapiclient.http import MediaIoBaseUpload
         
         file_metadata = {'name': name}
@@ -130,14 +288,22 @@ class GoogleDriveService:
         media = MediaIoBaseUpload(
             io.BytesIO(content),
             mimetype=mime_type,
+            chunksize=UPLOAD_CHUNK_SIZE,
             resumable=True
         )
         
-        file = service.files().create(
+        request = service.files().create(
             body=file_metadata,
             media_body=media,
             fields='id, name, mimeType, size, modifiedTime, webViewLink'
-        ).execute()
+        )
+        # Send one chunk per worker-thread call; a failed chunk is retried
+        # from the resumable session rather than restarting the upload
+        request.http = self._new_http()
+        file = None
+        while file is None:
+            _, file = await _in_thread(self._sem, request.next_chunk, num_retries=DRIVE_NUM_RETRIES)
+        self._invalidate_listings(folder_id)
         
         return CloudFile(
             id=file['id'],
@@ -148,6 +314,29 @@ class GoogleDriveService:
             web_view_link=file.get('webViewLink')
         )
     
+    async def _find_duplicate(self, name: str, content: bytes, folder_id: Optional[str]) -> Optional[CloudFile]:
+        """A file in the target folder with this name and content, if any."""
+        service = self._get_service()
+        escaped = name.replace("\\", "\\\\").replace("'", "\\'")
+        results = await self._execute(service.files().list(
+            q=f"name = '{escaped}' and '{folder_id or 'root'}' in parents and trashed = false",
+            pageSize=DRIVE_LIST_PAGE_SIZE,
+            fields=DRIVE_DEDUPE_FIELDS
+        ))
+        
+        digest = None
+        for f in results.get('files', []):
+            # Only hash the upload if a same-sized candidate exists
+            if 'md5Checksum' not in f or int(f.get('size', -1)) != len(content):
+                continue
+            if digest is None:
+                digest = await asyncio.to_thread(
+                    lambda: hashlib.md5(content, usedforsecurity=False).hexdigest()
+                )
+            if f['md5Checksum'] == digest:
+                return _drive_cloud_file(f)
+        return None
+    
     async def create_folder(self, name: str, parent_id: Optional[str] = None) -> CloudFolder:
         """Create a folder in Google Drive."""
         service = self._get_service()
@@ -159,7 +348,8 @@ class GoogleDriveService:
         if parent_id:
             file_metadata['parents'] = [parent_id]
         
-        folder = service.files().create(body=file_metadata, fields='id, name, parents').execute()
+        folder = await self._execute(service.files().create(body=file_metadata, fields='id, name, parents'))
+        self._invalidate_listings(parent_id)
         
         return CloudFolder(
             id=folder['id'],
@@ -172,12 +362,90 @@ class GoogleDriveService:
         service = self._get_service()
         
         try:
-            service.files().delete(fileId=file_id).execute()
+            await self._execute(service.files().delete(fileId=file_id))
+            self._invalidate_listings(file_ids=(file_id,))
             return True
         except Exception as e:
             print(f"Delete failed: {e}")
             return False
 
+    
+    # ─── Batched operations ──────────────────────────────────
+    
+    def _execute_batch(self, requests: List[tuple]) -> Dict[str, Any]:
+        """
+        Run (request_id, request) pairs as Drive batch requests of up to 100
+        calls each. Returns the response, or the exception, per request_id.
+        """
+        service = self._get_service()
+        results: Dict[str, Any] = {}
+        
+        def _collect(request_id, response, exception):
+            results[request_id] = exception if exception is not None else response
+        
+        for start in range(0, len(requests), DRIVE_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=_collect)
+            for request_id, request in requests[start:start + DRIVE_BATCH_LIMIT]:
+                batch.add(request, request_id=request_id)
+            batch.execute(http=self._thread_http())
+        return results
+    
+    async def batch_get_metadata(self, file_ids: List[str]) -> Dict[str, Optional[CloudFile]]:
+        """Fetch metadata for many files in batched calls (None for failures)."""
+        service = self._get_service()
+        requests = [
+            (file_id, service.files().get(fileId=file_id, fields=DRIVE_METADATA_FIELDS))
+            for file_id in dict.fromkeys(file_ids)
+        ]
+        results = await _in_thread(self._sem, self._execute_batch, requests)
+        return {
+            file_id: None if isinstance(result, Exception) else _drive_cloud_file(result)
+            for file_id, result in results.items()
+        }
+    
+    async def batch_delete(self, file_ids: List[str]) -> Dict[str, bool]:
+        """Delete many files in batched calls. Returns success per file ID."""
+        service = self._get_service()
+        requests = [
+            (file_id, service.files().delete(fileId=file_id))
+            for file_id in dict.fromkeys(file_ids)
+        ]
+        results = await _in_thread(self._sem, self._execute_batch, requests)
+        for file_id, result in results.items():
+            if isinstance(result, Exception):
+                print(f"Delete failed for {file_id}: {result}")
+        self._invalidate_listings(file_ids=tuple(results))
+        return {file_id: not isinstance(result, Exception) for file_id, result in results.items()}
+    
+    async def batch_create_folders(self, names: List[str], parent_id: Optional[str] = None) -> List[Optional[CloudFolder]]:
+        """Create many folders in batched calls, in order (None for failures)."""
+        service = self._get_service()
+        requests = []
+        for index, name in enumerate(names):
+            file_metadata = {
+                'name': name,
+                'mimeType': 'application/vnd.google-apps.folder'
+            }
+            if parent_id:
+                file_metadata['parents'] = [parent_id]
+            request = service.files().create(body=file_metadata, fields='id, name, parents')
+            requests.append((str(index), request))
+        
+        results = await _in_thread(self._sem, self._execute_batch, requests)
+        self._invalidate_listings(parent_id)
+        folders: List[Optional[CloudFolder]] = []
+        for index in range(len(names)):
+            folder = results.get(str(index))
+            if folder is None or isinstance(folder, Exception):
+                folders.append(None)
+            else:
+                folders.append(CloudFolder(
+                    id=folder['id'],
+                    name=folder['name'],
+                    parent_id=folder.get('parents', [None])[0]
+                ))
+        return folders
+
 
 class DropboxService:
     """Dropbox integration for Synthia."""
@@ -185,22 +453,31 @@ class DropboxService:
     def __init__(self):
         self.access_token = os.getenv("DROPBOX_ACCESS_TOKEN")
         self.dbx = None
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+        self._inflight: Dict[str, asyncio.Future] = {}
         
     def _get_client(self):
         """Initialize Dropbox client."""
         if self.dbx is None:
             try:
                 import dropbox
-                self.dbx = dropbox.Dropbox(self.access_token)
+                # The SDK backs off on 5xx and honors rate-limit backoff itself
+                self.dbx = dropbox.Dropbox(
+                    self.access_token,
+                    max_retries_on_error=DROPBOX_MAX_RETRIES,
+                    max_retries_on_rate_limit=DROPBOX_MAX_RETRIES,
+                )
             except Exception as e:
                 raise ValueError(f"Failed to initialize Dropbox: {e}")
         return self.dbx
     
     async def list_files(self, path: str = "", query: Optional[str] = None) -> List[CloudFile]:
         """List files in Dropbox."""
+        import dropbox
+        
         dbx = self._get_client()
         
-        result = dbx.files_list_folder(path if path else "")
+        result = await _in_thread(self._sem, dbx.files_list_folder, path if path else "")
         
         files = []
         for entry in result.entries:
@@ -216,27 +493,56 @@ class DropboxService:
         
         return files
     
-    async def download_file(self, path: str) -> CloudFile:
-        """Download a file from Dropbox."""
+    async def download_to(self, path: str, sink: BinaryIO, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> CloudFile:
+        """
+        Stream a file from Dropbox into `sink`, one chunk at a time,
+        so memory stays at O(chunk_size). Returns the file's metadata.
+        """
         dbx = self._get_client()
         
-        metadata, response = dbx.files_download(path)
-        content = response.content
+        def _download():
+            metadata, response = dbx.files_download(path)
+            with response:
+                for block in response.iter_content(chunk_size):
+                    sink.write(block)
+            return metadata
+        
+        metadata = await _in_thread(self._sem, _download)
         
         return CloudFile(
             id=metadata.id,
             name=metadata.name,
             mime_type=metadata.content_type or "application/octet-stream",
             size=metadata.size,
-            modified_time=metadata.server_modified.isoformat(),
-            content=content
+            modified_time=metadata.server_modified.isoformat()
         )
     
-    async def upload_file(self, path: str, content: bytes) -> CloudFile:
-        """Upload a file to Dropbox."""
+    async def download_file(self, path: str) -> CloudFile:
+        """Download a file from Dropbox into memory."""
+        return await _coalesced(self._inflight, path, lambda: self._download_file(path))
+    
+    async def _download_file(self, path: str) -> CloudFile:
+        buffer = io.BytesIO()
+        cloud_file = await self.download_to(path, buffer)
+        cloud_file.content = buffer.getvalue()
+        return cloud_file
+    
+    async def upload_file(self, path: str, content: bytes, dedupe: bool = True) -> CloudFile:
+        """
+        Upload a file to Dropbox, using an upload session for large files.
+        With `dedupe`, an identical file already at `path` is returned instead.
+        """
         dbx = self._get_client()
         
-        result = dbx.files_upload(content, path)
+        if dedupe:
+            existing = await self._find_duplicate(dbx, path, content)
+            if existing is not None:
+                return existing
+        
+        if len(content) <= UPLOAD_CHUNK_SIZE:
+            result = await _in_thread(self._sem, dbx.files_upload, content, path)
+        else:
+            result = await self._upload_session(dbx, path, content)
         
         return CloudFile(
             id=result.id,
@@ -246,11 +552,50 @@ class DropboxService:
             modified_time=result.server_modified.isoformat()
         )
     
+    async def _find_duplicate(self, dbx, path: str, content: bytes) -> Optional[CloudFile]:
+        """The file at `path`, if its content_hash matches `content`."""
+        import dropbox
+        
+        try:
+            metadata = await _in_thread(self._sem, dbx.files_get_metadata, path)
+        except dropbox.exceptions.ApiError:
+            return None  # nothing there yet
+        if getattr(metadata, "content_hash", None) is None or metadata.size != len(content):
+            return None
+        if metadata.content_hash != await asyncio.to_thread(_dropbox_content_hash, content):
+            return None
+        
+        return CloudFile(
+            id=metadata.id,
+            name=metadata.name,
+            mime_type="application/octet-stream",
+            size=metadata.size,
+            modified_time=metadata.server_modified.isoformat()
+        )
+    
+    async def _upload_session(self, dbx, path: str, content: bytes):
+        """Upload in chunks (files_upload is capped at 150 MB)."""
+        import dropbox
+        
+        chunk = UPLOAD_CHUNK_SIZE
+        session = await _in_thread(self._sem, dbx.files_upload_session_start, content[:chunk])
+        cursor = dropbox.files.UploadSessionCursor(session_id=session.session_id, offset=chunk)
+        while len(content) - cursor.offset > chunk:
+            await _in_thread(
+                self._sem, dbx.files_upload_session_append_v2,
+                content[cursor.offset:cursor.offset + chunk], cursor
+            )
+            cursor.offset += chunk
+        return await _in_thread(
+            self._sem, dbx.files_upload_session_finish,
+            content[cursor.offset:], cursor, dropbox.files.CommitInfo(path=path)
+        )
+    
     async def create_folder(self, path: str) -> CloudFolder:
         """Create a folder in Dropbox."""
         dbx = self._get_client()
         
-        result = dbx.files_create_folder_v2(path)
+        result = await _in_thread(self._sem, dbx.files_create_folder_v2, path)
         
         return CloudFolder(
             id=result.metadata.id,
@@ -262,7 +607,7 @@ class DropboxService:
         dbx = self._get_client()
         
         try:
-            dbx.files_delete_v2(path)
+            await _in_thread(self._sem, dbx.files_delete_v2, path)
             return True
         except Exception as e:
             print(f"Delete failed: {e}")
@@ -278,42 +623,62 @@ class CloudStorageService:
     def __init__(self):
         self.google_drive = GoogleDriveService()
         self.dropbox = DropboxService()
+        self._providers = {
+            StorageProvider.GOOGLE_DRIVE: self.google_drive,
+            StorageProvider.DROPBOX: self.dropbox,
+        }
+    
+    def _provider(self, provider: StorageProvider):
+        service = self._providers.get(provider)
+        if service is None:
+            raise ValueError(f"Unknown provider: {provider}")
+        return service
     
     async def list_files(self, provider: StorageProvider, **kwargs) -> List[CloudFile]:
         """List files from specified provider."""
-        if provider == StorageProvider.GOOGLE_DRIVE:
-            return await self.google_drive.list_files(**kwargs)
-        elif provider == StorageProvider.DROPBOX:
-            return await self.dropbox.list_files(**kwargs)
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+        return await self._provider(provider).list_files(**kwargs)
     
     async def download_file(self, provider: StorageProvider, **kwargs) -> CloudFile:
         """Download file from specified provider."""
-        if provider == StorageProvider.GOOGLE_DRIVE:
-            return await self.google_drive.download_file(**kwargs)
-        elif provider == StorageProvider.DROPBOX:
-            return await self.dropbox.download_file(**kwargs)
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+        return await self._provider(provider).download_file(**kwargs)
     
     async def upload_file(self, provider: StorageProvider, **kwargs) -> CloudFile:
         """Upload file to specified provider."""
-        if provider == StorageProvider.GOOGLE_DRIVE:
-            return await self.google_drive.upload_file(**kwargs)
-        elif provider == StorageProvider.DROPBOX:
-            return await self.dropbox.upload_file(**kwargs)
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
-
+        return await self._provider(provider).upload_file(**kwargs)
+    
+    async def download_many(
+        self, provider: StorageProvider, refs: List[str], concurrency: int = 6
+    ) -> List[CloudFile]:
+        """
+        Download several files concurrently, at most `concurrency` at a time.
+        `refs` are file IDs for Google Drive and paths for Dropbox.
+        """
+        key = "file_id" if provider == StorageProvider.GOOGLE_DRIVE else "path"
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def _one(ref: str) -> CloudFile:
+            async with sem:
+                return await self.download_file(provider, **{key: ref})
+        
+        return await asyncio.gather(*(_one(ref) for ref in refs))
+    
+    async def upload_many(
+        self, provider: StorageProvider, uploads: List[Dict[str, Any]], concurrency: int = 6
+    ) -> List[CloudFile]:
+        """
+        Upload several files concurrently, at most `concurrency` at a time.
+        Each entry holds the keyword arguments for that provider's upload_file.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def _one(kwargs: Dict[str, Any]) -> CloudFile:
+            async with sem:
+                return await self.upload_file(provider, **kwargs)
+        
+        return await asyncio.gather(*(_one(kwargs) for kwargs in uploads))
 
 # Singleton instance
-_cloud_storage_service: Optional[CloudStorageService] = None
-
-
+@lru_cache(maxsize=1)
 def get_cloud_storage_service() -> CloudStorageService:
     """Get or create cloud storage service singleton."""
-    global _cloud_storage_service
-    if _cloud_storage_service is None:
-        _cloud_storage_service = CloudStorageService()
-    return _cloud_storage_service
+    return CloudStorageService()
@@ -3,22 +3,56 @@ Synthia 4.2 - Dashboard Sync Service
 
 Pushes job status + metrics to the dashboard-agent-swarm
 via webhook or WebSocket broadcast.
+
+Pushes are queued and delivered by a background task over one pooled
+client, so callers never wait on the webhook. Queued events are POSTed
+as a JSON array of up to DASHBOARD_BATCH_SIZE event objects. Callers
+that own a short-lived event loop (Celery tasks) call `flush()` before
+the loop ends.
 """
 
 import os
+import json
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Optional, Any
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+DASHBOARD_QUEUE_SIZE = 10_000
+DASHBOARD_BATCH_SIZE = 32
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# orjson is optional — faster serialization of event batches
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize to compact JSON bytes, preferring orjson."""
+    if _orjson_available:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits — let json handle it
+    return json.dumps(value, separators=(",", ":")).encode()
+
 
 class DashboardSync:
     """Push pipeline state to external dashboard."""
 
     def __init__(self):
         self.webhook_url = os.getenv("DASHBOARD_WEBHOOK_URL", "")
+        self._client: Optional[httpx.AsyncClient] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     @property
     def is_available(self) -> bool:
@@ -37,8 +71,8 @@ class DashboardSync:
             "niche": job.niche,
             "page_type": job.page_type,
             "steps_completed": len(job.results_per_step),
-            "started_at": job.started_at,
-            "completed_at": job.completed_at,
+            "started_at": job.started_at_iso,
+            "completed_at": job.completed_at_iso,
             "error": job.error,
         }
         return await self._post(payload)
@@ -56,26 +90,81 @@ class DashboardSync:
         return await self._post(payload)
 
     async def _post(self, payload: dict) -> bool:
-        """POST JSON to webhook URL."""
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.post(self.webhook_url, json=payload)
+        """Queue a payload for background delivery to the webhook."""
+        if self._loop is not asyncio.get_running_loop() or self._task is None or self._task.done():
+            self._start()
+        if self._queue.full():
+            # Dashboard is falling behind; the oldest update is the least useful
+            self._queue.get_nowait()
+            self._queue.task_done()
+            logger.debug("Dashboard queue full, dropped oldest event")
+        self._queue.put_nowait(payload)
+        return True
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or a new loop (Celery runs each job under its own):
+            # the queue, client and consumer of the old loop can't run here.
+            # Carry over undelivered events.
+            pending = []
+            while self._queue is not None and not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._queue = asyncio.Queue(maxsize=DASHBOARD_QUEUE_SIZE)
+            for payload in pending:
+                self._queue.put_nowait(payload)
+            self._client = httpx.AsyncClient(timeout=10.0)
+            self._loop = loop
+        self._task = asyncio.create_task(self._consume())
+
+    async def _consume(self) -> None:
+        """
+        Drain the queue, POSTing up to DASHBOARD_BATCH_SIZE events at a time.
+        Exits once the queue is empty (the next push restarts it), so no idle
+        task outlives a short-lived loop.
+        """
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            while len(batch) < DASHBOARD_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                resp = await self._client.post(self.webhook_url, content=_dumps(batch), headers=JSON_HEADERS)
                 resp.raise_for_status()
-                return True
-        except Exception as e:
-            logger.debug("Dashboard push failed: %s", e)
-            return False
+            except Exception as e:
+                logger.debug("Dashboard push failed: %s", e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def flush(self, timeout: float = 5.0) -> None:
+        """Wait (up to `timeout` seconds) until queued events are delivered."""
+        if self._task is None or self._loop is not asyncio.get_running_loop():
+            return
+        if self._task.done() and not self._queue.empty():
+            self._start()
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Dashboard flush timed out, %d events pending", self._queue.qsize())
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """Flush queued events (up to `timeout` seconds) and close the client."""
+        if self._loop is not asyncio.get_running_loop():
+            return  # nothing was started on this loop
+        await self.flush(timeout)
+        if self._task is not None:
+            self._task.cancel()  # only still running if the flush timed out
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._loop = None
 
 
 # Singleton
-_dashboard_sync: Optional[DashboardSync] = None
-
-
+@lru_cache(maxsize=1)
 def get_dashboard_sync() -> DashboardSync:
-    global _dashboard_sync
-    if _dashboard_sync is None:
-        _dashboard_sync = DashboardSync()
-    return _dashboard_sync
+    return DashboardSync()
 
 
 __all__ = ["DashboardSync", "get_dashboard_sync"]
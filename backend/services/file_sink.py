@@ -0,0 +1,40 @@
+"""
+Synthia File Sinks - The Pauli Effect
+
+Async writers for generated assets (images, videos, downloads).
+Services write through these helpers rather than calling `open()` on
+the event loop; the blocking file I/O runs in asyncio's default thread
+pool.
+"""
+
+import os
+import asyncio
+from typing import AsyncIterator
+
+
+async def write_bytes(path: str, data: bytes) -> str:
+    """Write a whole file without blocking the event loop."""
+    await asyncio.to_thread(_write_file, path, data)
+    return path
+
+
+async def write_stream(path: str, chunks: AsyncIterator[bytes]) -> str:
+    """Write chunks as they arrive; a failed stream leaves no partial file."""
+    f = await asyncio.to_thread(open, path, "wb")
+    try:
+        async for chunk in chunks:
+            await asyncio.to_thread(f.write, chunk)
+    except BaseException:
+        await asyncio.to_thread(f.close)
+        os.remove(path)
+        raise
+    await asyncio.to_thread(f.close)
+    return path
+
+
+def _write_file(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+__all__ = ["write_bytes", "write_stream"]
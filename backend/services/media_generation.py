@@ -10,14 +10,68 @@ Integrates top image and video generators:
 """
 
 import os
+import json
 import asyncio
 import httpx
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Union
 from dataclasses import dataclass
 from enum import Enum
-import base64
+import binascii
 import io
 
+from services.retry import retry_http
+from services.file_sink import write_bytes, write_stream
+
+# orjson is optional — faster parsing of provider responses
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+# Downloads are streamed to disk in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Provider endpoints
+NANO_BANANA_URL = "https://api.nanobanana.ai/v1/generate"
+DALLE_URL = "https://api.openai.com/v1/images/generations"
+STABILITY_URL = "https://api.stability.ai/v1/generation/stable-diffusion-xl-1024-v1-0/text-to-image"
+RUNWAY_URL = "https://api.runwayml.com/v1/generations"
+PIKA_URL = "https://api.pika.art/v1/generations"
+
+# Video jobs are polled every 2s, backing off to 30s, for up to 10 minutes
+VIDEO_POLL_INITIAL_SECONDS = 2.0
+VIDEO_POLL_MAX_SECONDS = 30.0
+VIDEO_POLL_TIMEOUT_SECONDS = 600.0
+VIDEO_JOB_SUCCEEDED = frozenset({"succeeded", "completed", "finished"})
+VIDEO_JOB_FAILED = frozenset({"failed", "error", "cancelled", "canceled"})
+
+# Concurrent in-flight requests allowed per provider; bursts beyond this
+# queue locally instead of tripping the provider's 429 rate limiting
+PROVIDER_CONCURRENCY = {
+    "nano_banana": 4,
+    "dalle": 5,
+    "stable_diffusion": 10,
+    "runway_ml": 4,
+    "pika_labs": 4,
+}
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body, preferring orjson."""
+    return orjson.loads(data) if _orjson_available else json.loads(data)
+
+
+def _bearer_headers(api_key: Optional[str]) -> Optional[Dict[str, str]]:
+    """JSON request headers for a bearer-token provider (None without a key)."""
+    if not api_key:
+        return None
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
 
 class ImageProvider(str, Enum):
     NANO_BANANA = "nano_banana"
@@ -39,6 +93,7 @@ class GeneratedImage:
     prompt: str
     local_path: Optional[str] = None
     base64_data: Optional[str] = None
+    content: Optional[bytes] = None  # raw image bytes, when the provider returns them
 
 
 @dataclass
@@ -48,6 +103,7 @@ class GeneratedVideo:
     prompt: str
     duration: int = 4  # seconds
     status: str = "completed"
+    job_id: Optional[str] = None
 
 
 class MediaGenerationService:
@@ -66,10 +122,48 @@ class MediaGenerationService:
         self.stability_api_key = os.getenv("STABILITY_API_KEY")
         self.heygen_api_key = os.getenv("HEY_GEN_API")
         
+        # Request headers never change after startup, so build them once
+        self._nano_headers = _bearer_headers(self.nano_banana_api_key)
+        self._dalle_headers = _bearer_headers(self.openai_api_key)
+        self._stability_headers = _bearer_headers(self.stability_api_key)
+        if self._stability_headers:
+            # Ask for the PNG itself rather than base64 inside JSON (~33% smaller)
+            self._stability_headers["Accept"] = "image/png"
+        self._runway_headers = _bearer_headers(self.runway_api_key)
+        self._pika_headers = _bearer_headers(self.pika_api_key)
+        self._provider_sem = {
+            name: asyncio.Semaphore(limit) for name, limit in PROVIDER_CONCURRENCY.items()
+        }
+        
+        # Shared HTTP client so provider calls reuse pooled connections
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        self._image_generators = {
+            ImageProvider.NANO_BANANA: self.generate_image_nano_banana,
+            ImageProvider.DALLE: self.generate_image_dalle,
+            ImageProvider.STABLE_DIFFUSION: self.generate_image_stable_diffusion,
+        }
+        
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0),
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (called on app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        
     # ═══════════════════════════════════════════════════════════════
     # IMAGE GENERATION
     # ═══════════════════════════════════════════════════════════════
     
+    @retry_http
     async def generate_image_nano_banana(
         self,
         prompt: str,
@@ -84,13 +178,6 @@ class MediaGenerationService:
         if not self.nano_banana_api_key:
             raise ValueError("NANO_BANANA_API_KEY not configured")
         
-        url = "https://api.nanobanana.ai/v1/generate"
-        
-        headers = {
-            "Authorization": f"Bearer {self.nano_banana_api_key}",
-            "Content-Type": "application/json",
-        }
-        
         payload = {
             "prompt": prompt,
             "width": width,
@@ -99,17 +186,19 @@ class MediaGenerationService:
             "num_images": 1,
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            return GeneratedImage(
-                url=data["images"][0]["url"],
-                provider="nano_banana",
-                prompt=prompt
-            )
+        client = self._get_client()
+        async with self._provider_sem["nano_banana"]:
+            response = await client.post(NANO_BANANA_URL, json=payload, headers=self._nano_headers)
+        response.raise_for_status()
+        data = _loads(response.content)
+        
+        return GeneratedImage(
+            url=data["images"][0]["url"],
+            provider="nano_banana",
+            prompt=prompt
+        )
     
+    @retry_http
     async def generate_image_dalle(
         self,
         prompt: str,
@@ -124,13 +213,6 @@ class MediaGenerationService:
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY not configured")
         
-        url = "https://api.openai.com/v1/images/generations"
-        
-        headers = {
-            "Authorization": f"Bearer {self.openai_api_key}",
-            "Content-Type": "application/json",
-        }
-        
         payload = {
             "model": "dall-e-3",
             "prompt": prompt,
@@ -140,17 +222,19 @@ class MediaGenerationService:
             "style": style,
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            return GeneratedImage(
-                url=data["data"][0]["url"],
-                provider="dalle",
-                prompt=prompt
-            )
+        client = self._get_client()
+        async with self._provider_sem["dalle"]:
+            response = await client.post(DALLE_URL, json=payload, headers=self._dalle_headers)
+        response.raise_for_status()
+        data = _loads(response.content)
+        
+        return GeneratedImage(
+            url=data["data"][0]["url"],
+            provider="dalle",
+            prompt=prompt
+        )
     
+    @retry_http
     async def generate_image_stable_diffusion(
         self,
         prompt: str,
@@ -166,13 +250,6 @@ class MediaGenerationService:
         if not self.stability_api_key:
             raise ValueError("STABILITY_API_KEY not configured")
         
-        url = "https://api.stability.ai/v1/generation/stable-diffusion-xl-1024-v1-0/text-to-image"
-        
-        headers = {
-            "Authorization": f"Bearer {self.stability_api_key}",
-            "Content-Type": "application/json",
-        }
-        
         payload = {
             "text_prompts": [{"text": prompt}],
             "cfg_scale": cfg_scale,
@@ -182,20 +259,17 @@ class MediaGenerationService:
             "height": height,
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Stability returns base64
-            image_data = data["artifacts"][0]["base64"]
-            
-            return GeneratedImage(
-                url="",  # Base64 only
-                provider="stable_diffusion",
-                prompt=prompt,
-                base64_data=image_data
-            )
+        client = self._get_client()
+        async with self._provider_sem["stable_diffusion"]:
+            response = await client.post(STABILITY_URL, json=payload, headers=self._stability_headers)
+        response.raise_for_status()
+        
+        return GeneratedImage(
+            url="",  # Raw bytes only
+            provider="stable_diffusion",
+            prompt=prompt,
+            content=response.content
+        )
     
     async def generate_image(
         self,
@@ -207,14 +281,10 @@ class MediaGenerationService:
         Generate image using specified provider.
         Synthia intelligently selects the best provider for the task.
         """
-        if provider == ImageProvider.NANO_BANANA:
-            return await self.generate_image_nano_banana(prompt, **kwargs)
-        elif provider == ImageProvider.DALLE:
-            return await self.generate_image_dalle(prompt, **kwargs)
-        elif provider == ImageProvider.STABLE_DIFFUSION:
-            return await self.generate_image_stable_diffusion(prompt, **kwargs)
-        else:
+        generate = self._image_generators.get(provider)
+        if generate is None:
             raise ValueError(f"Unknown provider: {provider}")
+        return await generate(prompt, **kwargs)
     
     # ═══════════════════════════════════════════════════════════════
     # VIDEO GENERATION
@@ -225,22 +295,29 @@ class MediaGenerationService:
         prompt: str,
         image_url: Optional[str] = None,
         duration: int = 4,
-        motion_scale: float = 1.0
+        motion_scale: float = 1.0,
+        wait: bool = True
     ) -> GeneratedVideo:
         """
         Generate video using RunwayML Gen-2
         Industry-leading AI video generation.
+        With wait=False, returns the submitted job without polling it.
         """
+        video = await self.submit_video_runway(prompt, image_url, duration, motion_scale)
+        return await self.poll_video_runway(video) if wait else video
+    
+    @retry_http
+    async def submit_video_runway(
+        self,
+        prompt: str,
+        image_url: Optional[str] = None,
+        duration: int = 4,
+        motion_scale: float = 1.0
+    ) -> GeneratedVideo:
+        """Submit a RunwayML generation job."""
         if not self.runway_api_key:
             raise ValueError("RUNWAY_API_KEY not configured")
         
-        url = "https://api.runwayml.com/v1/generations"
-        
-        headers = {
-            "Authorization": f"Bearer {self.runway_api_key}",
-            "Content-Type": "application/json",
-        }
-        
         payload = {
             "text_prompt": prompt,
             "duration": duration,
@@ -250,40 +327,53 @@ class MediaGenerationService:
         if image_url:
             payload["image_url"] = image_url
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            return GeneratedVideo(
-                url=data.get("url", ""),
-                provider="runway_ml",
-                prompt=prompt,
-                duration=duration,
-                status="processing"
-            )
+        client = self._get_client()
+        async with self._provider_sem["runway_ml"]:
+            response = await client.post(RUNWAY_URL, json=payload, headers=self._runway_headers)
+        response.raise_for_status()
+        data = _loads(response.content)
+        
+        return GeneratedVideo(
+            url=data.get("url", ""),
+            provider="runway_ml",
+            prompt=prompt,
+            duration=duration,
+            status="processing",
+            job_id=data.get("id")
+        )
+    
+    async def poll_video_runway(self, video: GeneratedVideo) -> GeneratedVideo:
+        """Wait for a submitted RunwayML job to finish."""
+        return await self._poll_video(video, RUNWAY_URL, self._runway_headers)
     
     async def generate_video_pika(
         self,
         prompt: str,
         image_url: Optional[str] = None,
         duration: int = 3,
-        guidance_scale: float = 12.0
+        guidance_scale: float = 12.0,
+        wait: bool = True
     ) -> GeneratedVideo:
         """
         Generate video using Pika Labs
         Fast, creative video generation.
+        With wait=False, returns the submitted job without polling it.
         """
+        video = await self.submit_video_pika(prompt, image_url, duration, guidance_scale)
+        return await self.poll_video_pika(video) if wait else video
+    
+    @retry_http
+    async def submit_video_pika(
+        self,
+        prompt: str,
+        image_url: Optional[str] = None,
+        duration: int = 3,
+        guidance_scale: float = 12.0
+    ) -> GeneratedVideo:
+        """Submit a Pika Labs generation job."""
         if not self.pika_api_key:
             raise ValueError("PIKA_API_KEY not configured")
         
-        url = "https://api.pika.art/v1/generations"
-        
-        headers = {
-            "Authorization": f"Bearer {self.pika_api_key}",
-            "Content-Type": "application/json",
-        }
-        
         payload = {
             "prompt": prompt,
             "duration": duration,
@@ -293,18 +383,63 @@ class MediaGenerationService:
         if image_url:
             payload["image_url"] = image_url
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            return GeneratedVideo(
-                url=data.get("url", ""),
-                provider="pika_labs",
-                prompt=prompt,
-                duration=duration,
-                status="processing"
-            )
+        client = self._get_client()
+        async with self._provider_sem["pika_labs"]:
+            response = await client.post(PIKA_URL, json=payload, headers=self._pika_headers)
+        response.raise_for_status()
+        data = _loads(response.content)
+        
+        return GeneratedVideo(
+            url=data.get("url", ""),
+            provider="pika_labs",
+            prompt=prompt,
+            duration=duration,
+            status="processing",
+            job_id=data.get("id")
+        )
+    
+    async def poll_video_pika(self, video: GeneratedVideo) -> GeneratedVideo:
+        """Wait for a submitted Pika Labs job to finish."""
+        return await self._poll_video(video, PIKA_URL, self._pika_headers)
+    
+    async def _poll_video(self, video: GeneratedVideo, base_url: str, headers: Dict[str, str]) -> GeneratedVideo:
+        """
+        Poll a video job until it succeeds or fails, backing off from
+        VIDEO_POLL_INITIAL_SECONDS to VIDEO_POLL_MAX_SECONDS. On timeout the
+        job is returned still "processing" so the caller keeps its job_id.
+        """
+        if not video.job_id:
+            return video
+        
+        async def _wait() -> Dict[str, Any]:
+            delay = VIDEO_POLL_INITIAL_SECONDS
+            while True:
+                await asyncio.sleep(delay)
+                data = await self._get_job(f"{base_url}/{video.job_id}", headers)
+                status = str(data.get("status", "")).lower()
+                if status in VIDEO_JOB_SUCCEEDED or status in VIDEO_JOB_FAILED:
+                    return data
+                delay = min(delay * 1.5, VIDEO_POLL_MAX_SECONDS)
+        
+        try:
+            data = await asyncio.wait_for(_wait(), VIDEO_POLL_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            return video
+        
+        if str(data.get("status", "")).lower() in VIDEO_JOB_FAILED:
+            video.status = "failed"
+            return video
+        output = data.get("output")
+        video.url = data.get("url") or (output[0] if isinstance(output, list) and output else video.url)
+        video.status = "completed"
+        return video
+    
+    @retry_http
+    async def _get_job(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        client = self._get_client()
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+        return _loads(response.content)
     
     async def generate_video(
         self,
@@ -315,43 +450,37 @@ class MediaGenerationService:
         """
         Generate video using specified provider.
         """
-        if provider == VideoProvider.RUNWAY_ML:
-            return await self.generate_video_runway(prompt, **kwargs)
-        elif provider == VideoProvider.PIKA_LABS:
-            return await self.generate_video_pika(prompt, **kwargs)
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+        match provider:
+            case VideoProvider.RUNWAY_ML:
+                return await self.generate_video_runway(prompt, **kwargs)
+            case VideoProvider.PIKA_LABS:
+                return await self.generate_video_pika(prompt, **kwargs)
+            case _:
+                raise ValueError(f"Unknown provider: {provider}")
     
     # ═══════════════════════════════════════════════════════════════
     # UTILITY METHODS
     # ═══════════════════════════════════════════════════════════════
     
+    @retry_http
     async def download_image(self, url: str, save_path: str) -> str:
-        """Download image from URL to local path."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
+        """Download image from URL to local path, streaming chunks to disk."""
+        client = self._get_client()
+        async with client.stream("GET", url) as response:
             response.raise_for_status()
-            
-            with open(save_path, "wb") as f:
-                f.write(response.content)
-            
-            return save_path
+            return await write_stream(
+                save_path, response.aiter_bytes(DOWNLOAD_CHUNK_SIZE)
+            )
     
-    def save_base64_image(self, base64_data: str, save_path: str) -> str:
+    async def save_base64_image(self, base64_data: Union[str, bytes], save_path: str) -> str:
         """Save base64 image data to file."""
-        image_data = base64.b64decode(base64_data)
-        with open(save_path, "wb") as f:
-            f.write(image_data)
-        return save_path
+        if isinstance(base64_data, str):
+            base64_data = base64_data.encode("ascii")
+        return await write_bytes(save_path, binascii.a2b_base64(base64_data))
 
 
 # Singleton instance
-_media_service: Optional[MediaGenerationService] = None
-
-
+@lru_cache(maxsize=1)
 def get_media_service() -> MediaGenerationService:
     """Get or create media generation service singleton."""
-    global _media_service
-    if _media_service is None:
-        _media_service = MediaGenerationService()
-    return _media_service
+    return MediaGenerationService()
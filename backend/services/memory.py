@@ -13,9 +13,16 @@ Memory types:
 
 import os
 import json
+import atexit
 import sqlite3
 import logging
 import hashlib
+import threading
+import queue
+import heapq
+from array import array
+from contextlib import contextmanager
+from operator import itemgetter, mul
 from datetime import datetime, timezone
 from typing import Optional
 from dataclasses import dataclass, field
@@ -31,88 +38,393 @@ def _ensure_db_dir():
     Path(os.path.dirname(DB_PATH)).mkdir(parents=True, exist_ok=True)
 
 
-def _get_conn() -> sqlite3.Connection:
-    _ensure_db_dir()
-    conn = sqlite3.connect(DB_PATH)
+# Applied once per pooled connection
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",  # WAL keeps this durable across app crashes
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-131072",  # 128 MB; pages are only cached as they are read
+    "PRAGMA mmap_size=1073741824",  # 1 GB of address space, shared via the OS page cache
+    "PRAGMA wal_autocheckpoint=10000",  # pages (~40 MB of WAL) between checkpoints
+    "PRAGMA foreign_keys=ON",
+)
+
+# SQLite allows one writer at a time; under WAL, readers never block it
+READ_POOL_SIZE = 4
+
+# Prepared statements kept per pooled connection (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Hot-path SQL, shared so every call hits the same cached statement
+_INSERT_MESSAGE_SQL = (
+    "INSERT INTO conversations (client_id, session_id, role, content, language) VALUES (?, ?, ?, ?, ?)"
+)
+_RECENT_MESSAGES_SQL = (
+    "SELECT role, content, language, timestamp FROM conversations "
+    "WHERE client_id = ? ORDER BY timestamp DESC LIMIT ?"
+)
+_RECENT_SESSION_MESSAGES_SQL = (
+    "SELECT role, content, language, timestamp FROM conversations "
+    "WHERE client_id = ? AND session_id = ? ORDER BY timestamp DESC LIMIT ?"
+)
+_INSERT_KNOWLEDGE_SQL = (
+    "INSERT INTO knowledge (source, chunk_index, content, content_hash, category, embedding) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+# Semantic search: embedding model and hybrid rank weights
+EMBED_MODEL = os.getenv("SYNTHIA_EMBED_MODEL", "all-MiniLM-L6-v2")
+HYBRID_BM25_WEIGHT = 0.4
+HYBRID_VECTOR_WEIGHT = 0.6
+
+# sentence-transformers is imported lazily on first embed; without it (or
+# if the model fails to load), semantic_search degrades to keyword search
+_embedder = None
+_embedder_available: Optional[bool] = None
+_embedder_lock = threading.Lock()
+
+# sqlite-vec is optional — computes vector distances inside SQLite
+try:
+    import sqlite_vec
+    _sqlite_vec_available = True
+except ImportError:
+    _sqlite_vec_available = False
+
+
+def _get_embedder():
+    """The shared sentence-transformers model, or None if unavailable."""
+    global _embedder, _embedder_available
+    if _embedder_available is None:
+        with _embedder_lock:
+            if _embedder_available is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                    _embedder = SentenceTransformer(EMBED_MODEL)
+                    _embedder_available = True
+                except ImportError:
+                    _embedder_available = False
+                except Exception as e:
+                    # Installed but unusable (offline, bad SYNTHIA_EMBED_MODEL):
+                    # store knowledge without embeddings rather than failing
+                    logger.warning("Embedding model %s failed to load: %s", EMBED_MODEL, e)
+                    _embedder_available = False
+    return _embedder
+
+
+def _embed(texts: list[str]) -> Optional[list[bytes]]:
+    """Unit-length float32 embeddings as BLOBs, or None without an embedder."""
+    embedder = _get_embedder()
+    if embedder is None:
+        return None
+    vectors = embedder.encode(texts, normalize_embeddings=True)
+    return [array("f", v).tobytes() for v in vectors]
+
+
+def _open_conn(readonly: bool = False) -> sqlite3.Connection:
+    """Open a configured connection in autocommit mode."""
+    if readonly:
+        uri = Path(os.path.abspath(DB_PATH)).as_uri() + "?mode=ro"
+        conn = sqlite3.connect(
+            uri, uri=True, check_same_thread=False, isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+    else:
+        _ensure_db_dir()
+        conn = sqlite3.connect(
+            DB_PATH, check_same_thread=False, isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    if _sqlite_vec_available:
+        try:
+            conn.enable_load_extension(True)
+            sqlite_vec.load(conn)
+            conn.enable_load_extension(False)
+        except (AttributeError, sqlite3.OperationalError) as e:
+            logger.warning("sqlite-vec unavailable, scoring vectors in Python: %s", e)
     return conn
 
 
+class ReadPool:
+    """
+    Up to `size` read-only connections, opened on demand and shared across
+    threads. Nested acquires on one thread reuse the outer connection.
+    """
+
+    def __init__(self, size: int = READ_POOL_SIZE):
+        self._size = size
+        self._idle: queue.Queue = queue.Queue()
+        self._all: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._held = threading.local()
+
+    @contextmanager
+    def acquire(self):
+        held = getattr(self._held, "conn", None)
+        if held is not None:
+            yield held
+            return
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if len(self._all) < self._size:
+                    conn = _open_conn(readonly=True)
+                    self._all.append(conn)
+            if conn is None:
+                conn = self._idle.get()
+        self._held.conn = conn
+        try:
+            yield conn
+        finally:
+            self._held.conn = None
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            while self._all:
+                self._all.pop().close()
+
+
+_write_lock = threading.Lock()
+_writer_conn: Optional[sqlite3.Connection] = None
+_read_pool = ReadPool()
+
+
+@contextmanager
+def _writer():
+    """The single writer connection, held exclusively for the block."""
+    global _writer_conn
+    with _write_lock:
+        if _writer_conn is None:
+            _writer_conn = _open_conn()
+        yield _writer_conn
+
+
+def _reader():
+    """A pooled read-only connection for the block."""
+    if _writer_conn is None:
+        init_db()  # the database (and its WAL files) must exist before read-only opens
+    return _read_pool.acquire()
+
+
+@atexit.register
+def _close_pooled() -> None:
+    global _writer_conn
+    _read_pool.close()
+    with _write_lock:
+        if _writer_conn is not None:
+            _writer_conn.close()
+            _writer_conn = None
+
+
 def init_db():
     """Create all tables if they don't exist."""
-    conn = _get_conn()
-    conn.executescript("""
-        -- Clients table
-        CREATE TABLE IF NOT EXISTS clients (
-            client_id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            phone TEXT,
-            email TEXT,
-            language TEXT DEFAULT 'en',
-            niche TEXT DEFAULT '',
-            company TEXT DEFAULT '',
-            notes TEXT DEFAULT '',
-            created_at TEXT DEFAULT (datetime('now')),
-            updated_at TEXT DEFAULT (datetime('now'))
-        );
-
-        -- Conversation history (per client)
-        CREATE TABLE IF NOT EXISTS conversations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            client_id TEXT NOT NULL,
-            session_id TEXT NOT NULL,
-            role TEXT NOT NULL CHECK(role IN ('user', 'assistant', 'system')),
-            content TEXT NOT NULL,
-            language TEXT DEFAULT 'en',
-            timestamp TEXT DEFAULT (datetime('now')),
-            FOREIGN KEY (client_id) REFERENCES clients(client_id)
-        );
-
-        -- Extracted facts about clients
-        CREATE TABLE IF NOT EXISTS client_facts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            client_id TEXT NOT NULL,
-            category TEXT NOT NULL,
-            fact TEXT NOT NULL,
-            confidence REAL DEFAULT 1.0,
-            source TEXT DEFAULT 'conversation',
-            created_at TEXT DEFAULT (datetime('now')),
-            FOREIGN KEY (client_id) REFERENCES clients(client_id)
-        );
-
-        -- Knowledge base (from PDFs, training data - shared)
-        CREATE TABLE IF NOT EXISTS knowledge (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            source TEXT NOT NULL,
-            chunk_index INTEGER DEFAULT 0,
-            content TEXT NOT NULL,
-            content_hash TEXT UNIQUE,
-            category TEXT DEFAULT 'general',
-            created_at TEXT DEFAULT (datetime('now'))
-        );
-
-        -- Client-agent assignments
-        CREATE TABLE IF NOT EXISTS agent_assignments (
-            client_id TEXT PRIMARY KEY,
-            agent_name TEXT NOT NULL DEFAULT 'Synthia',
-            personality_notes TEXT DEFAULT '',
-            priority TEXT DEFAULT 'normal',
-            assigned_at TEXT DEFAULT (datetime('now')),
-            FOREIGN KEY (client_id) REFERENCES clients(client_id)
-        );
-
-        -- Indexes for fast lookups
-        CREATE INDEX IF NOT EXISTS idx_conv_client ON conversations(client_id, timestamp);
-        CREATE INDEX IF NOT EXISTS idx_facts_client ON client_facts(client_id, category);
-        CREATE INDEX IF NOT EXISTS idx_knowledge_cat ON knowledge(category);
-    """)
-    conn.commit()
-    conn.close()
+    with _writer() as conn:
+        has_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'knowledge_fts'"
+        ).fetchone()
+        has_facts_unique = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'ux_facts_client_fact'"
+        ).fetchone()
+        conn.executescript("""
+            -- Clients table
+            CREATE TABLE IF NOT EXISTS clients (
+                client_id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                phone TEXT,
+                email TEXT,
+                language TEXT DEFAULT 'en',
+                niche TEXT DEFAULT '',
+                company TEXT DEFAULT '',
+                notes TEXT DEFAULT '',
+                created_at TEXT DEFAULT (datetime('now')),
+                updated_at TEXT DEFAULT (datetime('now'))
+            );
+
+            -- Conversation history (per client)
+            CREATE TABLE IF NOT EXISTS conversations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                client_id TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                role TEXT NOT NULL CHECK(role IN ('user', 'assistant', 'system')),
+                content TEXT NOT NULL,
+                language TEXT DEFAULT 'en',
+                timestamp TEXT DEFAULT (datetime('now')),
+                FOREIGN KEY (client_id) REFERENCES clients(client_id)
+            );
+
+            -- Extracted facts about clients
+            CREATE TABLE IF NOT EXISTS client_facts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                client_id TEXT NOT NULL,
+                category TEXT NOT NULL,
+                fact TEXT NOT NULL,
+                confidence REAL DEFAULT 1.0,
+                source TEXT DEFAULT 'conversation',
+                created_at TEXT DEFAULT (datetime('now')),
+                FOREIGN KEY (client_id) REFERENCES clients(client_id)
+            );
+
+            -- Knowledge base (from PDFs, training data - shared)
+            CREATE TABLE IF NOT EXISTS knowledge (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                chunk_index INTEGER DEFAULT 0,
+                content TEXT NOT NULL,
+                content_hash TEXT UNIQUE,
+                category TEXT DEFAULT 'general',
+                created_at TEXT DEFAULT (datetime('now')),
+                embedding BLOB
+            );
+
+            -- Client-agent assignments
+            CREATE TABLE IF NOT EXISTS agent_assignments (
+                client_id TEXT PRIMARY KEY,
+                agent_name TEXT NOT NULL DEFAULT 'Synthia',
+                personality_notes TEXT DEFAULT '',
+                priority TEXT DEFAULT 'normal',
+                assigned_at TEXT DEFAULT (datetime('now')),
+                FOREIGN KEY (client_id) REFERENCES clients(client_id)
+            );
+
+            -- Indexes for fast lookups
+            CREATE INDEX IF NOT EXISTS idx_conv_client ON conversations(client_id, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_facts_client ON client_facts(client_id, category);
+            CREATE INDEX IF NOT EXISTS idx_knowledge_cat ON knowledge(category);
+            CREATE INDEX IF NOT EXISTS idx_clients_phone ON clients(phone);
+
+            -- Full-text index over knowledge, kept in sync by triggers
+            CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5(
+                content, source, category,
+                content='knowledge', content_rowid='id',
+                tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS knowledge_fts_ai AFTER INSERT ON knowledge BEGIN
+                INSERT INTO knowledge_fts(rowid, content, source, category)
+                VALUES (new.id, new.content, new.source, new.category);
+            END;
+            CREATE TRIGGER IF NOT EXISTS knowledge_fts_ad AFTER DELETE ON knowledge BEGIN
+                INSERT INTO knowledge_fts(knowledge_fts, rowid, content, source, category)
+                VALUES ('delete', old.id, old.content, old.source, old.category);
+            END;
+            CREATE TRIGGER IF NOT EXISTS knowledge_fts_au AFTER UPDATE ON knowledge BEGIN
+                INSERT INTO knowledge_fts(knowledge_fts, rowid, content, source, category)
+                VALUES ('delete', old.id, old.content, old.source, old.category);
+                INSERT INTO knowledge_fts(rowid, content, source, category)
+                VALUES (new.id, new.content, new.source, new.category);
+            END;
+        """)
+        if not has_facts_unique:
+            # Drop duplicates stored before the unique index, keeping the earliest
+            conn.execute(
+                "DELETE FROM client_facts WHERE id NOT IN "
+                "(SELECT MIN(id) FROM client_facts GROUP BY client_id, fact)"
+            )
+            conn.execute("CREATE UNIQUE INDEX ux_facts_client_fact ON client_facts(client_id, fact)")
+        if not has_fts:
+            # Index knowledge stored before the FTS table existed
+            conn.execute("INSERT INTO knowledge_fts(knowledge_fts) VALUES ('rebuild')")
+        # Phones stored before write-time normalization
+        for client_id, phone in conn.execute(
+            "SELECT client_id, phone FROM clients WHERE phone != '' AND phone NOT LIKE '+%' "
+            "OR phone LIKE '% %' OR phone LIKE '%-%'"
+        ).fetchall():
+            conn.execute("UPDATE clients SET phone = ? WHERE client_id = ?", (_normalize_phone(phone), client_id))
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(knowledge)")}
+        if "embedding" not in columns:
+            conn.execute("ALTER TABLE knowledge ADD COLUMN embedding BLOB")
     logger.info("Memory database initialized at %s", DB_PATH)
 
 
+def _content_hash(content: str) -> str:
+    """
+    Dedup key for knowledge chunks. SHA-256 stays: hashlib's OpenSSL build
+    uses SHA-NI where available, which outruns BLAKE2, and changing the
+    function would break dedup against rows already stored.
+    """
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _normalize_phone(phone: str) -> str:
+    """Canonical form for stored and looked-up phone numbers ("" stays "")."""
+    phone_clean = phone.replace(" ", "").replace("-", "")
+    if phone_clean and not phone_clean.startswith("+"):
+        phone_clean = f"+{phone_clean}"
+    return phone_clean
+
+
+def _fts_query(query: str) -> str:
+    """FTS5 MATCH expression requiring every word as a prefix ("" if no words)."""
+    # Quote each word so user text can't be parsed as FTS5 query syntax
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in query.split())
+
+
+def _existing_hashes(conn, hashes: list[str]) -> set[str]:
+    """The subset of `hashes` already stored in the knowledge table."""
+    found = set()
+    for i in range(0, len(hashes), 500):  # stay under SQLite's bound-parameter limit
+        batch = hashes[i:i + 500]
+        found.update(row[0] for row in conn.execute(
+            f"SELECT content_hash FROM knowledge WHERE content_hash IN ({','.join('?' * len(batch))})",
+            batch,
+        ))
+    return found
+
+
+def _keyword_candidates(conn, query: str, category: Optional[str], limit: int) -> dict[int, float]:
+    """Best FTS matches as {id: BM25 score scaled to 0..1 (1 = best)}."""
+    match = _fts_query(query)
+    if not match:
+        return {}
+    sql = (
+        "SELECT knowledge_fts.rowid, bm25(knowledge_fts) FROM knowledge_fts "
+        "JOIN knowledge k ON k.id = knowledge_fts.rowid WHERE knowledge_fts MATCH ?"
+    )
+    params: list = [match]
+    if category:
+        sql += " AND k.category = ?"
+        params.append(category)
+    rows = conn.execute(sql + " ORDER BY bm25(knowledge_fts) LIMIT ?", params + [limit]).fetchall()
+    if not rows:
+        return {}
+    # bm25() is lower-is-better
+    best, worst = rows[0][1], rows[-1][1]
+    span = worst - best
+    return {row[0]: (worst - row[1]) / span if span else 1.0 for row in rows}
+
+
+def _vector_candidates(conn, query_blob: bytes, category: Optional[str], limit: int) -> list[tuple]:
+    """Nearest embedded chunks as (id, cosine similarity)."""
+    where = "embedding IS NOT NULL"
+    params: list = []
+    if category:
+        where += " AND category = ?"
+        params.append(category)
+    try:
+        rows = conn.execute(
+            f"SELECT id, 1 - vec_distance_cosine(embedding, ?) AS similarity FROM knowledge "
+            f"WHERE {where} ORDER BY similarity DESC LIMIT ?",
+            [query_blob] + params + [limit]
+        ).fetchall()
+        return [(row[0], row[1]) for row in rows]
+    except sqlite3.OperationalError:
+        pass  # sqlite-vec not loaded
+
+    # Embeddings are unit length, so cosine similarity is the dot product
+    query_vec = array("f")
+    query_vec.frombytes(query_blob)
+    scored = []
+    for row_id, blob in conn.execute(f"SELECT id, embedding FROM knowledge WHERE {where}", params):
+        vec = array("f")
+        vec.frombytes(blob)
+        scored.append((row_id, sum(map(mul, query_vec, vec))))
+    return heapq.nlargest(limit, scored, key=itemgetter(1))
+
+
 class MemoryStore:
     """
     Persistent memory for Synthia. Never forgets a client.
@@ -140,50 +452,43 @@ class MemoryStore:
         company: str = "",
     ) -> None:
         """Create or update a client record."""
-        conn = _get_conn()
-        conn.execute("""
-            INSERT INTO clients (client_id, name, phone, email, language, niche, company, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
-            ON CONFLICT(client_id) DO UPDATE SET
-                name = COALESCE(NULLIF(excluded.name, ''), clients.name),
-                phone = COALESCE(NULLIF(excluded.phone, ''), clients.phone),
-                email = COALESCE(NULLIF(excluded.email, ''), clients.email),
-                language = COALESCE(NULLIF(excluded.language, ''), clients.language),
-                niche = COALESCE(NULLIF(excluded.niche, ''), clients.niche),
-                company = COALESCE(NULLIF(excluded.company, ''), clients.company),
-                updated_at = datetime('now')
-        """, (client_id, name, phone, email, language, niche, company))
-        conn.commit()
-        conn.close()
+        phone = _normalize_phone(phone)
+        with _writer() as conn:
+            conn.execute("""
+                INSERT INTO clients (client_id, name, phone, email, language, niche, company, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
+                ON CONFLICT(client_id) DO UPDATE SET
+                    name = COALESCE(NULLIF(excluded.name, ''), clients.name),
+                    phone = COALESCE(NULLIF(excluded.phone, ''), clients.phone),
+                    email = COALESCE(NULLIF(excluded.email, ''), clients.email),
+                    language = COALESCE(NULLIF(excluded.language, ''), clients.language),
+                    niche = COALESCE(NULLIF(excluded.niche, ''), clients.niche),
+                    company = COALESCE(NULLIF(excluded.company, ''), clients.company),
+                    updated_at = datetime('now')
+            """, (client_id, name, phone, email, language, niche, company))
 
     def get_client(self, client_id: str) -> Optional[dict]:
         """Get client info by ID."""
-        conn = _get_conn()
-        row = conn.execute("SELECT * FROM clients WHERE client_id = ?", (client_id,)).fetchone()
-        conn.close()
-        return dict(row) if row else None
+        with _reader() as conn:
+            row = conn.execute("SELECT * FROM clients WHERE client_id = ?", (client_id,)).fetchone()
+            return dict(row) if row else None
 
     def find_client_by_phone(self, phone: str) -> Optional[dict]:
         """Find client by phone number."""
-        # Normalize phone
-        phone_clean = phone.replace(" ", "").replace("-", "")
-        if not phone_clean.startswith("+"):
-            phone_clean = f"+{phone_clean}"
+        phone_clean = _normalize_phone(phone) or "+"
         
-        conn = _get_conn()
-        row = conn.execute(
-            "SELECT * FROM clients WHERE phone = ? OR client_id = ?",
-            (phone_clean, f"phone:{phone_clean}")
-        ).fetchone()
-        conn.close()
-        return dict(row) if row else None
+        with _reader() as conn:
+            row = conn.execute(
+                "SELECT * FROM clients WHERE phone = ? OR client_id = ?",
+                (phone_clean, f"phone:{phone_clean}")
+            ).fetchone()
+            return dict(row) if row else None
 
     def list_clients(self) -> list[dict]:
         """List all clients."""
-        conn = _get_conn()
-        rows = conn.execute("SELECT * FROM clients ORDER BY updated_at DESC").fetchall()
-        conn.close()
-        return [dict(r) for r in rows]
+        with _reader() as conn:
+            rows = conn.execute("SELECT * FROM clients ORDER BY updated_at DESC").fetchall()
+            return [dict(r) for r in rows]
 
     # ─── Conversation History ───────────────────────────────
 
@@ -196,13 +501,8 @@ class MemoryStore:
         language: str = "en",
     ) -> None:
         """Store a conversation message."""
-        conn = _get_conn()
-        conn.execute(
-            "INSERT INTO conversations (client_id, session_id, role, content, language) VALUES (?, ?, ?, ?, ?)",
-            (client_id, session_id, role, content, language)
-        )
-        conn.commit()
-        conn.close()
+        with _writer() as conn:
+            conn.execute(_INSERT_MESSAGE_SQL, (client_id, session_id, role, content, language))
 
     def get_recent_messages(
         self,
@@ -211,33 +511,25 @@ class MemoryStore:
         session_id: Optional[str] = None,
     ) -> list[dict]:
         """Get recent conversation messages for a client."""
-        conn = _get_conn()
-        if session_id:
-            rows = conn.execute(
-                "SELECT role, content, language, timestamp FROM conversations "
-                "WHERE client_id = ? AND session_id = ? ORDER BY timestamp DESC LIMIT ?",
-                (client_id, session_id, limit)
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT role, content, language, timestamp FROM conversations "
-                "WHERE client_id = ? ORDER BY timestamp DESC LIMIT ?",
-                (client_id, limit)
-            ).fetchall()
-        conn.close()
-        # Return in chronological order
-        return [dict(r) for r in reversed(rows)]
+        with _reader() as conn:
+            if session_id:
+                rows = conn.execute(
+                    _RECENT_SESSION_MESSAGES_SQL, (client_id, session_id, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(_RECENT_MESSAGES_SQL, (client_id, limit)).fetchall()
+            # Return in chronological order
+            return [dict(r) for r in reversed(rows)]
 
     def get_all_history(self, client_id: str) -> list[dict]:
         """Get full conversation history for a client."""
-        conn = _get_conn()
-        rows = conn.execute(
-            "SELECT role, content, language, session_id, timestamp FROM conversations "
-            "WHERE client_id = ? ORDER BY timestamp ASC",
-            (client_id,)
-        ).fetchall()
-        conn.close()
-        return [dict(r) for r in rows]
+        with _reader() as conn:
+            rows = conn.execute(
+                "SELECT role, content, language, session_id, timestamp FROM conversations "
+                "WHERE client_id = ? ORDER BY timestamp ASC",
+                (client_id,)
+            ).fetchall()
+            return [dict(r) for r in rows]
 
     # ─── Client Facts ───────────────────────────────────────
 
@@ -250,37 +542,30 @@ class MemoryStore:
         source: str = "conversation",
     ) -> None:
         """Store an extracted fact about a client."""
-        conn = _get_conn()
-        # Avoid duplicates
-        existing = conn.execute(
-            "SELECT id FROM client_facts WHERE client_id = ? AND fact = ?",
-            (client_id, fact)
-        ).fetchone()
-        if not existing:
+        with _writer() as conn:
+            # Duplicates are skipped by the ux_facts_client_fact index
             conn.execute(
-                "INSERT INTO client_facts (client_id, category, fact, confidence, source) VALUES (?, ?, ?, ?, ?)",
+                "INSERT OR IGNORE INTO client_facts (client_id, category, fact, confidence, source) "
+                "VALUES (?, ?, ?, ?, ?)",
                 (client_id, category, fact, confidence, source)
             )
-            conn.commit()
-        conn.close()
 
     def get_facts(self, client_id: str, category: Optional[str] = None) -> list[dict]:
         """Get facts about a client, optionally filtered by category."""
-        conn = _get_conn()
-        if category:
-            rows = conn.execute(
-                "SELECT category, fact, confidence, source FROM client_facts "
-                "WHERE client_id = ? AND category = ? ORDER BY confidence DESC",
-                (client_id, category)
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT category, fact, confidence, source FROM client_facts "
-                "WHERE client_id = ? ORDER BY category, confidence DESC",
-                (client_id,)
-            ).fetchall()
-        conn.close()
-        return [dict(r) for r in rows]
+        with _reader() as conn:
+            if category:
+                rows = conn.execute(
+                    "SELECT category, fact, confidence, source FROM client_facts "
+                    "WHERE client_id = ? AND category = ? ORDER BY confidence DESC",
+                    (client_id, category)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT category, fact, confidence, source FROM client_facts "
+                    "WHERE client_id = ? ORDER BY category, confidence DESC",
+                    (client_id,)
+                ).fetchall()
+            return [dict(r) for r in rows]
 
     # ─── Knowledge Base ─────────────────────────────────────
 
@@ -295,57 +580,138 @@ class MemoryStore:
         Add knowledge to the shared knowledge base.
         Returns True if new, False if duplicate.
         """
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        conn = _get_conn()
-        try:
-            conn.execute(
-                "INSERT INTO knowledge (source, chunk_index, content, content_hash, category) VALUES (?, ?, ?, ?, ?)",
-                (source, chunk_index, content, content_hash, category)
-            )
-            conn.commit()
-            conn.close()
-            return True
-        except sqlite3.IntegrityError:
-            conn.close()
-            return False
+        content_hash = _content_hash(content)
+        with _reader() as conn:
+            if _existing_hashes(conn, [content_hash]):
+                return False  # skip embedding a duplicate
+        embedding = (_embed([content]) or [None])[0]
+        with _writer() as conn:
+            try:
+                conn.execute(
+                    _INSERT_KNOWLEDGE_SQL,
+                    (source, chunk_index, content, content_hash, category, embedding)
+                )
+                return True
+            except sqlite3.IntegrityError:
+                return False
+
+    def add_knowledge_bulk(
+        self,
+        source: str,
+        chunks: list[str],
+        category: str = "general",
+    ) -> int:
+        """
+        Add many chunks of one source in a single transaction.
+        Returns the number of new (non-duplicate) chunks.
+        """
+        # Only embed chunks that aren't stored yet (or repeated in this batch)
+        new = {}
+        for i, chunk in enumerate(chunks):
+            new.setdefault(_content_hash(chunk), (i, chunk))
+        with _reader() as conn:
+            for content_hash in _existing_hashes(conn, list(new)):
+                del new[content_hash]
+        if not new:
+            return 0
+        embeddings = _embed([chunk for _, chunk in new.values()])
+        rows = [
+            (source, i, chunk, content_hash, category,
+             embeddings[n] if embeddings else None)
+            for n, (content_hash, (i, chunk)) in enumerate(new.items())
+        ]
+        with _writer() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.executemany(
+                    "INSERT OR IGNORE INTO knowledge (source, chunk_index, content, content_hash, category, embedding) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return cursor.rowcount
 
     def search_knowledge(self, query: str, category: Optional[str] = None, limit: int = 5) -> list[dict]:
         """
-        Simple keyword search across knowledge base.
-        For production, use vector embeddings (e.g., sentence-transformers).
+        Keyword search across knowledge base (FTS5, best BM25 match first).
+        Every query word must match, as a stemmed prefix.
+        See semantic_search for embedding-based ranking.
         """
-        conn = _get_conn()
-        # SQLite FTS-like search using LIKE
-        query_terms = query.lower().split()
-        conditions = " AND ".join(["LOWER(content) LIKE ?"] * len(query_terms))
-        params = [f"%{term}%" for term in query_terms]
+        match = _fts_query(query)
+        if not match:
+            return []
+        conditions = "knowledge_fts MATCH ?"
+        params: list = [match]
 
         if category:
-            conditions += " AND category = ?"
+            conditions += " AND k.category = ?"
             params.append(category)
 
-        rows = conn.execute(
-            f"SELECT source, content, category, chunk_index FROM knowledge "
-            f"WHERE {conditions} ORDER BY id DESC LIMIT ?",
-            params + [limit]
-        ).fetchall()
-        conn.close()
-        return [dict(r) for r in rows]
-
-    def get_all_knowledge(self, category: Optional[str] = None) -> list[dict]:
-        """Get all knowledge, optionally filtered by category."""
-        conn = _get_conn()
-        if category:
+        with _reader() as conn:
             rows = conn.execute(
-                "SELECT source, content, category FROM knowledge WHERE category = ? ORDER BY source, chunk_index",
-                (category,)
+                f"SELECT k.source, k.content, k.category, k.chunk_index "
+                f"FROM knowledge_fts JOIN knowledge k ON k.id = knowledge_fts.rowid "
+                f"WHERE {conditions} ORDER BY bm25(knowledge_fts) LIMIT ?",
+                params + [limit]
             ).fetchall()
-        else:
+            return [dict(r) for r in rows]
+
+    def semantic_search(self, query: str, category: Optional[str] = None, limit: int = 5) -> list[dict]:
+        """
+        Hybrid search: BM25 keyword rank fused with embedding cosine similarity
+        (HYBRID_BM25_WEIGHT / HYBRID_VECTOR_WEIGHT). Falls back to
+        search_knowledge when sentence-transformers isn't installed.
+        """
+        blobs = _embed([query]) if query.strip() else None
+        if not blobs:
+            return self.search_knowledge(query, category, limit)
+
+        pool = limit * 4
+        with _reader() as conn:
+            vector = dict(_vector_candidates(conn, blobs[0], category, pool))
+            keyword = _keyword_candidates(conn, query, category, pool)
+            scores = {
+                row_id: HYBRID_BM25_WEIGHT * keyword.get(row_id, 0.0)
+                + HYBRID_VECTOR_WEIGHT * vector.get(row_id, 0.0)
+                for row_id in vector.keys() | keyword.keys()
+            }
+            top = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+            if not top:
+                return []
             rows = conn.execute(
-                "SELECT source, content, category FROM knowledge ORDER BY source, chunk_index"
+                f"SELECT id, source, content, category, chunk_index FROM knowledge "
+                f"WHERE id IN ({','.join('?' * len(top))})",
+                [row_id for row_id, _ in top]
             ).fetchall()
-        conn.close()
-        return [dict(r) for r in rows]
+        by_id = {row["id"]: row for row in rows}
+        return [
+            {
+                "source": by_id[row_id]["source"],
+                "content": by_id[row_id]["content"],
+                "category": by_id[row_id]["category"],
+                "chunk_index": by_id[row_id]["chunk_index"],
+                "score": round(score, 4),
+            }
+            for row_id, score in top
+            if row_id in by_id
+        ]
+
+    def get_all_knowledge(self, category: Optional[str] = None) -> list[dict]:
+        """Get all knowledge, optionally filtered by category."""
+        with _reader() as conn:
+            if category:
+                rows = conn.execute(
+                    "SELECT source, content, category FROM knowledge WHERE category = ? ORDER BY source, chunk_index",
+                    (category,)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT source, content, category FROM knowledge ORDER BY source, chunk_index"
+                ).fetchall()
+            return [dict(r) for r in rows]
 
     # ─── Agent Assignments ──────────────────────────────────
 
@@ -357,26 +723,23 @@ class MemoryStore:
         priority: str = "normal",
     ) -> None:
         """Assign a specific agent persona to a client."""
-        conn = _get_conn()
-        conn.execute("""
-            INSERT INTO agent_assignments (client_id, agent_name, personality_notes, priority)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(client_id) DO UPDATE SET
-                agent_name = excluded.agent_name,
-                personality_notes = excluded.personality_notes,
-                priority = excluded.priority
-        """, (client_id, agent_name, personality_notes, priority))
-        conn.commit()
-        conn.close()
+        with _writer() as conn:
+            conn.execute("""
+                INSERT INTO agent_assignments (client_id, agent_name, personality_notes, priority)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(client_id) DO UPDATE SET
+                    agent_name = excluded.agent_name,
+                    personality_notes = excluded.personality_notes,
+                    priority = excluded.priority
+            """, (client_id, agent_name, personality_notes, priority))
 
     def get_agent_assignment(self, client_id: str) -> Optional[dict]:
         """Get agent assignment for a client."""
-        conn = _get_conn()
-        row = conn.execute(
-            "SELECT * FROM agent_assignments WHERE client_id = ?", (client_id,)
-        ).fetchone()
-        conn.close()
-        return dict(row) if row else None
+        with _reader() as conn:
+            row = conn.execute(
+                "SELECT * FROM agent_assignments WHERE client_id = ?", (client_id,)
+            ).fetchone()
+            return dict(row) if row else None
 
     # ─── Context Builder ────────────────────────────────────
 
@@ -385,10 +748,20 @@ class MemoryStore:
         Build a complete context string for the LLM about this client.
         Includes: client info, facts, recent history, relevant knowledge.
         """
+        # All four lookups share one pooled connection and one read snapshot
+        with _reader() as conn:
+            conn.execute("BEGIN")
+            try:
+                client = self.get_client(client_id)
+                facts = self.get_facts(client_id)
+                assignment = self.get_agent_assignment(client_id)
+                history = self.get_recent_messages(client_id, limit=max_history)
+            finally:
+                conn.execute("COMMIT")
+
         parts = []
 
         # Client info
-        client = self.get_client(client_id)
         if client:
             parts.append(f"CLIENT: {client['name']}")
             if client.get('company'):
@@ -401,19 +774,16 @@ class MemoryStore:
                 parts.append(f"  Notes: {client['notes']}")
 
         # Facts
-        facts = self.get_facts(client_id)
         if facts:
             parts.append("\nKNOWN FACTS ABOUT THIS CLIENT:")
             for f in facts[:15]:
                 parts.append(f"  [{f['category']}] {f['fact']}")
 
         # Agent assignment
-        assignment = self.get_agent_assignment(client_id)
         if assignment and assignment.get("personality_notes"):
             parts.append(f"\nAGENT NOTES: {assignment['personality_notes']}")
 
         # Recent conversation
-        history = self.get_recent_messages(client_id, limit=max_history)
         if history:
             parts.append("\nRECENT CONVERSATION HISTORY:")
             for msg in history:
@@ -425,19 +795,18 @@ class MemoryStore:
 
     def stats(self) -> dict:
         """Get memory stats."""
-        conn = _get_conn()
-        clients = conn.execute("SELECT COUNT(*) FROM clients").fetchone()[0]
-        messages = conn.execute("SELECT COUNT(*) FROM conversations").fetchone()[0]
-        facts = conn.execute("SELECT COUNT(*) FROM client_facts").fetchone()[0]
-        knowledge = conn.execute("SELECT COUNT(*) FROM knowledge").fetchone()[0]
-        conn.close()
-        return {
-            "clients": clients,
-            "messages": messages,
-            "facts": facts,
-            "knowledge_chunks": knowledge,
-            "db_path": DB_PATH,
-        }
+        with _reader() as conn:
+            clients = conn.execute("SELECT COUNT(*) FROM clients").fetchone()[0]
+            messages = conn.execute("SELECT COUNT(*) FROM conversations").fetchone()[0]
+            facts = conn.execute("SELECT COUNT(*) FROM client_facts").fetchone()[0]
+            knowledge = conn.execute("SELECT COUNT(*) FROM knowledge").fetchone()[0]
+            return {
+                "clients": clients,
+                "messages": messages,
+                "facts": facts,
+                "knowledge_chunks": knowledge,
+                "db_path": DB_PATH,
+            }
 
 
 # Singleton
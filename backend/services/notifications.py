@@ -7,6 +7,7 @@ when agent pipelines complete or fail.
 
 import os
 import json
+import asyncio
 import logging
 from typing import Optional
 
@@ -23,6 +24,8 @@ class NotificationService:
         self.telegram_api = f"https://api.telegram.org/bot{self.telegram_token}"
         self._recipients = self._load_recipients()
         self._twilio = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _load_recipients(self) -> list[dict]:
         """Load notification recipients from env."""
@@ -38,6 +41,26 @@ class NotificationService:
             self._twilio = get_twilio_service()
         return self._twilio
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        # Celery tasks run each broadcast under a fresh loop; pooled
+        # connections from an earlier loop can't be used on this one
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client_loop = loop
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (called on app shutdown)."""
+        if self._client is not None:
+            if self._client_loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+
     async def send_telegram(
         self,
         chat_id: str,
@@ -50,19 +73,19 @@ class NotificationService:
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                if media_url:
-                    resp = await client.post(
-                        f"{self.telegram_api}/sendPhoto",
-                        json={"chat_id": chat_id, "photo": media_url, "caption": message},
-                    )
-                else:
-                    resp = await client.post(
-                        f"{self.telegram_api}/sendMessage",
-                        json={"chat_id": chat_id, "text": message, "parse_mode": "Markdown"},
-                    )
-                resp.raise_for_status()
-                return True
+            client = self._get_client()
+            if media_url:
+                resp = await client.post(
+                    f"{self.telegram_api}/sendPhoto",
+                    json={"chat_id": chat_id, "photo": media_url, "caption": message},
+                )
+            else:
+                resp = await client.post(
+                    f"{self.telegram_api}/sendMessage",
+                    json={"chat_id": chat_id, "text": message, "parse_mode": "Markdown"},
+                )
+            resp.raise_for_status()
+            return True
         except Exception as e:
             logger.error("Telegram send failed: %s", e)
             return False
@@ -79,7 +102,8 @@ class NotificationService:
             if not twilio.is_available:
                 logger.warning("Twilio not available for WhatsApp")
                 return False
-            twilio.send_whatsapp(to, message, media_url)
+            # The Twilio client blocks; keep it off the event loop so broadcasts overlap
+            await asyncio.to_thread(twilio.send_whatsapp, to, message, media_url)
             return True
         except Exception as e:
             logger.error("WhatsApp send failed: %s", e)
@@ -94,8 +118,8 @@ class NotificationService:
             f"Page: {job.page_type}\n"
             f"Status: {job.status}\n"
             f"Steps completed: {len(job.results_per_step)}\n"
-            f"Started: {job.started_at}\n"
-            f"Finished: {job.completed_at}"
+            f"Started: {job.started_at_iso}\n"
+            f"Finished: {job.completed_at_iso}"
         )
         await self._broadcast(msg)
 
@@ -106,23 +130,29 @@ class NotificationService:
             f"Job: `{job.job_id}`\n"
             f"Failed at: {job.current_agent}\n"
             f"Error: {job.error}\n"
-            f"Started: {job.started_at}"
+            f"Started: {job.started_at_iso}"
         )
         await self._broadcast(msg)
 
     async def _broadcast(self, message: str) -> None:
-        """Send message to all configured recipients."""
+        """Send message to all configured recipients concurrently."""
+        sends = []
         for recipient in self._recipients:
             rtype = recipient.get("type", "")
             rid = recipient.get("id", "")
 
             if rtype == "telegram" and rid:
-                await self.send_telegram(rid, message)
+                sends.append((rid, self.send_telegram(rid, message)))
             elif rtype == "whatsapp" and rid:
-                await self.send_whatsapp(rid, message)
+                sends.append((rid, self.send_whatsapp(rid, message)))
             else:
                 logger.warning("Unknown recipient type: %s", rtype)
 
+        results = await asyncio.gather(*(send for _, send in sends), return_exceptions=True)
+        for (rid, _), result in zip(sends, results):
+            if isinstance(result, BaseException):
+                logger.error("Notification to %s failed: %s", rid, result)
+
 
 # Singleton
 _notification_service: Optional[NotificationService] = None
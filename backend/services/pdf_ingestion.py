@@ -14,172 +14,176 @@ Supports:
 import os
 import hashlib
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Union
 
 logger = logging.getLogger(__name__)
 
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract all text from a PDF file."""
-    
-    # Try PyMuPDF (fitz) first - fastest
+NO_PDF_LIBRARY = "No PDF library available. Install one: pip install PyMuPDF pdfplumber PyPDF2"
+
+
+def _probe_pdf_backend() -> Optional[tuple[str, object]]:
+    """Find the best installed PDF library, in order of speed."""
     try:
         import fitz  # PyMuPDF
-        doc = fitz.open(pdf_path)
-        pages = []
-        for page in doc:
-            pages.append(page.get_text())
-        doc.close()
-        text = "\n\n".join(pages)
-        logger.info("Extracted %d chars from %s (PyMuPDF)", len(text), pdf_path)
-        return text
+        return ("fitz", fitz)
     except ImportError:
         pass
 
-    # Try pdfplumber
     try:
         import pdfplumber
-        with pdfplumber.open(pdf_path) as pdf:
-            pages = []
-            for page in pdf.pages:
-                t = page.extract_text()
-                if t:
-                    pages.append(t)
-        text = "\n\n".join(pages)
-        logger.info("Extracted %d chars from %s (pdfplumber)", len(text), pdf_path)
-        return text
+        return ("pdfplumber", pdfplumber)
     except ImportError:
         pass
 
-    # Try PyPDF2
     try:
         from PyPDF2 import PdfReader
-        reader = PdfReader(pdf_path)
-        pages = []
-        for page in reader.pages:
-            t = page.extract_text()
-            if t:
-                pages.append(t)
-        text = "\n\n".join(pages)
-        logger.info("Extracted %d chars from %s (PyPDF2)", len(text), pdf_path)
-        return text
+        return ("PyPDF2", PdfReader)
     except ImportError:
         pass
 
-    raise RuntimeError(
-        "No PDF library available. Install one: pip install PyMuPDF pdfplumber PyPDF2"
-    )
+    return None
+
+
+# Probed once; set SYNTHIA_REQUIRE_PDF_BACKEND=1 to fail at startup instead
+# of on the first PDF (text and markdown ingestion work without one).
+_PDF_BACKEND = _probe_pdf_backend()
+if _PDF_BACKEND is None and os.getenv("SYNTHIA_REQUIRE_PDF_BACKEND", "").lower() in ("1", "true", "yes"):
+    raise RuntimeError(NO_PDF_LIBRARY)
+
+
+def iter_pdf_text(pdf_path: str) -> Iterator[str]:
+    """Yield a PDF's text one page at a time."""
+    if _PDF_BACKEND is None:
+        raise RuntimeError(NO_PDF_LIBRARY)
+
+    name, lib = _PDF_BACKEND
+    match name:
+        case "fitz":
+            doc = lib.open(pdf_path)
+            try:
+                for page in doc:
+                    yield page.get_text()
+            finally:
+                doc.close()
+        case "pdfplumber":
+            with lib.open(pdf_path) as pdf:
+                for page in pdf.pages:
+                    t = page.extract_text()
+                    if t:
+                        yield t
+        case _:
+            reader = lib(pdf_path)
+            for page in reader.pages:
+                t = page.extract_text()
+                if t:
+                    yield t
+
+
+def extract_text_from_pdf(pdf_path: str) -> str:
+    """Extract all text from a PDF file."""
+    text = "\n\n".join(iter_pdf_text(pdf_path))
+    logger.info("Extracted %d chars from %s (%s)", len(text), pdf_path, _PDF_BACKEND[0])
+    return text
 
 
 def chunk_text(
-    text: str,
+    text: Union[str, Iterable[str]],
     max_chunk_size: int = 1500,
     overlap: int = 200,
 ) -> list[str]:
     """
     Split text into overlapping chunks for knowledge storage.
     Respects paragraph boundaries where possible.
-    """
-    if not text.strip():
-        return []
 
-    # Split by double newlines (paragraphs)
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+    `text` may also be an iterable of fragments (e.g. PDF pages), which are
+    chunked as if joined with blank lines but never held in memory at once.
+    """
+    fragments = [text] if isinstance(text, str) else text
     
     chunks = []
-    current_chunk = ""
+    # Paragraphs of the current chunk; joined only when the chunk is flushed
+    buf: list[str] = []
+    size = 0  # len("\n\n".join(buf))
     
-    for para in paragraphs:
+    for para in _iter_paragraphs(fragments):
         # If adding this paragraph would exceed limit, save current and start new
-        if current_chunk and len(current_chunk) + len(para) + 2 > max_chunk_size:
-            chunks.append(current_chunk.strip())
+        if buf and size + len(para) + 2 > max_chunk_size:
+            current = "\n\n".join(buf)
+            _add_chunk(chunks, current.strip(), max_chunk_size, overlap)
             # Keep overlap from end of previous chunk
             if overlap > 0:
-                current_chunk = current_chunk[-overlap:] + "\n\n" + para
+                buf = [current[-overlap:], para]
+                size = len(buf[0]) + 2 + len(para)
             else:
-                current_chunk = para
+                buf = [para]
+                size = len(para)
         else:
-            current_chunk = (current_chunk + "\n\n" + para).strip()
-    
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
+            if buf:
+                size += 2
+                if buf[0][:1].isspace():
+                    # An overlap tail may start mid-whitespace; trim it as the chunk grows
+                    size -= len(buf[0]) - len(buf[0].lstrip())
+                    buf[0] = buf[0].lstrip()
+            buf.append(para)
+            size += len(para)
     
-    # Handle case where single paragraphs are very long
-    final_chunks = []
-    for chunk in chunks:
-        if len(chunk) > max_chunk_size * 2:
-            # Force split long chunks
-            for i in range(0, len(chunk), max_chunk_size):
-                sub = chunk[i:i + max_chunk_size + overlap]
-                if sub.strip():
-                    final_chunks.append(sub.strip())
-        else:
-            final_chunks.append(chunk)
+    if buf:
+        current = "\n\n".join(buf).strip()
+        if current:
+            _add_chunk(chunks, current, max_chunk_size, overlap)
     
-    return final_chunks
+    return chunks
 
 
-def ingest_pdf(
-    pdf_path: str,
-    category: str = "training",
-    memory_store=None,
-) -> dict:
-    """
-    Full pipeline: Extract text from PDF → chunk → store in memory.
-    
-    Returns:
-        {"source": filename, "chunks": N, "new_chunks": N, "total_chars": N}
-    """
-    if memory_store is None:
-        from services.memory import get_memory_store
-        memory_store = get_memory_store()
+def _iter_paragraphs(fragments: Iterable[str]) -> Iterator[str]:
+    """Yield the stripped, non-empty paragraphs of the blank-line-joined fragments."""
+    carry = None
+    for fragment in fragments:
+        # Only the unfinished last paragraph is carried into the next fragment
+        parts = (fragment if carry is None else carry + "\n\n" + fragment).split("\n\n")
+        carry = parts.pop()
+        for part in parts:
+            if part.strip():
+                yield part.strip()
+    if carry is not None and carry.strip():
+        yield carry.strip()
 
-    filename = os.path.basename(pdf_path)
-    logger.info("Ingesting PDF: %s (category: %s)", filename, category)
 
-    # Extract text
-    text = extract_text_from_pdf(pdf_path)
-    if not text.strip():
-        return {"source": filename, "chunks": 0, "new_chunks": 0, "total_chars": 0}
+def _add_chunk(chunks: list[str], chunk: str, max_chunk_size: int, overlap: int) -> None:
+    """Append a chunk, force-splitting very long ones (single huge paragraphs)."""
+    if len(chunk) > max_chunk_size * 2:
+        for i in range(0, len(chunk), max_chunk_size):
+            sub = chunk[i:i + max_chunk_size + overlap]
+            if sub.strip():
+                chunks.append(sub.strip())
+    else:
+        chunks.append(chunk)
 
-    # Chunk
-    chunks = chunk_text(text)
-    
-    # Store chunks
-    new_count = 0
-    for i, chunk in enumerate(chunks):
-        is_new = memory_store.add_knowledge(
-            source=filename,
-            content=chunk,
-            category=category,
-            chunk_index=i,
-        )
-        if is_new:
-            new_count += 1
-
-    result = {
-        "source": filename,
-        "chunks": len(chunks),
-        "new_chunks": new_count,
-        "total_chars": len(text),
-    }
-    logger.info("PDF ingestion complete: %s", result)
-    return result
 
+def _pdf_chunks(pdf_path: str) -> tuple[list[str], int]:
+    """Extract and chunk a PDF page by page. Returns (chunks, total_chars)."""
+    pages = 0
+    chars = 0
 
-def ingest_text_file(
-    file_path: str,
-    category: str = "training",
-    memory_store=None,
-) -> dict:
-    """Ingest a plain text, markdown, or JSONL file into knowledge base."""
-    if memory_store is None:
-        from services.memory import get_memory_store
-        memory_store = get_memory_store()
+    def counted(fragments: Iterable[str]) -> Iterator[str]:
+        nonlocal pages, chars
+        for fragment in fragments:
+            pages += 1
+            chars += len(fragment)
+            yield fragment
 
-    filename = os.path.basename(file_path)
-    
+    chunks = chunk_text(counted(iter_pdf_text(pdf_path)))
+    if not chunks:
+        return [], 0
+    # Same count as the joined document, blank-line separators included
+    return chunks, chars + 2 * (pages - 1)
+
+
+def _text_file_chunks(file_path: str) -> tuple[list[str], int]:
+    """Read and chunk a text, markdown, or JSONL file. Returns (chunks, total_chars)."""
     with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
         text = f.read()
 
@@ -199,47 +203,95 @@ def ingest_text_file(
                 continue
         text = "\n\n".join(combined)
 
-    chunks = chunk_text(text)
-    new_count = 0
-    for i, chunk in enumerate(chunks):
-        is_new = memory_store.add_knowledge(
-            source=filename, content=chunk, category=category, chunk_index=i
-        )
-        if is_new:
-            new_count += 1
+    return chunk_text(text), len(text)
+
+
+def _file_chunks(file_path: str) -> tuple[list[str], int]:
+    """Chunk any supported file (runs in ingest_directory's worker processes)."""
+    if file_path.lower().endswith(".pdf"):
+        return _pdf_chunks(file_path)
+    return _text_file_chunks(file_path)
+
 
+def _store_chunks(file_path: str, chunks: list[str], total_chars: int, category: str, memory_store) -> dict:
+    """Store one file's chunks in a single transaction and summarize."""
+    if memory_store is None:
+        from services.memory import get_memory_store
+        memory_store = get_memory_store()
+
+    filename = os.path.basename(file_path)
     return {
         "source": filename,
         "chunks": len(chunks),
-        "new_chunks": new_count,
-        "total_chars": len(text),
+        "new_chunks": memory_store.add_knowledge_bulk(filename, chunks, category=category),
+        "total_chars": total_chars,
     }
 
 
+def ingest_pdf(
+    pdf_path: str,
+    category: str = "training",
+    memory_store=None,
+) -> dict:
+    """
+    Full pipeline: Extract text from PDF → chunk → store in memory.
+    
+    Returns:
+        {"source": filename, "chunks": N, "new_chunks": N, "total_chars": N}
+    """
+    logger.info("Ingesting PDF: %s (category: %s)", os.path.basename(pdf_path), category)
+
+    chunks, total_chars = _pdf_chunks(pdf_path)
+    result = _store_chunks(pdf_path, chunks, total_chars, category, memory_store)
+    logger.info("PDF ingestion complete: %s", result)
+    return result
+
+
+def ingest_text_file(
+    file_path: str,
+    category: str = "training",
+    memory_store=None,
+) -> dict:
+    """Ingest a plain text, markdown, or JSONL file into knowledge base."""
+    chunks, total_chars = _text_file_chunks(file_path)
+    return _store_chunks(file_path, chunks, total_chars, category, memory_store)
+
+
 def ingest_directory(
     dir_path: str,
     category: str = "training",
     extensions: tuple = (".pdf", ".txt", ".md", ".jsonl"),
+    max_workers: Optional[int] = None,
 ) -> list[dict]:
-    """Ingest all supported files from a directory."""
-    results = []
+    """
+    Ingest all supported files from a directory.
+    Files are extracted and chunked in parallel worker processes; all
+    writes happen here, since SQLite has a single writer.
+    """
+    paths = []
     for root, _, files in os.walk(dir_path):
         for filename in sorted(files):
             if any(filename.lower().endswith(ext) for ext in extensions):
-                filepath = os.path.join(root, filename)
-                try:
-                    if filename.lower().endswith(".pdf"):
-                        result = ingest_pdf(filepath, category)
-                    else:
-                        result = ingest_text_file(filepath, category)
-                    results.append(result)
-                except Exception as e:
-                    logger.error("Failed to ingest %s: %s", filepath, e)
-                    results.append({"source": filename, "error": str(e)})
+                paths.append(os.path.join(root, filename))
+    if not paths:
+        return []
+
+    results = []
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_file_chunks, path) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                chunks, total_chars = future.result()
+                results.append(_store_chunks(path, chunks, total_chars, category, None))
+            except Exception as e:
+                logger.error("Failed to ingest %s: %s", path, e)
+                results.append({"source": os.path.basename(path), "error": str(e)})
     return results
 
 
 __all__ = [
+    "iter_pdf_text",
     "extract_text_from_pdf",
     "chunk_text", 
     "ingest_pdf",
@@ -0,0 +1,71 @@
+"""
+Synthia Retry Helpers - The Pauli Effect
+
+Exponential backoff for outbound provider HTTP calls. Honors the
+`Retry-After` header on 429/503 responses, otherwise backs off
+1s, 2s, 4s ... (with jitter) up to a cap.
+
+Only failures where retrying is safe are retried: rate limits, 5xx
+responses, and transport errors raised before the request was sent.
+A read timeout on a generation POST is not retried, since the provider
+may already be doing (and billing) the work.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 6
+INITIAL_DELAY_SECONDS = 1.0
+MAX_DELAY_SECONDS = 60.0
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+RETRYABLE_TRANSPORT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS
+    return isinstance(exc, RETRYABLE_TRANSPORT_ERRORS)
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    """Seconds requested by the server's Retry-After header, if any."""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    value = exc.response.headers.get("Retry-After")
+    try:
+        return min(float(value), MAX_DELAY_SECONDS) if value else None
+    except ValueError:
+        return None  # HTTP-date form; fall back to exponential backoff
+
+
+def retry_http(fn):
+    """Retry an async provider call on rate limits and transient failures."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as exc:
+                if attempt == MAX_ATTEMPTS or not _is_retryable(exc):
+                    raise
+                delay = _retry_after(exc)
+                if delay is None:
+                    backoff = min(MAX_DELAY_SECONDS, INITIAL_DELAY_SECONDS * 2 ** (attempt - 1))
+                    delay = backoff * random.uniform(0.5, 1.0)
+                reason = (exc.response.status_code if isinstance(exc, httpx.HTTPStatusError)
+                          else type(exc).__name__)
+                logger.warning(
+                    "%s failed (%s), retry %d/%d in %.1fs",
+                    fn.__qualname__, reason, attempt, MAX_ATTEMPTS - 1, delay,
+                )
+                await asyncio.sleep(delay)
+
+    return wrapper
@@ -25,6 +25,7 @@ from enum import Enum
 
 from services.audio_utils import (
     AudioBuffer,
+    Upsampler8kTo16k,
     mulaw_to_wav_16k,
     mp3_to_mulaw,
     split_mulaw_for_twilio,
@@ -159,6 +160,7 @@ class VoiceCallManager:
         self._reasoning_engine = None
         self._memory = None
         self._audio_buffer: Optional[AudioBuffer] = None
+        self._upsampler = Upsampler8kTo16k()
 
         # Playback state
         self._is_playing = False
@@ -302,7 +304,7 @@ class VoiceCallManager:
 
     # ─── Core Call Flow ──────────────────────────────────────
 
-    async def on_connect(self) -> list[bytes]:
+    async def on_connect(self) -> list[memoryview]:
         """
         Handle call connection.
         Identifies caller, loads memory, synthesizes personalized greeting.
@@ -354,8 +356,8 @@ class VoiceCallManager:
             from services.voice import LanguageCode
             lang_map = {"en": LanguageCode.ENGLISH, "es": LanguageCode.SPANISH, "hi": LanguageCode.HINDI}
             mp3_audio = await vs.synthesize(greeting, language=lang_map.get(lang_code))
-            mulaw_audio = mp3_to_mulaw(mp3_audio)
-            chunks = split_mulaw_for_twilio(mulaw_audio)
+            mulaw_audio = await mp3_to_mulaw(mp3_audio)
+            chunks = list(split_mulaw_for_twilio(mulaw_audio))
             self.state = CallState.DISCUSSING
             self._is_playing = True
             logger.info("Greeting synthesized: %d chunks (%s, lang=%s)",
@@ -366,7 +368,7 @@ class VoiceCallManager:
             self.state = CallState.DISCUSSING
             return []
 
-    async def on_mulaw_chunk(self, mulaw_chunk: bytes) -> Optional[list[bytes]]:
+    async def on_mulaw_chunk(self, mulaw_chunk: bytes) -> Optional[list[memoryview]]:
         """
         Process a single 20ms mulaw chunk from Twilio.
         AudioBuffer accumulates chunks. VAD detects end of utterance.
@@ -383,7 +385,7 @@ class VoiceCallManager:
 
         return await self._process_utterance(complete_utterance)
 
-    async def _process_utterance(self, mulaw_audio: bytes) -> list[bytes]:
+    async def _process_utterance(self, mulaw_audio: bytes) -> list[memoryview]:
         """
         Full autonomous pipeline for a complete utterance:
         mulaw → WAV/16k → Whisper STT → Claude reasoning → ElevenLabs TTS → mulaw
@@ -394,7 +396,7 @@ class VoiceCallManager:
 
         # ── 1. Speech-to-Text ──────────────────────────────
         try:
-            wav_audio = mulaw_to_wav_16k(mulaw_audio)
+            wav_audio = mulaw_to_wav_16k(mulaw_audio, self._upsampler)
             user_text = await vs.transcribe(wav_audio)
         except Exception as e:
             logger.error("STT failed: %s", e)
@@ -467,8 +469,8 @@ class VoiceCallManager:
             lang_map = {"en": LanguageCode.ENGLISH, "es": LanguageCode.SPANISH, "hi": LanguageCode.HINDI}
             tts_lang = lang_map.get(detected_lang, LanguageCode.ENGLISH)
             mp3_audio = await vs.synthesize(assistant_text, language=tts_lang)
-            mulaw_response = mp3_to_mulaw(mp3_audio)
-            chunks = split_mulaw_for_twilio(mulaw_response)
+            mulaw_response = await mp3_to_mulaw(mp3_audio)
+            chunks = list(split_mulaw_for_twilio(mulaw_response))
             self._is_playing = True
             self._mark_counter += 1
             return chunks
@@ -220,7 +220,7 @@ async def twilio_media_stream(websocket: WebSocket):
 
     from services.voice_call import VoiceCallManager
     from services.audio_utils import (
-        create_media_message,
+        create_media_message_json,
         create_mark_message,
         create_clear_message,
     )
@@ -253,8 +253,7 @@ async def twilio_media_stream(websocket: WebSocket):
                 # Send greeting audio
                 greeting_chunks = await manager.on_connect()
                 for chunk in greeting_chunks:
-                    msg = create_media_message(stream_sid, chunk)
-                    await websocket.send_json(msg)
+                    await websocket.send_text(create_media_message_json(stream_sid, chunk))
 
                 # Mark end of greeting so we know when playback finishes
                 if greeting_chunks:
@@ -275,8 +274,7 @@ async def twilio_media_stream(websocket: WebSocket):
 
                     # Send all response chunks
                     for chunk in response_chunks:
-                        msg = create_media_message(stream_sid, chunk)
-                        await websocket.send_json(msg)
+                        await websocket.send_text(create_media_message_json(stream_sid, chunk))
 
                     # Send mark to track end of response playback
                     manager._mark_counter += 0  # counter already incremented in _process_utterance
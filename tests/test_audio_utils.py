@@ -3,17 +3,23 @@ Unit tests for Audio Utilities
 Tests μ-law codec, resampling, and Twilio audio pipeline
 """
 
+import io
 import os
+import json
+import base64
 import sys
+import wave
 import struct
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
+import services.audio_utils as audio_utils
 from services.audio_utils import (
     mulaw_encode, mulaw_decode, resample_8k_to_16k, resample_16k_to_8k,
     pcm_to_wav, mulaw_to_wav_16k, AudioBuffer, split_mulaw_for_twilio,
-    create_media_message, create_mark_message, create_clear_message
+    create_media_message, create_media_message_json, create_mark_message,
+    create_clear_message
 )
 
 
@@ -35,6 +41,30 @@ def test_mulaw_codec():
     print(f"✅ μ-law decoding: {len(mulaw_bytes)} bytes μ-law → {len(decoded_pcm)} bytes PCM")
 
 
+def test_mulaw_table_fallback():
+    """Test the table-driven μ-law codec used when audioop is unavailable"""
+
+    all_codes = bytes(range(256))
+    pcm_bytes = struct.pack("<6h", 0, 1000, -1000, 12345, 32767, -32768)
+    saved = audio_utils.audioop
+    try:
+        audio_utils.audioop = None
+        decoded = mulaw_decode(all_codes)
+        encoded = mulaw_encode(pcm_bytes)
+        wav_bytes = mulaw_to_wav_16k(all_codes)
+    finally:
+        audio_utils.audioop = saved
+
+    expected = struct.pack("<256h", *audio_utils._MULAW_DECODE_TABLE)
+    assert decoded == expected, "Table decode should match the G.711 decode table"
+    assert len(encoded) == 6, "μ-law should be 1 byte per sample"
+    samples = struct.unpack("<6h", pcm_bytes)
+    assert encoded == bytes(audio_utils._mulaw_encode_sample(x) for x in samples)
+    assert wav_bytes[:4] == b"RIFF", "Output should be WAV"
+    assert len(wav_bytes) == 44 + 4 * len(all_codes), "16kHz output should have 2 samples per code"
+    print(f"✅ μ-law table fallback: {len(all_codes)} codes decoded, {len(encoded)} samples encoded")
+
+
 def test_resample_8k_to_16k():
     """Test 8kHz → 16kHz upsampling"""
 
@@ -79,6 +109,13 @@ def test_pcm_to_wav():
 
     # WAV should start with "RIFF"
     assert wav_bytes[:4] == b"RIFF", "WAV should start with RIFF header"
+
+    # Header should be readable by the stdlib wave module
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        assert wf.getframerate() == 16000
+        assert wf.getnchannels() == 1
+        assert wf.getsampwidth() == 2
+        assert wf.readframes(wf.getnframes()) == pcm_bytes
     print(f"✅ PCM→WAV conversion: {len(pcm_bytes)} bytes PCM → {len(wav_bytes)} bytes WAV")
 
 
@@ -112,6 +149,23 @@ def test_audio_buffer():
     print(f"✅ AudioBuffer: Processed chunks, duration={buffer.duration_seconds:.2f}s")
 
 
+def test_audio_buffer_end_of_utterance():
+    """Test AudioBuffer flushes after ~300ms of silence following speech"""
+
+    buffer = AudioBuffer(min_bytes=1600, max_bytes=64000)
+    speech = mulaw_encode(struct.pack("<160h", *([8000, -8000] * 80)))
+    silence = b'\xff' * 160  # μ-law code for linear zero
+
+    results = [buffer.add_chunk(speech) for _ in range(20)]
+    assert not any(results), "Should keep buffering during speech"
+
+    results = [buffer.add_chunk(silence) for _ in range(15)]
+    assert results[-1] is not None, "Should flush after 300ms of silence"
+    assert len(results[-1]) == 35 * 160, "Flushed audio should contain every chunk"
+    assert buffer.duration_seconds == 0, "Buffer should be empty after flush"
+    print(f"✅ AudioBuffer end of utterance: flushed {len(results[-1])} bytes")
+
+
 def test_twilio_message_format():
     """Test Twilio Media Stream message format"""
 
@@ -123,6 +177,10 @@ def test_twilio_message_format():
     assert msg["event"] == "media"
     assert msg["streamSid"] == stream_sid
     assert "payload" in msg["media"]
+    assert base64.b64decode(msg["media"]["payload"]) == mulaw_payload
+    view_msg = create_media_message(stream_sid, memoryview(mulaw_payload)[1:3])
+    assert base64.b64decode(view_msg["media"]["payload"]) == mulaw_payload[1:3]
+    assert json.loads(create_media_message_json(stream_sid, mulaw_payload)) == msg
     print(f"✅ Media message format OK")
 
     # Test mark message
@@ -144,7 +202,7 @@ def test_chunk_splitter():
     mulaw_data = b'\x00' * 16000
 
     # Split into 80ms chunks (640 bytes)
-    chunks = split_mulaw_for_twilio(mulaw_data, chunk_size=640)
+    chunks = list(split_mulaw_for_twilio(mulaw_data, chunk_size=640))
 
     assert len(chunks) == 25, f"Should have 25 chunks (16000/640), got {len(chunks)}"
     assert all(len(c) == 640 for c in chunks), "All chunks should be 640 bytes"
@@ -154,11 +212,13 @@ def test_chunk_splitter():
 if __name__ == "__main__":
     print("\n🧪 Testing Audio Utilities...\n")
     test_mulaw_codec()
+    test_mulaw_table_fallback()
     test_resample_8k_to_16k()
     test_resample_16k_to_8k()
     test_pcm_to_wav()
     test_full_pipeline()
     test_audio_buffer()
+    test_audio_buffer_end_of_utterance()
     test_twilio_message_format()
     test_chunk_splitter()
     print("\n✅ All audio tests passed!\n")
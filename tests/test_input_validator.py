@@ -0,0 +1,28 @@
+"""
+Unit tests for Input Validator
+Tests text sanitization
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from security.input_validator import InputValidator
+
+
+def test_sanitize_whitespace_controls_become_spaces():
+    """Tabs, CRs and other whitespace controls separate words"""
+    validator = InputValidator()
+
+    assert validator.validate_text("hello\tworld")[1] == "hello world"
+    assert validator.validate_text("hello\r\nworld")[1] == "hello world"
+    assert validator.validate_text("a\x0bb\x1cc")[1] == "a b c"
+
+
+def test_sanitize_strips_other_controls():
+    """Null bytes and non-whitespace controls are removed"""
+    validator = InputValidator()
+
+    assert validator.validate_text("he\x00llo\x07 <b>")[1] == "hello &lt;b&gt;"